@@ -4,17 +4,317 @@ Assumption Validator for Project
 
 This script validates project assumptions and hypotheses.
 Customize the validation methods for your specific project needs.
+
+Checks are declared as probes in PROBES and run concurrently on a thread pool.
+Path probes are answered from validation-cache.json while the directory that
+holds the path is unchanged (same mtime), so a repeated validation costs one
+stat per directory instead of one per probe.
 """
 
+import os
+import re
 import sys
 import json
+import time
 import subprocess
 import argparse
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+CONTEXT_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = CONTEXT_DIR.parent
+CACHE_FILE = Path(__file__).resolve().parent / "validation-cache.json"
+CACHE_VERSION = 1
+DEFAULT_WORKERS = 16
+
+# Deep scan (--deep): one parallel streaming pass over the vault
+DEFAULT_VAULT_PATH = PROJECT_ROOT.parent
+DEEP_SCAN_FILE = Path(__file__).resolve().parent / "vault-scan-results.json"
+DEEP_SCAN_HISTORY_FILE = Path(__file__).resolve().parent / "vault-scan-history.jsonl"
+SKIPPED_DIRECTORIES = {".obsidian", ".git", ".trash", "node_modules", "__pycache__"}
+DEFAULT_MAX_DAILY_LINES = 1000
+DEFAULT_MAX_DATE_MARKERS = 100
+TOP_OUTLIERS = 10
+
+DAILY_NOTE_NAME_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})\.md$')
+YEAR_DIRECTORY_PATTERN = re.compile(r'^\d{4}$')
+
+# The deep scan counts blocks with the Engine's own note parser, or asks the Engine daemon when it is running
+sys.path.insert(0, str(PROJECT_ROOT))
+from instrumentation import add_profile_argument, phase, start_profiling
+from vault.blocks import BLOCK_TYPES
+from vault.daemon import request_daemon
+from vault.state import stream_note_stats
+
+class Probe:
+    """A registered validation check; run() returns (passed, details)."""
+
+    def __init__(self, name, group, check=None, path=None, kind="dir", found=None, missing=None, parent=None,
+                 required=False):
+        self.name = name
+        self.group = group
+        self.check = check
+        self.path = path
+        self.kind = kind
+        self.found = found
+        self.missing = missing
+        # Probes are skipped (not recorded) when their parent probe failed
+        self.parent = parent
+        # A failed required probe makes the whole validation fail
+        self.required = required
+
+    def run(self):
+        if self.check:
+            return self.check()
+        exists = self.path.is_dir() if self.kind == "dir" else self.path.is_file()
+        return exists, self.found if exists else self.missing
+
+    def cache_directory(self):
+        """Directory whose listing decides this probe's answer (None for non-path probes)."""
+        return self.path.parent if self.path is not None else None
+
+def check_python_version():
+    python_version = sys.version_info
+    if python_version.major >= 3 and python_version.minor >= 7:
+        return True, f"Python {python_version.major}.{python_version.minor}"
+    return False, f"Python version too old: {python_version}"
+
+PROBES = []
+
+def register_probe(*args, **kwargs):
+    """Add a probe to the registry; probes run and are reported in registration order."""
+    probe = Probe(*args, **kwargs)
+    PROBES.append(probe)
+    return probe
+
+# Environment (health check)
+register_probe("python_version", "environment", check=check_python_version)
+for dir_name in ["static", "evolving", "dynamic", "archive"]:
+    register_probe(f"directory_{dir_name}", "environment", path=CONTEXT_DIR / dir_name,
+                   found=f"Directory exists: {dir_name}", missing=f"Missing directory: {dir_name}")
+
+# Scripts directory and JavaScript components
+register_probe("scripts_directory", "project", path=PROJECT_ROOT / "Scripts",
+               found="Scripts directory exists", missing="Scripts directory not found", required=True)
+for script in [
+    "dailyNoteComposer.js",
+    "activityComposer.js",
+    "components/noteBlocksParser.js",
+    "components/todoRollover.js",
+    "components/mentionsProcessor.js",
+    "components/activitiesInProgress.js",
+    "utilities/fileIO.js"
+]:
+    register_probe(f"script_{script.replace('/', '_').replace('.js', '')}", "project",
+                   path=PROJECT_ROOT / "Scripts" / script, kind="file",
+                   found=f"Found {script}", missing=f"Missing {script}", parent="scripts_directory")
+
+# Templates directory
+register_probe("templates_directory", "project", path=PROJECT_ROOT / "Templates",
+               found="Templates directory exists", missing="Templates directory not found", required=True)
+for template in ["DailyNote-template.md", "Activity-template.md"]:
+    register_probe(f"template_{template.replace('-', '_').replace('.md', '')}", "project",
+                   path=PROJECT_ROOT / "Templates" / template, kind="file",
+                   found=f"Found {template}", missing=f"Missing {template}", parent="templates_directory")
+
+# TestSuite directory
+register_probe("test_suite_directory", "project", path=PROJECT_ROOT / "TestSuite",
+               found="TestSuite directory exists", missing="TestSuite directory not found", required=True)
+for category in ["Core", "Features", "Integration", "Samples"]:
+    register_probe(f"test_category_{category.lower()}", "project", path=PROJECT_ROOT / "TestSuite" / category,
+                   found=f"Found {category} tests", missing=f"Missing {category} tests", parent="test_suite_directory")
+
+# Obsidian vault structure
+register_probe("knowledge_directory", "project", path=PROJECT_ROOT / "knowledge",
+               found="Knowledge directory exists", missing="Knowledge directory not found")
+register_probe("minds_vault_submodule", "project", path=PROJECT_ROOT / "minds-vault",
+               found="minds-vault submodule exists", missing="minds-vault submodule not found")
+for readme in ["README.md", "README_journal_backup.md", "README_PDF_CONVERTER.md"]:
+    register_probe(f"readme_{readme.replace('.md', '').lower()}", "project", path=PROJECT_ROOT / readme, kind="file",
+                   found=f"Found {readme}", missing=f"Missing {readme}")
+
+def scan_markdown_file(path):
+    """Stream one markdown file through the block parser's rules and return its size and structure counters."""
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='\n') as f:
+        return {"bytes": os.fstat(f.fileno()).st_size, **stream_note_stats(f)}
+
+def journal_layout_issue(relative_path):
+    """Return why a file under Journal/ breaks the YYYY/MM.Month/YYYY-MM-DD.md layout, or None."""
+    parts = relative_path.parts
+    name_match = DAILY_NOTE_NAME_PATTERN.match(parts[-1])
+    if not name_match:
+        return None  # Only daily notes are placed by date
+    year, month, day = name_match.groups()
+    try:
+        expected_month = datetime(int(year), int(month), int(day)).strftime('%m.%B')
+    except ValueError:
+        return f"invalid date {parts[-1][:-3]}"
+    if parts[1:-1] != (year, expected_month):
+        return f"expected Journal/{year}/{expected_month}/"
+    return None
+
+class VaultScanner:
+    """Walks the vault once and collects size and structure outliers in parallel."""
+
+    def __init__(self, vault_path, workers=DEFAULT_WORKERS, max_daily_lines=DEFAULT_MAX_DAILY_LINES,
+                 max_date_markers=DEFAULT_MAX_DATE_MARKERS, use_daemon=True):
+        self.vault_path = Path(vault_path).resolve()
+        self.workers = workers
+        self.use_daemon = use_daemon
+        self.served_by_daemon = False
+        self.max_daily_lines = max_daily_lines
+        self.max_date_markers = max_date_markers
+
+    def iter_markdown_files(self, folder_issues):
+        """Yield vault markdown files, noting Journal folders outside the YYYY/MM.Month layout."""
+        journal_path = self.vault_path / "Journal"
+        for root, dirs, files in os.walk(self.vault_path):
+            root_path = Path(root)
+            dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRECTORIES and not d.startswith('.')
+                             and root_path / d != PROJECT_ROOT)
+            if root_path == journal_path or root_path.parent == journal_path:
+                for directory in dirs:
+                    if not self.is_journal_folder(root_path, directory):
+                        folder_issues.append(str((root_path / directory).relative_to(self.vault_path)))
+            for name in files:
+                if name.endswith('.md'):
+                    yield root_path / name
+
+    def is_journal_folder(self, parent, directory):
+        if parent.name == "Journal":
+            return bool(YEAR_DIRECTORY_PATTERN.match(directory))
+        try:
+            return directory == datetime(int(parent.name), int(directory.partition('.')[0]), 1).strftime('%m.%B')
+        except ValueError:
+            return False
+
+    def scan(self):
+        """Scan the vault and return the report dictionary."""
+        start_time = time.perf_counter()
+        folder_issues = []
+        with phase("list notes"):
+            paths = list(self.iter_markdown_files(folder_issues))
+
+        with phase("scan notes", files=len(paths)):
+            stats = self.scan_files(paths)
+        elapsed = time.perf_counter() - start_time
+
+        daily_notes = {}
+        activities = {}
+        other_bytes = 0
+        misplaced_notes = []
+        unreadable = []
+        for path, file_stats in zip(paths, stats):
+            relative_path = path.relative_to(self.vault_path)
+            if file_stats is None:
+                unreadable.append(str(relative_path))
+                continue
+            file_stats["path"] = str(relative_path)
+            top_folder = relative_path.parts[0] if len(relative_path.parts) > 1 else ""
+            if top_folder == "Journal" and DAILY_NOTE_NAME_PATTERN.match(path.name):
+                daily_notes[path.stem] = file_stats
+                issue = journal_layout_issue(relative_path)
+                if issue:
+                    misplaced_notes.append({"path": str(relative_path), "issue": issue})
+            elif top_folder == "Activities":
+                activities[str(relative_path.with_suffix(''))[len("Activities/"):]] = file_stats
+            else:
+                other_bytes += file_stats["bytes"]
+
+        broken_links = {}
+        for file_stats in stats:
+            for target in file_stats["activity_links"] if file_stats else []:
+                if target.strip() not in activities:
+                    broken_links.setdefault(target.strip(), set()).add(file_stats["path"])
+
+        total_bytes = sum(s["bytes"] for s in stats if s)
+        # Counters served from memory say nothing about read speed, so no seconds are estimated from them
+        throughput = total_bytes / elapsed if elapsed > 0 and not self.served_by_daemon else 0
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "vault_path": str(self.vault_path),
+            "duration_ms": round(elapsed * 1000, 1),
+            "totals": {
+                "markdown_files": len(paths),
+                "daily_notes": len(daily_notes),
+                "activities": len(activities),
+                "bytes": total_bytes,
+                "other_bytes": other_bytes,
+                "todos": sum(s["todos"] for s in stats if s),
+                "blocks": {block_type: sum(s["blocks"][block_type] for s in stats if s)
+                           for block_type in BLOCK_TYPES}
+            },
+            "thresholds": {"max_daily_lines": self.max_daily_lines, "max_date_markers": self.max_date_markers},
+            "large_daily_notes": self.outliers(daily_notes.values(), "lines", self.max_daily_lines),
+            "activities_with_many_date_markers": self.outliers(activities.values(), "date_markers",
+                                                               self.max_date_markers),
+            "largest_files": [{"path": s["path"], "bytes": s["bytes"], "lines": s["lines"]}
+                              for s in sorted((s for s in stats if s), key=lambda s: s["bytes"],
+                                              reverse=True)[:TOP_OUTLIERS]],
+            "broken_activity_links": [{"target": target, "linked_from": sorted(sources)}
+                                      for target, sources in sorted(broken_links.items())],
+            "journal_folder_issues": sorted(folder_issues),
+            "misplaced_daily_notes": misplaced_notes,
+            "unreadable_files": unreadable,
+            "estimated_cost": self.estimate_cost(daily_notes, activities, throughput)
+        }
+
+    def scan_files(self, paths):
+        """Counters of each file, from the Engine daemon when it serves the vault (None for unreadable files)."""
+        served = request_daemon(self.vault_path, "note_stats") if self.use_daemon else None
+        self.served_by_daemon = served is not None
+        if served is None:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                return list(pool.map(self.scan_file, paths))
+        print(f"🛰️  Engine daemon: counters of {len(served)} notes")
+        # Files the daemon could not read are tried here, so they are reported as unreadable
+        return [served.get(path.relative_to(self.vault_path).as_posix()) or self.scan_file(path) for path in paths]
+
+    def scan_file(self, path):
+        try:
+            with phase("scan note", path=path.name):
+                return scan_markdown_file(path)
+        except OSError:
+            return None
+
+    def outliers(self, file_stats, key, threshold):
+        """Files whose counter exceeds threshold, largest first."""
+        over = sorted((s for s in file_stats if s[key] > threshold), key=lambda s: s[key], reverse=True)
+        return [{"path": s["path"], key: s[key], "bytes": s["bytes"]} for s in over]
+
+    def estimate_cost(self, daily_notes, activities, throughput):
+        """Estimate the reads done by the daily note composer and the restorer.
+
+        The composer reads the previous daily note (todo rollover) and every
+        activity file (activities in progress, mentions). The restorer reads
+        each activity file and, per date marker, the daily note for that date.
+        Seconds are extrapolated from this scan's own read throughput.
+        """
+        activity_bytes = sum(s["bytes"] for s in activities.values())
+        latest_note = daily_notes[max(daily_notes)] if daily_notes else None
+        composer_bytes = activity_bytes + (latest_note["bytes"] if latest_note else 0)
+
+        # Markers are counted, not resolved, so each one is charged an average-sized daily note
+        date_markers = sum(s["date_markers"] for s in activities.values())
+        average_note_bytes = sum(s["bytes"] for s in daily_notes.values()) / len(daily_notes) if daily_notes else 0
+        restorer_reads = len(activities) + date_markers
+        restorer_bytes = activity_bytes + int(date_markers * average_note_bytes)
+
+        def seconds(byte_count):
+            return round(byte_count / throughput, 3) if throughput else None
+
+        return {
+            "scan_throughput_mb_s": round(throughput / 1e6, 2),
+            "daily_note_composer": {"files_read": len(activities) + (1 if latest_note else 0),
+                                    "bytes_read": composer_bytes, "estimated_seconds": seconds(composer_bytes)},
+            "restorer": {"files_read": restorer_reads, "bytes_read": restorer_bytes,
+                         "estimated_seconds": seconds(restorer_bytes)}
+        }
 
 class AssumptionValidator:
-    def __init__(self):
+    def __init__(self, use_cache=True, workers=DEFAULT_WORKERS):
         self.results = {
             "timestamp": datetime.now().isoformat(),
             "validations": {},
@@ -22,202 +322,112 @@ class AssumptionValidator:
                 "total": 0,
                 "passed": 0,
                 "failed": 0,
+                "cached": 0,
                 "errors": []
             }
         }
-        
+        self.use_cache = use_cache
+        self.workers = workers
+        self.cache = self.load_cache() if use_cache else {}
+
+    def load_cache(self):
+        """Load cached probe results, ignoring a missing or outdated cache file."""
+        try:
+            with open(CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache.get("entries", {})
+
+    def save_cache(self):
+        """Write the probe result cache atomically."""
+        temp_file = CACHE_FILE.with_suffix(".tmp")
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({"version": CACHE_VERSION, "entries": self.cache}, f)
+            os.replace(temp_file, CACHE_FILE)
+        except OSError as e:
+            print(f"⚠️ Could not save validation cache: {e}")
+
+    def run_probes(self, groups):
+        """Run the probes of the given groups concurrently and record their results in order."""
+        probes = [probe for probe in PROBES if probe.group in groups]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # One stat per directory decides which cached answers are still valid
+            directories = {probe.cache_directory() for probe in probes} - {None}
+            directory_states = dict(zip(directories, pool.map(self.directory_state, directories)))
+            outcomes = list(pool.map(lambda probe: self.run_probe(probe, directory_states), probes))
+
+        passed_probes = set()
+        for probe, (passed, details, latency_ms, cached) in zip(probes, outcomes):
+            if probe.parent and probe.parent not in passed_probes:
+                continue
+            if passed:
+                passed_probes.add(probe.name)
+            self.record_result(probe.name, passed, details, latency_ms, cached)
+
+        if self.use_cache:
+            self.save_cache()
+        return all(passed for probe, (passed, _, _, _) in zip(probes, outcomes) if probe.required)
+
+    def directory_state(self, directory):
+        """Return [nearest existing directory, its mtime]; creating a missing one changes the mtime."""
+        while True:
+            try:
+                return [str(directory), os.stat(directory).st_mtime_ns]
+            except OSError:
+                if directory == directory.parent:
+                    return None
+                directory = directory.parent
+
+    def run_probe(self, probe, directory_states):
+        """Run one probe (or answer it from the cache); returns (passed, details, latency_ms, cached)."""
+        start_time = time.perf_counter()
+        cache_key = None
+        directory_state = directory_states.get(probe.cache_directory())
+        if self.use_cache and directory_state is not None:
+            cache_key = [str(probe.path), probe.kind] + directory_state
+            entry = self.cache.get(probe.name)
+            if entry and entry["key"] == cache_key:
+                return entry["passed"], entry["details"], (time.perf_counter() - start_time) * 1000, True
+
+        try:
+            with phase(probe.name, group=probe.group):
+                passed, details = probe.run()
+        except Exception as e:
+            passed, details = False, f"Error: {str(e)}"
+        latency_ms = (time.perf_counter() - start_time) * 1000
+
+        if cache_key is not None:
+            self.cache[probe.name] = {"key": cache_key, "passed": passed, "details": details}
+        return passed, details, latency_ms, False
+
     def validate_environment(self):
         """Validate basic development environment."""
         print("🔍 Validating development environment...")
-        
-        try:
-            # Check Python version
-            python_version = sys.version_info
-            if python_version.major >= 3 and python_version.minor >= 7:
-                self.record_result("python_version", True, f"Python {python_version.major}.{python_version.minor}")
-            else:
-                self.record_result("python_version", False, f"Python version too old: {python_version}")
-                
-            # Check project directory structure
-            context_dir = Path(__file__).parent.parent
-            required_dirs = ["static", "evolving", "dynamic", "archive"]
-            
-            for dir_name in required_dirs:
-                dir_path = context_dir / dir_name
-                if dir_path.exists():
-                    self.record_result(f"directory_{dir_name}", True, f"Directory exists: {dir_name}")
-                else:
-                    self.record_result(f"directory_{dir_name}", False, f"Missing directory: {dir_name}")
-                    
-            return True
-            
-        except Exception as e:
-            self.record_result("environment_validation", False, f"Error: {str(e)}")
-            return False
-            
+        return self.run_probes({"environment"})
+
     def validate_project_specific(self):
         """Validate Obsidian Engine-specific requirements."""
         print("🔍 Validating Obsidian Engine requirements...")
-        
-        try:
-            success = True
-            
-            # Check Scripts directory and JavaScript components
-            success &= self.validate_scripts_directory()
-            
-            # Check Templates directory
-            success &= self.validate_templates_directory()
-            
-            # Check TestSuite directory
-            success &= self.validate_test_suite()
-            
-            # Validate project structure
-            success &= self.validate_obsidian_structure()
-            
-            return success
-            
-        except Exception as e:
-            self.record_result("project_validation", False, f"Error: {str(e)}")
-            return False
-            
-    def validate_scripts_directory(self):
-        """Validate Scripts directory and JavaScript components."""
-        try:
-            project_root = Path(__file__).parent.parent.parent
-            scripts_dir = project_root / "Scripts"
-            
-            if not scripts_dir.exists():
-                self.record_result("scripts_directory", False, "Scripts directory not found")
-                return False
-                
-            self.record_result("scripts_directory", True, "Scripts directory exists")
-            
-            # Check for core JavaScript files
-            required_scripts = [
-                "dailyNoteComposer.js",
-                "activityComposer.js",
-                "components/noteBlocksParser.js",
-                "components/todoRollover.js",
-                "components/mentionsProcessor.js",
-                "components/activitiesInProgress.js",
-                "utilities/fileIO.js"
-            ]
-            
-            for script in required_scripts:
-                script_path = scripts_dir / script
-                if script_path.exists():
-                    self.record_result(f"script_{script.replace('/', '_').replace('.js', '')}", True, f"Found {script}")
-                else:
-                    self.record_result(f"script_{script.replace('/', '_').replace('.js', '')}", False, f"Missing {script}")
-                    
-            return True
-            
-        except Exception as e:
-            self.record_result("scripts_validation", False, f"Scripts validation error: {str(e)}")
-            return False
-            
-    def validate_templates_directory(self):
-        """Validate Templates directory."""
-        try:
-            project_root = Path(__file__).parent.parent.parent
-            templates_dir = project_root / "Templates"
-            
-            if not templates_dir.exists():
-                self.record_result("templates_directory", False, "Templates directory not found")
-                return False
-                
-            self.record_result("templates_directory", True, "Templates directory exists")
-            
-            # Check for required templates
-            required_templates = [
-                "DailyNote-template.md",
-                "Activity-template.md"
-            ]
-            
-            for template in required_templates:
-                template_path = templates_dir / template
-                if template_path.exists():
-                    self.record_result(f"template_{template.replace('-', '_').replace('.md', '')}", True, f"Found {template}")
-                else:
-                    self.record_result(f"template_{template.replace('-', '_').replace('.md', '')}", False, f"Missing {template}")
-                    
-            return True
-            
-        except Exception as e:
-            self.record_result("templates_validation", False, f"Templates validation error: {str(e)}")
-            return False
-            
-    def validate_test_suite(self):
-        """Validate TestSuite directory."""
-        try:
-            project_root = Path(__file__).parent.parent.parent
-            test_dir = project_root / "TestSuite"
-            
-            if not test_dir.exists():
-                self.record_result("test_suite_directory", False, "TestSuite directory not found")
-                return False
-                
-            self.record_result("test_suite_directory", True, "TestSuite directory exists")
-            
-            # Check for test categories
-            test_categories = ["Core", "Features", "Integration", "Samples"]
-            
-            for category in test_categories:
-                category_path = test_dir / category
-                if category_path.exists():
-                    self.record_result(f"test_category_{category.lower()}", True, f"Found {category} tests")
-                else:
-                    self.record_result(f"test_category_{category.lower()}", False, f"Missing {category} tests")
-                    
-            return True
-            
-        except Exception as e:
-            self.record_result("test_suite_validation", False, f"TestSuite validation error: {str(e)}")
-            return False
-            
-    def validate_obsidian_structure(self):
-        """Validate expected Obsidian vault structure."""
-        try:
-            project_root = Path(__file__).parent.parent.parent
-            
-            # Check for knowledge directory
-            knowledge_dir = project_root / "knowledge"
-            if knowledge_dir.exists():
-                self.record_result("knowledge_directory", True, "Knowledge directory exists")
-            else:
-                self.record_result("knowledge_directory", False, "Knowledge directory not found")
-                
-            # Check for minds-vault submodule
-            minds_vault_dir = project_root / "minds-vault"
-            if minds_vault_dir.exists():
-                self.record_result("minds_vault_submodule", True, "minds-vault submodule exists")
-            else:
-                self.record_result("minds_vault_submodule", False, "minds-vault submodule not found")
-                
-            # Check for README files
-            readme_files = ["README.md", "README_journal_backup.md", "README_PDF_CONVERTER.md"]
-            for readme in readme_files:
-                readme_path = project_root / readme
-                if readme_path.exists():
-                    self.record_result(f"readme_{readme.replace('.md', '').replace('_', '_').lower()}", True, f"Found {readme}")
-                else:
-                    self.record_result(f"readme_{readme.replace('.md', '').replace('_', '_').lower()}", False, f"Missing {readme}")
-                    
-            return True
-            
-        except Exception as e:
-            self.record_result("obsidian_structure_validation", False, f"Structure validation error: {str(e)}")
-            return False
-            
-    def record_result(self, test_name, passed, details):
+        return self.run_probes({"project"})
+
+    def record_result(self, test_name, passed, details, latency_ms=None, cached=False):
         """Record a validation result."""
         self.results["validations"][test_name] = {
             "passed": passed,
             "details": details,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.results["timestamp"],
+            "latency_ms": round(latency_ms, 3) if latency_ms is not None else None,
+            "cached": cached
         }
-        
+
         self.results["summary"]["total"] += 1
+        if cached:
+            self.results["summary"]["cached"] += 1
         if passed:
             self.results["summary"]["passed"] += 1
             print(f"  ✅ {test_name}: {details}")
@@ -225,33 +435,87 @@ class AssumptionValidator:
             self.results["summary"]["failed"] += 1
             self.results["summary"]["errors"].append(f"{test_name}: {details}")
             print(f"  ❌ {test_name}: {details}")
-            
+
     def run_health_check(self):
         """Run basic health check validations."""
         print("🏥 Running health check...")
-        
+
         success = True
         success &= self.validate_environment()
-        
+
         return success
-        
+
     def run_full_validation(self):
         """Run complete validation suite."""
         print("🔬 Running full validation suite...")
-        
-        success = True
-        success &= self.validate_environment()
-        success &= self.validate_project_specific()
-        
+
+        start_time = time.perf_counter()
+        print("🔍 Validating development environment and Obsidian Engine requirements...")
+        with phase("probes"):
+            success = self.run_probes({"environment", "project"})
+        self.results["summary"]["duration_ms"] = round((time.perf_counter() - start_time) * 1000, 3)
+
         return success
-        
+
+    def run_deep_scan(self, scanner, output_file=DEEP_SCAN_FILE):
+        """Scan the whole vault, record pass/fail results and export the report as JSON."""
+        print(f"🔭 Scanning vault: {scanner.vault_path}")
+        with phase("deep scan"):
+            report = scanner.scan()
+        totals = report["totals"]
+        print(f"  📚 {totals['markdown_files']} markdown files ({totals['bytes'] / 1e6:.1f} MB) "
+              f"in {report['duration_ms'] / 1000:.2f}s")
+
+        checks = [
+            ("deep_daily_note_size", report["large_daily_notes"],
+             f"daily notes over {scanner.max_daily_lines} lines"),
+            ("deep_activity_date_markers", report["activities_with_many_date_markers"],
+             f"activities with over {scanner.max_date_markers} date markers"),
+            ("deep_activity_links", report["broken_activity_links"], "broken [[Activities/...]] link targets"),
+            ("deep_journal_folders", report["journal_folder_issues"], "Journal folders outside YYYY/MM.Month"),
+            ("deep_journal_daily_notes", report["misplaced_daily_notes"], "misplaced daily notes"),
+            ("deep_unreadable_files", report["unreadable_files"], "unreadable files"),
+        ]
+        for name, findings, description in checks:
+            self.record_result(name, not findings, f"{len(findings)} {description}")
+
+        cost = report["estimated_cost"]
+        for label, estimate in (("daily note composer", cost["daily_note_composer"]), ("restorer", cost["restorer"])):
+            seconds = f" (~{estimate['estimated_seconds']}s)" if estimate["estimated_seconds"] is not None else ""
+            print(f"  ⏱️  Estimated {label} reads: {estimate['files_read']} files, "
+                  f"{estimate['bytes_read'] / 1e6:.1f} MB{seconds}")
+        for outlier in report["largest_files"][:3]:
+            print(f"  📄 {outlier['path']}: {outlier['lines']} lines, {outlier['bytes'] / 1e3:.0f} KB")
+
+        self.results["deep_scan"] = report
+        self.export_deep_scan(report, output_file)
+        return True
+
+    def export_deep_scan(self, report, output_file):
+        """Write the full report and append a one-line summary to the trend history."""
+        with open(output_file, 'w') as f:
+            json.dump(report, f, indent=2)
+        history_entry = {
+            "timestamp": report["timestamp"],
+            "duration_ms": report["duration_ms"],
+            **report["totals"],
+            "large_daily_notes": len(report["large_daily_notes"]),
+            "activities_with_many_date_markers": len(report["activities_with_many_date_markers"]),
+            "broken_activity_links": len(report["broken_activity_links"]),
+            "journal_layout_issues": len(report["journal_folder_issues"]) + len(report["misplaced_daily_notes"]),
+            "restorer_bytes_read": report["estimated_cost"]["restorer"]["bytes_read"]
+        }
+        with open(DEEP_SCAN_HISTORY_FILE, 'a') as f:
+            f.write(json.dumps(history_entry) + "\n")
+        print(f"📊 Vault scan saved to: {output_file} (history: {DEEP_SCAN_HISTORY_FILE.name})")
+
     def save_results(self):
         """Save validation results to file."""
         results_file = Path(__file__).parent / "validation-results.json"
         with open(results_file, 'w') as f:
             json.dump(self.results, f, indent=2)
         print(f"📊 Results saved to: {results_file}")
-        
+
     def print_summary(self):
         """Print validation summary."""
         summary = self.results["summary"]
@@ -259,7 +523,10 @@ class AssumptionValidator:
         print(f"  Total tests: {summary['total']}")
         print(f"  Passed: {summary['passed']}")
         print(f"  Failed: {summary['failed']}")
-        
+        print(f"  From cache: {summary['cached']}")
+        if "duration_ms" in summary:
+            print(f"  Duration: {summary['duration_ms']:.1f} ms")
+
         if summary["errors"]:
             print("\n❌ Errors:")
             for error in summary["errors"]:
@@ -272,24 +539,46 @@ def main():
     parser.add_argument("--health-check", action="store_true", help="Run basic health check only")
     parser.add_argument("--quick-check", action="store_true", help="Run quick validation")
     parser.add_argument("--save-results", action="store_true", help="Save results to file")
-    
+    parser.add_argument("--no-cache", action="store_true", help="Run every probe, ignoring validation-cache.json")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads used to run probes concurrently (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--deep", action="store_true",
+                        help="Also scan every vault note for size and structure outliers")
+    parser.add_argument("--vault", type=str, default=str(DEFAULT_VAULT_PATH),
+                        help=f"Vault root for --deep (default: {DEFAULT_VAULT_PATH})")
+    parser.add_argument("--deep-output", type=str, default=str(DEEP_SCAN_FILE),
+                        help="JSON file for the --deep report (default: vault-scan-results.json)")
+    parser.add_argument("--max-daily-lines", type=int, default=DEFAULT_MAX_DAILY_LINES,
+                        help=f"Report daily notes longer than this (default: {DEFAULT_MAX_DAILY_LINES})")
+    parser.add_argument("--max-date-markers", type=int, default=DEFAULT_MAX_DATE_MARKERS,
+                        help=f"Report activities with more date markers (default: {DEFAULT_MAX_DATE_MARKERS})")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Parse every note for --deep even when the Engine daemon is serving the vault")
+    add_profile_argument(parser)
+
     args = parser.parse_args()
-    
-    validator = AssumptionValidator()
-    
+    start_profiling(args.profile, "assumption-validator")
+
+    validator = AssumptionValidator(use_cache=not args.no_cache, workers=args.workers)
+
     try:
         if args.health_check or args.quick_check:
             success = validator.run_health_check()
         else:
             success = validator.run_full_validation()
-            
+
+        if args.deep:
+            scanner = VaultScanner(args.vault, workers=args.workers, max_daily_lines=args.max_daily_lines,
+                                   max_date_markers=args.max_date_markers, use_daemon=not args.no_daemon)
+            success &= validator.run_deep_scan(scanner, args.deep_output)
+
         validator.print_summary()
-        
+
         if args.save_results:
             validator.save_results()
-            
+
         sys.exit(0 if success else 1)
-        
+
     except KeyboardInterrupt:
         print("\n⚠️ Validation interrupted by user")
         sys.exit(1)
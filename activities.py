@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Activities In Progress
+
+Lists the activities that activitiesInProgress.js would add to a daily note:
+`stage: active`, plus `stage: planning` when a daily note mentioned them in
+the last 7 days. Stages are read from the frontmatter index, which reads only
+the frontmatter of activity files changed since the last run.
+
+Usage:
+  python activities.py                      # Activities in progress today
+  python activities.py --date 2025-07-04    # As of another day
+  python activities.py --all                # Every activity with its stage
+"""
+
+import json
+import time
+import argparse
+from datetime import datetime
+
+from vault.activities import activities_in_progress, activity_stage
+from vault.frontmatter import FrontmatterIndex
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="List the activities in progress")
+    parser.add_argument("--date", type=parse_date, help="Day to evaluate recent mentions for (default: today)")
+    parser.add_argument("--days", type=int, default=7,
+                        help="How many days back a mention keeps a planning activity in progress (default: 7)")
+    parser.add_argument("--all", action="store_true", help="List every activity with its stage")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--vault-path", type=str, default="..",
+                        help="Path to vault root (default: .. from Engine directory)")
+
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    index = FrontmatterIndex(args.vault_path)
+    if args.all:
+        index.update()
+        rows = [(page, activity_stage(frontmatter)) for page, frontmatter in index.items()]
+    else:
+        rows = activities_in_progress(args.vault_path, args.date, args.days, frontmatter_index=index)
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+    if args.json:
+        print(json.dumps([{"page": page, "stage": stage} for page, stage in rows], indent=2, ensure_ascii=False))
+        return
+
+    print(f"📋 {'Activities' if args.all else 'Activities in progress'}: {len(rows)} ({elapsed_ms:.0f} ms)")
+    for page, stage in rows:
+        print(f"  📁 {page} ({stage or 'no stage'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Markdown Converter Benchmark and Golden Output Check
+
+Benchmarks SimpleMarkdownToHTMLConverter and
+ImprovedMarkdownToPDFConverter.convert_markdown_to_html on synthetic corpora
+and compares their HTML against stored golden files, so performance work
+cannot silently change the rendering.
+
+Usage:
+  python benchmarks/bench_converters.py                          # Benchmark 1KB-1MB and check golden output
+  python benchmarks/bench_converters.py --sizes 1KB 10MB 100MB   # Custom corpus sizes
+  python benchmarks/bench_converters.py --check-golden           # Golden comparison only
+  python benchmarks/bench_converters.py --update-golden          # Rewrite golden files after an intended change
+  python benchmarks/bench_converters.py --json results.json      # Save results as JSON
+"""
+
+import re
+import sys
+import json
+import time
+import difflib
+import argparse
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+ENGINE_DIR = BENCH_DIR.parent
+GOLDEN_DIR = BENCH_DIR / "golden"
+sys.path.insert(0, str(ENGINE_DIR))
+
+from markdown_corpus import generate_corpus, parse_size, format_size
+
+DEFAULT_SIZES = ['1KB', '10KB', '100KB', '1MB']
+
+# Golden inputs: deterministic corpora plus the sample notes from the test suite
+GOLDEN_CORPORA = {'corpus_small': (4 * 1024, 1), 'corpus_medium': (32 * 1024, 2)}
+GOLDEN_SAMPLES = ['TestSuite/Samples/sample-daily-note.md', 'TestSuite/Samples/sample-activity.md']
+
+SIMPLE_STAGES = [
+    'convert_code_blocks', 'convert_obsidian_links', 'convert_headers', 'convert_tables',
+    'convert_lists', 'convert_blockquotes', 'convert_formatting', 'convert_paragraphs',
+    'generate_toc', 'create_complete_html',
+]
+IMPROVED_STAGES = ['convert_markdown_to_html', 'add_header_and_toc', 'create_complete_html']
+
+GENERATED_DATE = re.compile(r'Generated on [A-Z][a-z]+ \d{2}, \d{4}')
+
+
+class StageTimer:
+    """Accumulate wall time per converter method by wrapping instance methods"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = defaultdict(float)
+
+    def wrap(self, obj, names: List[str]) -> None:
+        for name in names:
+            if not hasattr(obj, name):
+                continue
+            method = getattr(obj, name)
+
+            def timed(*args, _method=method, _name=name, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return _method(*args, **kwargs)
+                finally:
+                    self.timings[_name] += time.perf_counter() - start
+
+            setattr(obj, name, timed)
+
+
+def render_simple(converter, markdown_content: str) -> str:
+    return converter.create_complete_html(converter.convert_markdown_to_html(markdown_content))
+
+
+def render_improved(converter, markdown_content: str) -> str:
+    html_content, toc = converter.convert_markdown_to_html(markdown_content)
+    return converter.create_complete_html(converter.add_header_and_toc(html_content, toc))
+
+
+def load_converters() -> Dict[str, dict]:
+    """Return the converters that can be imported in this environment"""
+    from simple_html_converter import SimpleMarkdownToHTMLConverter
+
+    converters = {
+        'simple': {'factory': SimpleMarkdownToHTMLConverter, 'render': render_simple, 'stages': SIMPLE_STAGES},
+    }
+
+    try:
+        from markdown_to_pdf_improved import ImprovedMarkdownToPDFConverter
+        converters['improved'] = {
+            'factory': ImprovedMarkdownToPDFConverter, 'render': render_improved, 'stages': IMPROVED_STAGES,
+        }
+    except (ImportError, OSError, SystemExit) as e:
+        print(f"⚠️  Skipping ImprovedMarkdownToPDFConverter (missing dependencies: {e})")
+
+    return converters
+
+
+def normalize_html(html: str) -> str:
+    """Remove volatile content (the generation date) before comparison"""
+    return GENERATED_DATE.sub('Generated on DATE', html)
+
+
+def golden_inputs() -> Dict[str, str]:
+    """Return the named markdown inputs used for golden comparisons"""
+    inputs = {name: generate_corpus(size, seed) for name, (size, seed) in GOLDEN_CORPORA.items()}
+    for sample in GOLDEN_SAMPLES:
+        inputs[Path(sample).stem] = (ENGINE_DIR / sample).read_text(encoding='utf-8')
+    return inputs
+
+
+def check_golden(converters: Dict[str, dict], update: bool = False) -> bool:
+    """Compare converter output with the golden files (or rewrite them)"""
+    print("\n🔍 Golden output check" if not update else "\n✏️  Updating golden output")
+    print("-" * 50)
+    GOLDEN_DIR.mkdir(exist_ok=True)
+    success = True
+
+    for name, markdown_content in golden_inputs().items():
+        for converter_name, spec in converters.items():
+            golden_path = GOLDEN_DIR / f"{converter_name}_{name}.html"
+            actual = normalize_html(spec['render'](spec['factory'](), markdown_content))
+
+            if update:
+                golden_path.write_text(actual, encoding='utf-8')
+                print(f"  💾 {golden_path.relative_to(ENGINE_DIR)}")
+                continue
+
+            if not golden_path.exists():
+                print(f"  ⚠️  {converter_name}/{name}: no golden file (run with --update-golden)")
+                success = False
+                continue
+
+            expected = golden_path.read_text(encoding='utf-8')
+            if actual == expected:
+                print(f"  ✅ {converter_name}/{name}")
+                continue
+
+            success = False
+            diff = list(difflib.unified_diff(expected.splitlines(), actual.splitlines(),
+                                             'golden', 'actual', lineterm='', n=1))
+            print(f"  ❌ {converter_name}/{name}: output differs from {golden_path.name}")
+            for line in diff[:20]:
+                print(f"      {line}")
+            if len(diff) > 20:
+                print(f"      ... and {len(diff) - 20} more diff lines")
+
+    return success
+
+
+def measure(spec: dict, markdown_content: str, repeat: int, track_memory: bool) -> dict:
+    """Time one converter on one document, keeping the fastest run"""
+    best = None
+    for _ in range(repeat):
+        converter = spec['factory']()
+        timer = StageTimer()
+        timer.wrap(converter, spec['stages'])
+        start = time.perf_counter()
+        spec['render'](converter, markdown_content)
+        total = time.perf_counter() - start
+        if best is None or total < best['total_s']:
+            best = {'total_s': total, 'stages_s': dict(timer.timings)}
+
+    if track_memory:
+        converter = spec['factory']()
+        tracemalloc.start()
+        spec['render'](converter, markdown_content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        best['peak_memory_bytes'] = peak
+
+    size = len(markdown_content.encode('utf-8'))
+    best['input_bytes'] = size
+    best['throughput_mb_s'] = size / (1024 * 1024) / best['total_s'] if best['total_s'] else 0.0
+    return best
+
+
+def run_benchmarks(converters: Dict[str, dict], sizes: List[str], repeat: int, track_memory: bool) -> List[dict]:
+    """Benchmark every converter at every corpus size"""
+    results = []
+    print("\n⏱️  Converter benchmarks")
+    print("-" * 50)
+
+    for size_text in sizes:
+        size = parse_size(size_text)
+        markdown_content = generate_corpus(size, seed=0)
+        for converter_name, spec in converters.items():
+            runs = repeat if size < 10 * 1024 * 1024 else 1
+            result = measure(spec, markdown_content, runs, track_memory)
+            result.update({'converter': converter_name, 'size': format_size(size)})
+            results.append(result)
+
+            memory = f", peak {result['peak_memory_bytes'] / (1024 * 1024):.1f} MB" if track_memory else ""
+            print(f"  📊 {converter_name:<9} {format_size(size):>6}: {result['total_s'] * 1000:9.1f} ms, "
+                  f"{result['throughput_mb_s']:.2f} MB/s{memory}")
+            stages = sorted(result['stages_s'].items(), key=lambda item: item[1], reverse=True)
+            for stage, seconds in stages:
+                share = seconds / result['total_s'] * 100 if result['total_s'] else 0
+                print(f"        {stage:<26} {seconds * 1000:9.1f} ms ({share:4.1f}%)")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the markdown converters and check golden output")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help=f"Corpus sizes to benchmark (default: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, fastest is kept (default: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak memory pass")
+    parser.add_argument("--check-golden", action="store_true", help="Only compare output with golden files")
+    parser.add_argument("--update-golden", action="store_true", help="Rewrite golden files from current output")
+    parser.add_argument("--json", type=str, help="Write benchmark results to this JSON file")
+
+    args = parser.parse_args()
+
+    print("🚀 Markdown Converter Benchmark")
+    print("=" * 50)
+    converters = load_converters()
+
+    if args.update_golden:
+        check_golden(converters, update=True)
+        sys.exit(0)
+
+    golden_ok = check_golden(converters)
+    if args.check_golden:
+        sys.exit(0 if golden_ok else 1)
+
+    results = run_benchmarks(converters, args.sizes, args.repeat, not args.no_memory)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'golden_ok': golden_ok, 'results': results}, f, indent=2)
+        print(f"\n📄 Results saved to: {args.json}")
+
+    if not golden_ok:
+        print("\n❌ Golden output changed - review the diff, then run with --update-golden if intended")
+        sys.exit(1)
+    print("\n🎉 Benchmarks completed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Import and Startup Time Benchmark
+
+Measures how long the Engine scripts take to import and to answer --help,
+each in a fresh interpreter, so heavy module-level imports are caught early.
+Targets with a startup budget (`engine --help` and `engine backup` must start
+within STARTUP_BUDGET_MS, interpreter startup included) fail the run when they
+exceed it.
+
+Usage:
+  python benchmarks/bench_import_time.py                    # Report median startup times
+  python benchmarks/bench_import_time.py --max-ms 100       # Fail if any target exceeds 100 ms
+  python benchmarks/bench_import_time.py --detail markdown_to_pdf_improved  # Slowest imports of one module
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import List, Tuple
+
+ENGINE_DIR = Path(__file__).resolve().parent.parent
+
+STARTUP_BUDGET_MS = 100
+
+# (label, interpreter arguments, budget in ms or None) run from the Engine directory
+TARGETS = [
+    ("import markdown_to_pdf_improved", ["-c", "import markdown_to_pdf_improved"], None),
+    ("import simple_html_converter", ["-c", "import simple_html_converter"], None),
+    ("import journal_backup", ["-c", "import journal_backup"], None),
+    ("import restore_activity_content", ["-c", "import restore_activity_content"], None),
+    ("markdown_to_pdf_improved.py --help", ["markdown_to_pdf_improved.py", "--help"], None),
+    ("engine.py --help", ["engine.py", "--help"], STARTUP_BUDGET_MS),
+    # --help stops right after the backup script is imported and its parser built
+    ("engine.py backup --help", ["engine.py", "backup", "--help"], STARTUP_BUDGET_MS),
+]
+
+
+def time_command(args: List[str], runs: int) -> float:
+    """Return the median wall time in milliseconds of running python with args"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ENGINE_DIR, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def slowest_imports(module: str, limit: int = 15) -> List[Tuple[int, str]]:
+    """Return the imports with the largest cumulative time (us) from -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ENGINE_DIR, capture_output=True, text=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        entries.append((int(cumulative.strip()), name.rstrip()))
+    entries.sort(reverse=True)
+    return entries[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure startup time of the Engine scripts")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per target, median is reported (default: 7)")
+    parser.add_argument("--max-ms", type=float,
+                        help="Fail when a target's startup (minus bare interpreter startup) exceeds this")
+    parser.add_argument("--detail", type=str, help="Show the slowest imports of this module")
+
+    args = parser.parse_args()
+
+    print("🚀 Import Time Benchmark")
+    print("=" * 50)
+
+    if args.detail:
+        print(f"🔍 Slowest imports for {args.detail} (cumulative):")
+        for cumulative_us, name in slowest_imports(args.detail):
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+        sys.exit(0)
+
+    baseline = time_command(["-c", "pass"], args.runs)
+    print(f"🐍 Bare interpreter startup: {baseline:.1f} ms")
+
+    failures = []
+    for label, command, budget in TARGETS:
+        elapsed = time_command(command, args.runs)
+        overhead = elapsed - baseline
+        status = "✅"
+        if (args.max_ms is not None and overhead > args.max_ms) or (budget is not None and elapsed > budget):
+            status = "❌"
+            failures.append(label)
+        limit = f"  (budget {budget} ms)" if budget is not None else ""
+        print(f"  {status} {label:<40} {elapsed:7.1f} ms (+{overhead:.1f} ms){limit}")
+
+    if failures:
+        print(f"\n❌ {len(failures)} target(s) over their startup limit: {', '.join(failures)}")
+        sys.exit(1)
+    print("\n🎉 Startup times within limits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Byte-Level Prefilter Benchmark
+
+Measures how much of a vault the restorer's byte-level prefilter rules out
+before any UTF-8 decoding: activity files are checked for `[[YYYY-MM-DD]]`
+markers and daily notes for `##### [[Activities/...]]` headers. For each check
+it reports the files and bytes ruled out by a plain find, the ones ruled out by
+a regex over the raw bytes, and the ones left to decode, and compares the time
+with decoding every file and searching the text.
+
+Usage:
+  python benchmarks/bench_prefilter.py                      # The vault around the Engine directory
+  python benchmarks/bench_prefilter.py --vault-path /tmp/v  # Another vault
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+ENGINE_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(ENGINE_DIR))
+
+from vault.blocks import ACTIVITY_HEADER_PATTERN, DATE_MARKER_PATTERN, iter_markdown_files
+from vault.sections import DATE_MARKER_BYTES_PATTERN, LINK_OPENING, file_buffer
+
+ACTIVITY_HEADER_TEXT_PATTERN = re.compile(ACTIVITY_HEADER_PATTERN.pattern, re.MULTILINE)
+
+# (folder, what is looked for, literal every match contains, pattern over bytes, pattern over text)
+# The header literal is the link rather than `##### [[`, since `\s+` also allows tabs or several spaces
+CHECKS = [
+    ("Activities", "[[YYYY-MM-DD]] markers", LINK_OPENING, DATE_MARKER_BYTES_PATTERN, DATE_MARKER_PATTERN),
+    ("Journal", "##### [[Activities/...]] headers", b'[[Activities/',
+     re.compile(ACTIVITY_HEADER_PATTERN.pattern.encode('ascii'), re.MULTILINE), ACTIVITY_HEADER_TEXT_PATTERN),
+]
+
+
+def classify(paths: List[Path], literal: bytes, byte_pattern) -> Dict[str, List[int]]:
+    """[files, bytes] per outcome: ruled out by find, ruled out by the byte regex, or left to decode"""
+    outcomes = {"find": [0, 0], "regex": [0, 0], "decode": [0, 0]}
+    for path in paths:
+        with file_buffer(path) as buffer:
+            size = len(buffer)
+            if buffer.find(literal) == -1:
+                outcome = "find"
+            else:
+                outcome = "regex" if byte_pattern.search(buffer) is None else "decode"
+        outcomes[outcome][0] += 1
+        outcomes[outcome][1] += size
+    return outcomes
+
+
+def time_prefiltered(paths: List[Path], literal: bytes, byte_pattern) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        with file_buffer(path) as buffer:
+            if buffer.find(literal) != -1:
+                byte_pattern.search(buffer)
+    return time.perf_counter() - start
+
+
+def time_decoded(paths: List[Path], text_pattern) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text_pattern.search(f.read())
+    return time.perf_counter() - start
+
+
+def format_share(part: int, total: int) -> str:
+    return f"{100 * part / total:5.1f}%" if total else "    -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure what the byte-level prefilter skips on a vault")
+    parser.add_argument("--vault-path", type=str, default=str(ENGINE_DIR.parent),
+                        help="Path to vault root (default: the vault around the Engine directory)")
+    parser.add_argument("--runs", type=int, default=3, help="Timing runs, best is reported (default: 3)")
+
+    args = parser.parse_args()
+    vault_path = Path(args.vault_path).resolve()
+
+    print("🚀 Byte-Level Prefilter Benchmark")
+    print("=" * 50)
+    print(f"📂 Vault path: {vault_path}")
+
+    for folder, what, literal, byte_pattern, text_pattern in CHECKS:
+        paths = list(iter_markdown_files(vault_path, [folder]))
+        if not paths:
+            print(f"\n⏭️  {folder}: no notes")
+            continue
+        outcomes = classify(paths, literal, byte_pattern)
+        total_files = len(paths)
+        total_bytes = sum(size for _, size in outcomes.values())
+
+        print(f"\n📁 {folder}: {total_files} notes, {total_bytes / 1024 / 1024:.1f} MB, looking for {what}")
+        for outcome, label in (("find", "Ruled out by find"), ("regex", "Ruled out by byte regex"),
+                               ("decode", "Left to decode")):
+            files, size = outcomes[outcome]
+            print(f"   {label:<24} {files:7d} files ({format_share(files, total_files)})"
+                  f" {size / 1024 / 1024:9.2f} MB ({format_share(size, total_bytes)})")
+        skipped = outcomes["find"][1] + outcomes["regex"][1]
+        print(f"   📊 Bytes never decoded: {format_share(skipped, total_bytes).strip()}")
+
+        prefiltered = min(time_prefiltered(paths, literal, byte_pattern) for _ in range(args.runs))
+        decoded = min(time_decoded(paths, text_pattern) for _ in range(args.runs))
+        speedup = decoded / prefiltered if prefiltered else float('inf')
+        print(f"   ⏱️  Prefilter {prefiltered * 1000:.0f} ms vs decode + regex {decoded * 1000:.0f} ms"
+              f" ({speedup:.1f}x)")
+
+    print("\n🎉 Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Synthetic Markdown Corpus Generator
+
+Generates deterministic markdown documents of a requested size for converter
+benchmarks. The corpus mixes the constructs found in our documentation and
+notes: headers, nested lists and todos, tables, fenced code blocks,
+blockquotes, inline formatting, links and Obsidian wikilinks.
+
+Usage:
+  python benchmarks/markdown_corpus.py --size 1MB -o corpus.md
+  python benchmarks/markdown_corpus.py --size 10KB --seed 7
+"""
+
+import sys
+import random
+import argparse
+from datetime import date, timedelta
+from typing import List
+
+SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+WORDS = (
+    "activity journal note block parser todo rollover mention directive template "
+    "frontmatter vault daily weekly header callout composer stage planning active "
+    "completed archive review cache index query render layout stream backup restore "
+    "section marker script engine obsidian dataview link alias page content summary"
+).split()
+
+LANGUAGES = ['javascript', 'python', 'bash', 'yaml', '']
+
+CODE_SNIPPETS = {
+    'javascript': [
+        "const blocks = await noteBlocksParser.run(app, pages);",
+        "const todos = blocks.filter(b => b.blockType === 'todo');",
+        "for (const block of blocks) {\n    if (block.headerLevel === 5) continue;\n}",
+        "await fileIO.saveFile(app, filename, content);",
+    ],
+    'python': [
+        "restorer = ActivityTodosRestorer(dry_run=True)",
+        "for date, items in sorted(date_content.items()):\n    print(date, len(items))",
+        "content = path.read_text(encoding='utf-8')",
+    ],
+    'bash': [
+        "python3 restore_activity_content.py --dry-run",
+        "python3 journal_backup.py --compress-level 9",
+    ],
+    'yaml': [
+        "startDate: 2025-07-06\nstage: active\nresponsible: [Me, Partner]",
+    ],
+    '': [
+        "Journal/2025/07.July/2025-07-05.md",
+    ],
+}
+
+
+def parse_size(text: str) -> int:
+    """Parse a size such as '1KB', '100MB' or '2048' into bytes"""
+    text = text.strip().upper()
+    for unit in sorted(SIZE_UNITS, key=len, reverse=True):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * SIZE_UNITS[unit])
+    return int(text)
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a byte count with the largest whole unit"""
+    for unit in ['GB', 'MB', 'KB']:
+        if size_bytes >= SIZE_UNITS[unit] and size_bytes % SIZE_UNITS[unit] == 0:
+            return f"{size_bytes // SIZE_UNITS[unit]}{unit}"
+    return f"{size_bytes}B"
+
+
+class MarkdownCorpusGenerator:
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.start_date = date(2024, 1, 1)
+
+    def words(self, count: int) -> str:
+        """Return a run of random words"""
+        return ' '.join(self.rng.choice(WORDS) for _ in range(count))
+
+    def date_link(self) -> str:
+        """Return a [[YYYY-MM-DD]] date link"""
+        day = self.start_date + timedelta(days=self.rng.randrange(730))
+        return f"[[{day.isoformat()}]]"
+
+    def inline_text(self) -> str:
+        """Return a sentence with mixed inline formatting"""
+        parts = [self.words(self.rng.randint(4, 10)).capitalize()]
+        for _ in range(self.rng.randint(1, 3)):
+            choice = self.rng.randrange(7)
+            if choice == 0:
+                parts.append(f"**{self.words(2)}**")
+            elif choice == 1:
+                parts.append(f"*{self.words(2)}*")
+            elif choice == 2:
+                parts.append(f"`{self.rng.choice(WORDS)}()`")
+            elif choice == 3:
+                parts.append(f"[{self.words(2)}](https://example.com/{self.rng.choice(WORDS)})")
+            elif choice == 4:
+                parts.append(self.date_link())
+            elif choice == 5:
+                name = self.words(2).title()
+                parts.append(f"[[Activities/{name}.md|{name}]]")
+            else:
+                parts.append(f"[[{self.rng.choice(WORDS).title()}]]")
+            parts.append(self.words(self.rng.randint(2, 6)))
+        return ' '.join(parts) + '.'
+
+    def header(self) -> List[str]:
+        level = self.rng.choice([1, 2, 2, 3, 3, 3, 4])
+        return [f"{'#' * level} {self.words(self.rng.randint(2, 5)).title()}", '']
+
+    def activity_header(self) -> List[str]:
+        name = self.words(2).title()
+        return [f"##### [[Activities/{name}.md|{name}]]", '']
+
+    def paragraph(self) -> List[str]:
+        return [self.inline_text() for _ in range(self.rng.randint(1, 4))] + ['']
+
+    def nested_list(self) -> List[str]:
+        lines = []
+        ordered = self.rng.random() < 0.3
+        for index in range(self.rng.randint(2, 6)):
+            if ordered:
+                lines.append(f"{index + 1}. {self.inline_text()}")
+            else:
+                marker = self.rng.choice(['- ', '- [ ] ', '- [x] '])
+                lines.append(f"{marker}{self.inline_text()}")
+            for _ in range(self.rng.randint(0, 2)):
+                lines.append(f"    - {self.words(self.rng.randint(3, 8))}")
+                if self.rng.random() < 0.3:
+                    lines.append(f"        - {self.words(self.rng.randint(3, 6))}")
+        return lines + ['']
+
+    def table(self) -> List[str]:
+        columns = self.rng.randint(2, 5)
+        lines = ['| ' + ' | '.join(self.words(1).title() for _ in range(columns)) + ' |',
+                 '|' + '|'.join('---' for _ in range(columns)) + '|']
+        for _ in range(self.rng.randint(2, 8)):
+            lines.append('| ' + ' | '.join(self.words(self.rng.randint(1, 3)) for _ in range(columns)) + ' |')
+        return lines + ['']
+
+    def code_block(self) -> List[str]:
+        language = self.rng.choice(LANGUAGES)
+        body = [self.rng.choice(CODE_SNIPPETS[language]) for _ in range(self.rng.randint(1, 4))]
+        return [f"```{language}"] + '\n'.join(body).split('\n') + ['```', '']
+
+    def blockquote(self) -> List[str]:
+        lines = [f"> {self.inline_text()}"]
+        if self.rng.random() < 0.5:
+            lines.append(f"> - [ ] {self.words(self.rng.randint(3, 7))}")
+        return lines + ['']
+
+    def rule(self) -> List[str]:
+        return ['---', '']
+
+    def generate(self, target_bytes: int) -> str:
+        """Generate a document of roughly target_bytes (never less)"""
+        blocks = [
+            (self.header, 3), (self.activity_header, 1), (self.paragraph, 6),
+            (self.nested_list, 4), (self.table, 1), (self.code_block, 2),
+            (self.blockquote, 1), (self.rule, 1),
+        ]
+        makers = [maker for maker, weight in blocks for _ in range(weight)]
+
+        chunks = ["# Synthetic Benchmark Document", ""]
+        size = sum(len(chunk) + 1 for chunk in chunks)
+        while size < target_bytes:
+            for line in self.rng.choice(makers)():
+                chunks.append(line)
+                size += len(line.encode('utf-8')) + 1
+        return '\n'.join(chunks) + '\n'
+
+
+def generate_corpus(target_bytes: int, seed: int = 0) -> str:
+    """Generate a deterministic markdown document of roughly target_bytes"""
+    return MarkdownCorpusGenerator(seed).generate(target_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic markdown corpus for benchmarks")
+    parser.add_argument("--size", default="10KB", help="Target size, e.g. 1KB, 100MB (default: 10KB)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+
+    args = parser.parse_args()
+    content = generate_corpus(parse_size(args.size), args.seed)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f"📄 Wrote {len(content.encode('utf-8'))} bytes to {args.output}")
+    else:
+        sys.stdout.write(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Engine Benchmark Suite
+
+Runs the Engine entry points against generated vaults and documents at
+several scales and tracks the results over time:
+
+- backup:   JournalBackup.run on a generated vault
+- restorer: ActivityTodosRestorer.run (dry run, cold mention index)
+- simple:   SimpleMarkdownToHTMLConverter on a generated document
+- improved: ImprovedMarkdownToPDFConverter HTML rendering on a generated document
+
+Every run happens in a fresh interpreter, so wall time, CPU time and peak RSS
+belong to that run alone. Results (plus files/s and bytes/s) are stored as
+JSON keyed by commit in benchmarks/results/, and compared against a stored
+baseline: anything slower or bigger than the threshold is flagged and makes
+the exit code 1. Vaults come from vault_generator.py and are cached in the
+work directory, so only the first run at a scale pays for generating them.
+
+Usage:
+  python benchmarks/run_benchmarks.py                          # 1k/10k vaults, 100KB/1MB documents
+  python benchmarks/run_benchmarks.py --save-baseline          # Record this run as the baseline
+  python benchmarks/run_benchmarks.py --scales 1k 10k 100k --cases backup restorer
+  python benchmarks/run_benchmarks.py --threshold 0.05         # Flag regressions above 5%
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+BENCH_DIR = Path(__file__).resolve().parent
+ENGINE_DIR = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_FILE = RESULTS_DIR / "baseline.json"
+DEFAULT_WORK_DIR = Path(tempfile.gettempdir()) / "obsidian-engine-bench"
+sys.path.insert(0, str(ENGINE_DIR))
+
+from markdown_corpus import generate_corpus, parse_size
+from vault_generator import generate_vault, parse_count
+
+VAULT_CASES = ["backup", "restorer"]
+DOCUMENT_CASES = ["simple", "improved"]
+DEFAULT_SCALES = ["1k", "10k"]
+DEFAULT_SIZES = ["100KB", "1MB"]
+# Metrics compared with the baseline; higher is worse for all of them
+TRACKED_METRICS = ["wall_s", "cpu_s", "peak_rss_mb"]
+# Differences below these are noise, whatever the ratio
+MIN_DELTAS = {"wall_s": 0.02, "cpu_s": 0.02, "peak_rss_mb": 2.0}
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def folder_size(path: Path):
+    files = [item for item in path.rglob('*.md') if item.is_file()]
+    return len(files), sum(item.stat().st_size for item in files)
+
+
+def prepare_vault(work_dir: Path, scale: str) -> Path:
+    """Generated vault for a scale (e.g. 10k notes), reused when already complete"""
+    path = work_dir / f"vault-{scale}"
+    marker = path / ".complete"
+    if not marker.exists():
+        if path.exists():
+            shutil.rmtree(path)
+        notes = parse_count(scale)
+        print(f"🏗️  Generating {scale} vault in {path}...")
+        stats = generate_vault(path, notes=notes, activities=max(50, notes // 200))
+        marker.write_text(json.dumps(stats), encoding='utf-8')
+    return path
+
+
+def prepare_document(work_dir: Path, size: str) -> Path:
+    path = work_dir / f"document-{size}.md"
+    if not path.exists():
+        work_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate_corpus(parse_size(size), seed=0), encoding='utf-8')
+    return path
+
+
+def run_case(case: str, target: Path, scratch: Path) -> Dict[str, float]:
+    """Run one case in this process (worker side); returns its measurements"""
+    if case in DOCUMENT_CASES:
+        from bench_converters import render_improved, render_simple
+        if case == "simple":
+            from simple_html_converter import SimpleMarkdownToHTMLConverter as factory
+            render = render_simple
+        else:
+            from markdown_to_pdf_improved import ImprovedMarkdownToPDFConverter as factory
+            render = render_improved
+        files, size = 1, target.stat().st_size
+
+        def work():
+            render(factory(), target.read_text(encoding='utf-8'))
+    elif case == "backup":
+        from journal_backup import JournalBackup
+        files, size = folder_size(target / "Journal")
+
+        def work():
+            if not JournalBackup(str(target), backup_dir=str(scratch)).run():
+                raise RuntimeError("backup failed")
+    else:
+        from restore_activity_content import ActivityTodosRestorer
+        activity_files, activity_bytes = folder_size(target / "Activities")
+        journal_files, journal_bytes = folder_size(target / "Journal")
+        files, size = activity_files + journal_files, activity_bytes + journal_bytes
+
+        def work():
+            ActivityTodosRestorer(str(target), dry_run=True, summary_dir=str(scratch)).run()
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        work()
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    return {"wall_s": wall, "cpu_s": cpu, "peak_rss_mb": peak_rss_mb(), "files": files, "bytes": size}
+
+
+def measure(case: str, scale: str, target: Path, repeat: int) -> Dict[str, object]:
+    """Median of repeat runs, each in a fresh interpreter with empty caches"""
+    runs = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix="engine-bench-") as scratch:
+            env = dict(os.environ, XDG_CACHE_HOME=str(Path(scratch) / "cache"))
+            result = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--worker", case,
+                                     "--target", str(target), "--scratch", scratch],
+                                    cwd=ENGINE_DIR, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            error = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+            return {"case": case, "scale": scale, "error": error}
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    wall = statistics.median(run["wall_s"] for run in runs)
+    rss = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    files, size = runs[0]["files"], runs[0]["bytes"]
+    return {
+        "case": case,
+        "scale": scale,
+        "runs": len(runs),
+        "wall_s": wall,
+        "cpu_s": statistics.median(run["cpu_s"] for run in runs),
+        "peak_rss_mb": max(rss) if rss else None,
+        "files": files,
+        "bytes": size,
+        "files_per_s": files / wall if wall else None,
+        "bytes_per_s": size / wall if wall else None,
+    }
+
+
+def current_commit() -> str:
+    """Short hash of HEAD, with -dirty when the working tree has changes ('unknown' outside git)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ENGINE_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD", "--"], cwd=ENGINE_DIR).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def find_regressions(results: List[dict], baseline: dict, threshold: float) -> List[str]:
+    """Descriptions of the tracked metrics that got worse than baseline by more than threshold"""
+    previous = {(entry["case"], entry["scale"]): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["case"], entry["scale"]))
+        if not before or "error" in entry or "error" in before:
+            continue
+        for metric in TRACKED_METRICS:
+            old, new = before.get(metric), entry.get(metric)
+            if not old or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > MIN_DELTAS[metric]:
+                regressions.append(f"{entry['case']} {entry['scale']} {metric}: "
+                                   f"{old:.3f} -> {new:.3f} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_result(entry: dict) -> None:
+    if "error" in entry:
+        print(f"  ❌ {entry['case']:<9} {entry['scale']:>6}: {entry['error']}")
+        return
+    rss = f"{entry['peak_rss_mb']:7.1f} MB" if entry["peak_rss_mb"] is not None else "      -"
+    print(f"  📊 {entry['case']:<9} {entry['scale']:>6}: {entry['wall_s'] * 1000:9.1f} ms wall,"
+          f" {entry['cpu_s'] * 1000:9.1f} ms CPU, {rss} peak,"
+          f" {entry['files_per_s']:9.0f} files/s, {entry['bytes_per_s'] / (1024 * 1024):7.2f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Engine benchmark suite and check for regressions")
+    parser.add_argument("--cases", nargs="+", choices=VAULT_CASES + DOCUMENT_CASES,
+                        default=VAULT_CASES + DOCUMENT_CASES, help="Cases to run (default: all)")
+    parser.add_argument("--scales", nargs="+", default=DEFAULT_SCALES,
+                        help=f"Vault sizes in daily notes (default: {' '.join(DEFAULT_SCALES)})")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help=f"Document sizes for the converters (default: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, median is kept (default: 3)")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative increase flagged as a regression (default: 0.10)")
+    parser.add_argument("--baseline", type=str, help=f"Baseline results file (default: {BASELINE_FILE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--work-dir", type=str, default=str(DEFAULT_WORK_DIR),
+                        help=f"Where generated vaults and documents are kept (default: {DEFAULT_WORK_DIR})")
+    parser.add_argument("--worker", choices=VAULT_CASES + DOCUMENT_CASES, help=argparse.SUPPRESS)
+    parser.add_argument("--target", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--scratch", type=str, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_case(args.worker, Path(args.target), Path(args.scratch))))
+        return
+
+    print("🚀 Engine Benchmark Suite")
+    print("=" * 50)
+    work_dir = Path(args.work_dir)
+    commit = current_commit()
+    print(f"🔖 Commit: {commit}")
+
+    results = []
+    for case in args.cases:
+        if case in VAULT_CASES:
+            targets = [(scale, prepare_vault(work_dir, scale)) for scale in args.scales]
+        else:
+            targets = [(size, prepare_document(work_dir, size)) for size in args.sizes]
+        for scale, target in targets:
+            entry = measure(case, scale, target, args.repeat)
+            results.append(entry)
+            print_result(entry)
+
+    run = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_file = RESULTS_DIR / f"{commit}.json"
+    results_file.write_text(json.dumps(run, indent=2), encoding='utf-8')
+    print(f"\n📄 Results saved to: {results_file.relative_to(ENGINE_DIR)}")
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(run, indent=2), encoding='utf-8')
+        print(f"📌 Baseline updated: {BASELINE_FILE.relative_to(ENGINE_DIR)}")
+        return
+
+    baseline_file = Path(args.baseline) if args.baseline else BASELINE_FILE
+    if not baseline_file.exists():
+        print("💡 No baseline yet - run with --save-baseline to record one")
+        return
+    baseline = json.loads(baseline_file.read_text(encoding='utf-8'))
+    regressions = find_regressions(results, baseline, args.threshold)
+    print(f"📏 Compared with baseline {baseline.get('commit', '?')} (threshold {args.threshold:.0%})")
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"   • {regression}")
+        sys.exit(1)
+    print("\n🎉 No regressions")
+
+
+if __name__ == "__main__":
+    main()
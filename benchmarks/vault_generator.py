@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Synthetic Vault Generator
+
+Generates a deterministic vault shaped like ours for scale and performance
+testing of the offline tools (restorer, backup, indexes):
+
+- `Journal/YYYY/MM.Month/YYYY-MM-DD.md` daily notes with the daily note
+  template structure, standalone todos, callouts, code blocks, wikilinks and
+  `##### [[Activities/...]]` sections (some left empty, as after a lost sync)
+- `Activities/*.md` with template frontmatter (startDate, stage, responsible)
+  and a `[[YYYY-MM-DD]]` section for every daily note that works on them;
+  a share of activities is never worked on and has no dated sections
+
+Activity popularity is skewed (a few activities collect most of the dated
+sections, as real logs do) and note sizes follow a log-normal distribution
+around a median. The same arguments always produce the same files, including
+file mtimes, which are set to each note's date.
+
+Usage:
+  python benchmarks/vault_generator.py /tmp/vault-10k --notes 10k
+  python benchmarks/vault_generator.py /tmp/vault-100k --notes 100k --activities 500 --fan-out 3
+  python benchmarks/vault_generator.py /tmp/v --notes 1k --years 5 --note-size 4KB --seed 7
+"""
+
+import os
+import math
+import time
+import random
+import shutil
+import argparse
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from markdown_corpus import WORDS, MarkdownCorpusGenerator, parse_size
+
+DEFAULT_END_DATE = date(2025, 7, 31)
+STAGES = [("active", 4), ("planning", 3), ("completed", 2), ("archived", 1)]
+PEOPLE = ["Me", "Partner", "Team", "Mentor"]
+CALLOUT_TYPES = ["note", "tip", "warning", "info", "todo"]
+# Share of activity sections in daily notes left without content
+EMPTY_SECTION_RATE = 0.3
+
+
+def parse_count(text: str) -> int:
+    """Parse a count such as '1000', '10k' or '1M'"""
+    text = text.strip().lower()
+    multiplier = {'k': 1000, 'm': 1000000}.get(text[-1:], 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+
+class VaultGenerator:
+    """Builds a synthetic vault from a seed and size parameters."""
+
+    def __init__(self, notes: int = 1000, years: Optional[int] = None, activities: int = 50,
+                 fan_out: float = 2.0, note_size: int = 1024, section_size: int = 300, size_sigma: float = 0.8,
+                 idle_share: float = 0.2, end_date: date = DEFAULT_END_DATE, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.corpus = MarkdownCorpusGenerator(seed)
+        self.corpus.rng = self.rng
+        self.notes = notes
+        # Without a year count, the span is just long enough for a note every day
+        span_days = years * 365 if years else notes
+        if notes > span_days:
+            raise ValueError(f"{notes} daily notes do not fit in {years} years (one note per day)")
+        self.end_date = end_date
+        self.start_date = end_date - timedelta(days=span_days - 1)
+        self.corpus.start_date = self.start_date
+        self.activity_count = activities
+        # Average number of activity sections per daily note
+        self.fan_out = fan_out
+        # Share of activities never worked on in the journal (no dated sections)
+        self.idle_share = idle_share
+        # Median sizes in bytes; actual sizes are log-normal with size_sigma
+        self.note_size = note_size
+        self.section_size = section_size
+        self.size_sigma = size_sigma
+
+    def sample_size(self, median: int) -> int:
+        return max(64, int(self.rng.lognormvariate(math.log(median), self.size_sigma)))
+
+    def note_dates(self) -> List[date]:
+        span_days = (self.end_date - self.start_date).days + 1
+        offsets = range(span_days) if self.notes == span_days else sorted(self.rng.sample(range(span_days), self.notes))
+        return [self.start_date + timedelta(days=offset) for offset in offsets]
+
+    def activity_names(self) -> List[str]:
+        names = []
+        seen = set()
+        while len(names) < self.activity_count:
+            name = ' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(2, 3))).capitalize()
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                names.append(name)
+        return names
+
+    def todo(self) -> str:
+        marker = self.rng.choice(['- [ ] ', '- [ ] ', '- [x] '])
+        return marker + self.corpus.words(self.rng.randint(3, 9))
+
+    def plain_text(self) -> str:
+        """Sentence without links, for activity sections (an inline [[date]] would start a new section)"""
+        return self.corpus.words(self.rng.randint(5, 14)).capitalize() + '.'
+
+    def plain_paragraph(self) -> List[str]:
+        return [self.plain_text() for _ in range(self.rng.randint(1, 3))] + ['']
+
+    def callout(self, text=None) -> List[str]:
+        kind = self.rng.choice(CALLOUT_TYPES)
+        text = text or self.corpus.inline_text
+        lines = [f"> [!{kind}] {self.corpus.words(self.rng.randint(2, 4)).title()}"]
+        lines += [f"> {text()}" for _ in range(self.rng.randint(1, 3))]
+        if self.rng.random() < 0.4:
+            lines.append(f"> - [ ] {self.corpus.words(self.rng.randint(3, 7))}")
+        return lines + ['']
+
+    def body_lines(self, target_bytes: int, activity_links: List[str]) -> List[str]:
+        """Free-form content of roughly target_bytes: todos, text, lists, callouts, code and links"""
+        makers = [
+            (lambda: [self.todo() for _ in range(self.rng.randint(1, 4))] + [''], 4),
+            (self.corpus.paragraph, 4),
+            (self.corpus.nested_list, 2),
+            (self.callout, 1),
+            (self.corpus.code_block, 1),
+        ]
+        weighted = [maker for maker, weight in makers for _ in range(weight)]
+        lines = []
+        size = 0
+        while size < target_bytes:
+            for line in self.rng.choice(weighted)():
+                lines.append(line)
+                size += len(line) + 1
+            if activity_links and self.rng.random() < 0.2:
+                lines.append(f"- [ ] {self.corpus.words(3)} {self.rng.choice(activity_links)}")
+        return lines
+
+    def daily_note(self, day: date, sections: List[str]) -> str:
+        """Daily note in the template structure with activity sections for the given activities"""
+        week = day.isocalendar()[1]
+        links = [f"[[Activities/{name}.md|{name}]]" for name in sections]
+        lines = [
+            "---",
+            "---",
+            f"### {day.strftime('%d')} [[{day.year}-{day.strftime('%m')}|{day.strftime('%B')}]] [[{day.year}]]",
+            f"#### Week: [[{day.year}-W{week:02d}|{week}]]",
+            "",
+            "----",
+        ]
+        lines += self.body_lines(self.sample_size(self.note_size), links)
+        lines += ["----", "", "### Activities:", "----"]
+        for name in sections:
+            lines.append(f"##### [[Activities/{name}.md|{name}]]")
+            if self.rng.random() >= EMPTY_SECTION_RATE:
+                lines += [self.todo() for _ in range(self.rng.randint(1, 3))]
+            lines.append("----")
+        return '\n'.join(lines) + '\n'
+
+    def activity_section(self, day: date) -> List[str]:
+        """Dated section of an activity file"""
+        lines = [f"[[{day.isoformat()}]]"]
+        lines += [self.todo() for _ in range(self.rng.randint(1, 4))]
+        size = sum(len(line) + 1 for line in lines)
+        target = self.sample_size(self.section_size)
+        while size < target:
+            chunk = self.rng.choice([self.plain_paragraph, lambda: self.callout(self.plain_text),
+                                     self.corpus.code_block, lambda: [self.todo()]])()
+            lines += chunk
+            size += sum(len(line) + 1 for line in chunk)
+        return lines + ['']
+
+    def activity_header(self, start: date) -> List[str]:
+        stage = self.rng.choices([stage for stage, _ in STAGES], [weight for _, weight in STAGES])[0]
+        responsible = ', '.join(self.rng.sample(PEOPLE, self.rng.randint(1, 2)))
+        return ["---", f"startDate: {start.isoformat()}", f"stage: {stage}", f"responsible: [{responsible}]",
+                "---", "", self.plain_text(), ""]
+
+    def generate(self, output: Path) -> Dict[str, int]:
+        """Write the vault under output; returns file and byte counts"""
+        names = self.activity_names()
+        worked_on = names[int(len(names) * self.idle_share):] or names
+        # Skewed popularity: a few activities get most of the sections
+        weights = [1 / (rank + 1) for rank in range(len(worked_on))]
+        self.rng.shuffle(weights)
+        activity_sections: Dict[str, List[str]] = {name: [] for name in names}
+        first_mention: Dict[str, date] = {}
+        stats = {"daily_notes": 0, "activities": 0, "activity_sections": 0, "bytes": 0}
+
+        for day in self.note_dates():
+            count = min(len(worked_on), int(self.rng.expovariate(1 / self.fan_out) + 0.5)) if self.fan_out else 0
+            sections = []
+            while len(sections) < count:
+                name = self.rng.choices(worked_on, weights)[0]
+                if name not in sections:
+                    sections.append(name)
+            for name in sections:
+                activity_sections[name].extend(self.activity_section(day))
+                first_mention.setdefault(name, day)
+            stats["activity_sections"] += len(sections)
+
+            path = output / "Journal" / str(day.year) / day.strftime('%m.%B') / f"{day.isoformat()}.md"
+            stats["bytes"] += self.write(path, self.daily_note(day, sections), day)
+            stats["daily_notes"] += 1
+
+        for name in names:
+            start = first_mention.get(name, self.end_date)
+            lines = self.activity_header(start) + activity_sections.pop(name)
+            stats["bytes"] += self.write(output / "Activities" / f"{name}.md", '\n'.join(lines) + '\n', self.end_date)
+            stats["activities"] += 1
+        return stats
+
+    @staticmethod
+    def write(path: Path, content: str, day: date) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(data)
+        # mtime at noon of the note's day, so mtime-based caches and backups see a realistic history
+        timestamp = max(datetime(day.year, day.month, day.day, 12).timestamp(), 0)
+        os.utime(path, (timestamp, timestamp))
+        return len(data)
+
+
+def generate_vault(output, notes: int = 1000, seed: int = 0, **options) -> Dict[str, int]:
+    """Generate a vault under output (which must not contain one yet); returns file and byte counts"""
+    return VaultGenerator(notes=notes, seed=seed, **options).generate(Path(output))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic vault for benchmarks")
+    parser.add_argument("output", help="Directory to create the vault in")
+    parser.add_argument("--notes", type=parse_count, default=1000, help="Number of daily notes, e.g. 1k, 100k (default: 1k)")
+    parser.add_argument("--years", type=int,
+                        help="Years the journal spans (default: just enough for a note every day)")
+    parser.add_argument("--activities", type=parse_count, default=50, help="Number of activity files (default: 50)")
+    parser.add_argument("--fan-out", type=float, default=2.0,
+                        help="Average activity sections per daily note (default: 2)")
+    parser.add_argument("--idle-share", type=float, default=0.2,
+                        help="Share of activities without any dated section (default: 0.2)")
+    parser.add_argument("--note-size", default="1KB", help="Median daily note body size (default: 1KB)")
+    parser.add_argument("--section-size", default="300B", help="Median activity section size (default: 300B)")
+    parser.add_argument("--size-sigma", type=float, default=0.8,
+                        help="Spread of the log-normal size distribution (default: 0.8)")
+    parser.add_argument("--end-date", type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+                        default=DEFAULT_END_DATE, help=f"Date of the last daily note (default: {DEFAULT_END_DATE})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--force", action="store_true", help="Replace the output directory if it exists")
+
+    args = parser.parse_args()
+    output = Path(args.output)
+    if output.exists() and any(output.iterdir()):
+        if not args.force:
+            parser.error(f"{output} is not empty (use --force to replace it)")
+        shutil.rmtree(output)
+
+    try:
+        generator = VaultGenerator(notes=args.notes, years=args.years, activities=args.activities,
+                                   fan_out=args.fan_out, idle_share=args.idle_share, note_size=parse_size(args.note_size),
+                                   section_size=parse_size(args.section_size), size_sigma=args.size_sigma,
+                                   end_date=args.end_date, seed=args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print("🚀 Synthetic Vault Generator")
+    print("=" * 50)
+    start_time = time.perf_counter()
+    stats = generator.generate(output)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"📂 Vault: {output.resolve()}")
+    print(f"📅 Journal: {stats['daily_notes']} daily notes, {generator.start_date} to {generator.end_date}")
+    print(f"📁 Activities: {stats['activities']} files, {stats['activity_sections']} dated sections")
+    print(f"💾 Size: {stats['bytes'] / 1024 / 1024:.1f} MB")
+    print(f"✅ Generated in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Chunked Parallel PDF Rendering
+
+Rendering a very large manual through a single WeasyPrint `write_pdf` call is
+single-threaded and keeps the whole box tree in memory. This module splits the
+document body at top-level <h1>/<h2> boundaries, renders the chunks in worker
+processes and merges the chunk PDFs into one file:
+
+- page footers ("Page N of M") are removed from the chunks and stamped onto
+  the merged document, so numbering is continuous
+- each chunk's bookmarks are imported, giving one combined outline
+
+Every chunk starts on a new page. Links from the table of contents to
+sections in other chunks are not preserved.
+
+Requirements: pip install weasyprint pypdf
+"""
+
+import os
+import re
+import time
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import instrumentation
+from weasyprint_worker import get_renderer
+
+# Top-level headings emitted by the markdown converter start at column 0
+SECTION_BOUNDARY = re.compile(r'^<h[12][\s>]', re.MULTILINE)
+
+# Appended to the stylesheet for chunk rendering: page numbers are stamped after merging
+CHUNK_CSS = """
+@page { @bottom-right { content: none; } }
+"""
+
+PAGE_NUMBER_CSS = """
+@page {
+    size: A4;
+    margin: 2cm;
+    @bottom-right {
+        content: "Page " counter(page) " of " counter(pages);
+        font-size: 9pt;
+        color: #666;
+    }
+}
+body { margin: 0; }
+div + div { break-before: page; }
+"""
+
+
+def split_sections(body_html: str) -> List[str]:
+    """Split body HTML into sections that each start at a top-level <h1>/<h2>"""
+    starts = [match.start() for match in SECTION_BOUNDARY.finditer(body_html)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    starts.append(len(body_html))
+    return [body_html[start:end] for start, end in zip(starts, starts[1:]) if body_html[start:end].strip()]
+
+
+def group_sections(sections: List[str], chunk_count: int) -> List[str]:
+    """Join consecutive sections into at most chunk_count chunks of similar size"""
+    total_size = sum(len(section) for section in sections)
+    target_size = max(1, total_size // max(1, chunk_count))
+    chunks = []
+    current = []
+    current_size = 0
+
+    for section in sections:
+        if current and current_size >= target_size and len(chunks) < chunk_count - 1:
+            chunks.append(''.join(current))
+            current = []
+            current_size = 0
+        current.append(section)
+        current_size += len(section)
+
+    if current:
+        chunks.append(''.join(current))
+    return chunks
+
+
+def render_chunk(css_text: str, html_content: str, output_path: str) -> Dict[str, float]:
+    """Render one chunk in a worker process and return its timings"""
+    timings = get_renderer(css_text + CHUNK_CSS).render(html_content, output_path)
+    timings['pid'] = os.getpid()
+    return timings
+
+
+def render_page_number_stamp(page_count: int, output_path: str) -> None:
+    """Render an otherwise empty document whose pages only carry the footer"""
+    html_content = '<html><body>' + '<div>&nbsp;</div>' * page_count + '</body></html>'
+    get_renderer(PAGE_NUMBER_CSS).render(html_content, output_path)
+
+
+def merge_chunks(chunk_paths: List[str], output_path: str, stamp_path: Optional[str] = None) -> int:
+    """Merge chunk PDFs (with their outlines) and stamp page numbers; returns page count"""
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for chunk_path in chunk_paths:
+        writer.append(chunk_path, import_outline=True)
+
+    if stamp_path:
+        stamp_pages = PdfReader(stamp_path).pages
+        for page, stamp_page in zip(writer.pages, stamp_pages):
+            page.merge_page(stamp_page)
+
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+    return len(writer.pages)
+
+
+def render_chunked(chunks: List[str], css_text: str, output_path: str, jobs: int) -> bool:
+    """Render HTML chunks in parallel and merge them into output_path"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with tempfile.TemporaryDirectory(prefix='pdf_chunks_') as temp_dir:
+        chunk_paths = [str(Path(temp_dir) / f"chunk_{index:04d}.pdf") for index in range(len(chunks))]
+
+        start_time = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [instrumentation.submit(pool, f"render chunk {index + 1}", render_chunk, css_text, chunk, path)
+                       for index, (chunk, path) in enumerate(zip(chunks, chunk_paths))]
+            chunk_timings = [instrumentation.result(future) for future in futures]
+        render_seconds = time.perf_counter() - start_time
+
+        for index, timings in enumerate(chunk_timings):
+            print(f"  📄 Chunk {index + 1}/{len(chunks)}: {timings['pages']} pages, "
+                  f"{timings['total_ms'] / 1000:.1f}s (worker {timings['pid']})")
+
+        start_time = time.perf_counter()
+        page_count = sum(timings['pages'] for timings in chunk_timings)
+        stamp_path = str(Path(temp_dir) / "page_numbers.pdf")
+        with instrumentation.phase("merge chunks", pages=page_count):
+            render_page_number_stamp(page_count, stamp_path)
+            merge_chunks(chunk_paths, output_path, stamp_path)
+        merge_seconds = time.perf_counter() - start_time
+
+    print(f"⏱️  Rendered {len(chunks)} chunks in {render_seconds:.1f}s, merged {page_count} pages in {merge_seconds:.1f}s")
+    return True
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Directive Batch Processor
+
+Applies the `{attribute op value}` directives found in daily notes to the
+frontmatter of the activities they mention, for every activity at once
+instead of only when an activity is opened in Obsidian.
+
+Usage:
+  python directives.py                      # Preview: show a diff per activity (default)
+  python directives.py --auto               # Write the activity files
+  python directives.py --since 2025-07-01   # Only scan daily notes from this date on
+"""
+
+import sys
+import time
+import argparse
+from datetime import datetime
+
+from vault.directives import DirectiveEngine
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Apply daily note directives to activity frontmatter")
+    parser.add_argument("--dry-run", action="store_true", default=True,
+                       help="Preview changes without making them (default)")
+    parser.add_argument("--auto", action="store_true",
+                       help="Write the activity files without prompts")
+    parser.add_argument("--since", type=parse_date, help="Only scan daily notes from this date (YYYY-MM-DD)")
+    parser.add_argument("--no-ledger", action="store_true",
+                       help="Ignore the record of already applied directives and apply every directive again")
+    parser.add_argument("--vault-path", type=str, default="..",
+                       help="Path to vault root (default: .. from Engine directory)")
+
+    args = parser.parse_args()
+    dry_run = not args.auto
+    mode_text = "[DRY RUN] " if dry_run else ""
+
+    print("🚀 Directive Batch Processor")
+    print("=" * 50)
+
+    start_time = time.perf_counter()
+    engine = DirectiveEngine(args.vault_path, dry_run=dry_run, use_ledger=not args.no_ledger)
+    result = engine.run(args.since)
+    elapsed = time.perf_counter() - start_time
+
+    changed = 0
+    for activity, outcome in result["activities"].items():
+        directives = outcome["directives"]
+        print(f"\n📁 {activity}: {len(directives)} directives")
+        for directive in directives:
+            print(f"  📅 {directive.page}:{directive.line} {directive.text()}")
+        if outcome["diff"]:
+            changed += 1
+            if dry_run:
+                print(outcome["diff"].rstrip('\n'))
+        else:
+            print(f"  ⏭️  Frontmatter already up to date")
+    for activity, error in result["errors"].items():
+        print(f"\n❌ {activity}: {error}")
+
+    print(f"\n✅ {mode_text}Directives processed in {elapsed:.2f}s")
+    print(f"📊 Summary:")
+    print(f"   - Activities with directives: {len(result['activities'])}")
+    print(f"   - Activity files {'to update' if dry_run else 'updated'}: {changed}")
+    if dry_run and changed:
+        print(f"\n💡 To actually make changes, run with --auto")
+    if result["errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
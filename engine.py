@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Engine Command Line
+
+One entry point for the Engine scripts. Each subcommand runs the main() of an
+existing script, and that script is imported only when its subcommand is
+invoked, so `engine --help` and `engine backup` never load the Markdown or PDF
+stacks. Everything after the subcommand goes to the script's own parser.
+
+Usage:
+  python engine.py --help                              # List subcommands
+  python engine.py backup --compress-level 9           # journal_backup.py
+  python engine.py restore-activities --from 2025-07-01 --auto
+  python engine.py html notes.md --watch               # simple_html_converter.py
+  python engine.py pdf -i ../Activities --output-dir pdf/ -j 4
+  python engine.py validate --deep                     # LM_context/dynamic/assumption-validator.py
+  python engine.py daemon --status                     # engine_daemon.py
+"""
+
+import os
+import sys
+import argparse
+
+ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Subcommand -> (module, or script path relative to the Engine directory, summary)
+COMMANDS = {
+    "backup": ("journal_backup", "Create a compressed backup of the Journal directory"),
+    "restore-activities": ("restore_activity_content", "Restore activity content to daily notes"),
+    "html": ("simple_html_converter", "Convert markdown to styled HTML, optionally with live preview"),
+    "pdf": ("markdown_to_pdf_improved", "Convert markdown files to PDF"),
+    "validate": ("LM_context/dynamic/assumption-validator.py", "Validate project assumptions and scan the vault"),
+    "activities": ("activities", "List activities in progress"),
+    "mentions": ("mentions", "Query the [[wikilink]] mention index"),
+    "directives": ("directives", "Apply {directive} blocks from daily notes to activity frontmatter"),
+    "rollover": ("rollover", "Roll incomplete todos forward over a range of dates"),
+    "daemon": ("engine_daemon", "Keep the parsed vault in memory for the other commands"),
+}
+
+
+def load_command(target: str):
+    """Import the module behind a subcommand"""
+    import importlib
+    if not target.endswith(".py"):
+        return importlib.import_module(target)
+    import importlib.util
+
+    # Scripts whose file name is not a module name are loaded from their path
+    name = os.path.splitext(os.path.basename(target))[0].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ENGINE_DIR, target))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="engine",
+        description="Obsidian Engine tools",
+        epilog="Run 'engine <command> --help' for the options of a command."
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+    for name, (_, summary) in COMMANDS.items():
+        # No options of their own: everything after the command is passed through unparsed
+        subparsers.add_parser(name, help=summary, add_help=False)
+
+    args, command_args = parser.parse_known_args(argv)
+    module = load_command(COMMANDS[args.command][0])
+
+    # The script parses sys.argv itself; its usage line reads "engine <command>"
+    sys.argv = [f"engine {args.command}"] + command_args
+    module.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Engine Daemon
+
+Keeps the parsed vault in memory — every note's blocks, frontmatter, mentions,
+date markers and deep-scan counters (vault/state.py) — and answers queries on
+a per-vault Unix socket, so the restorer, the validator and the converters skip
+walking and parsing the vault when it is running. They fall back to parsing
+the notes themselves when it is not (vault/daemon.py).
+
+The vault is parsed once at startup. After that inotify reports every created,
+written, moved or deleted note, and only those are re-parsed; pending events
+are applied before each request is answered, so a query sees a note saved
+just before it. Without inotify (or with --force-polling) the vault is
+re-checked every --poll-interval seconds instead.
+
+Protocol: one JSON object per line in each direction, e.g.
+    {"op": "date_markers", "folder": "Activities"}
+    {"ok": true, "result": {"Activities/Shopping.md": ["2025-07-01", ...]}}
+Operations: ping, stats, notes, date_markers, mentions, frontmatter,
+note_stats, blocks, refresh, shutdown.
+
+Usage:
+  python engine_daemon.py                       # Serve the vault around Engine/ until stopped
+  python engine_daemon.py --vault-path /tmp/v   # Serve another vault
+  python engine_daemon.py --status              # Is a daemon running? What does it hold?
+  python engine_daemon.py --stop                # Ask the running daemon to exit
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+from pathlib import Path
+from typing import Any, Optional
+
+from vault.daemon import send_request, socket_path
+from vault.state import VaultState
+
+# Request lines are small; responses (e.g. note_stats of a large vault) may be megabytes
+REQUEST_LIMIT = 1024 * 1024
+
+
+class EngineDaemon:
+    """Serves an in-memory VaultState on a Unix socket, kept current by inotify or polling."""
+
+    def __init__(self, vault_path: str = "..", poll_interval: float = 5.0, force_polling: bool = False):
+        self.state = VaultState(vault_path)
+        self.socket_path = socket_path(self.state.vault_path)
+        self.poll_interval = poll_interval
+        self.force_polling = force_polling
+        self.watcher = None
+        self.started = time.time()
+        self.requests = 0
+        self.updates = 0
+        self.stopping: Optional[asyncio.Event] = None
+        self.clients = {}
+
+    def start_watcher(self) -> None:
+        """Watch the vault with inotify; polling is used when it is unavailable"""
+        if self.force_polling or not sys.platform.startswith('linux'):
+            return
+        from file_watcher import InotifyTreeWatcher
+        try:
+            self.watcher = InotifyTreeWatcher([self.state.vault_path], self.state.skip_directory)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), re-checking the vault every {self.poll_interval:g}s")
+
+    def apply_events(self) -> None:
+        """Re-parse the notes behind pending inotify events"""
+        if self.watcher is None:
+            return
+        changed = self.watcher.read_events()
+        if changed is None:
+            # The kernel dropped events: only a full walk can tell what changed
+            print("⚠️  inotify queue overflowed, re-checking the whole vault")
+            parsed, removed = self.state.refresh()
+        elif changed:
+            parsed, removed = self.state.update_paths(changed)
+        else:
+            return
+        if parsed or removed:
+            self.updates += 1
+            print(f"🔄 Re-parsed {parsed} notes, removed {removed}")
+
+    def handle(self, request: dict) -> Any:
+        """Result of one request (raises ValueError/KeyError on a bad one)"""
+        op = request.get("op")
+        state = self.state
+        if op == "ping":
+            return {"pid": os.getpid(), "vault": str(state.vault_path)}
+        if op == "stats":
+            return dict(state.summary(), pid=os.getpid(), vault=str(state.vault_path),
+                        uptime_s=round(time.time() - self.started, 1), requests=self.requests,
+                        updates=self.updates, watching="inotify" if self.watcher else "polling")
+        if op == "notes":
+            return state.pages(request.get("folder"))
+        if op == "date_markers":
+            return state.date_markers(request.get("folder", "Activities"))
+        if op == "mentions":
+            return state.mentions(request["target"], request.get("block_types"))
+        if op == "frontmatter":
+            return state.frontmatter(request.get("folder"))
+        if op == "note_stats":
+            return state.note_stats(request.get("folder"))
+        if op == "blocks":
+            return state.blocks(request["page"])
+        if op == "refresh":
+            parsed, removed = state.refresh()
+            return {"parsed": parsed, "removed": removed}
+        if op == "shutdown":
+            self.stopping.set()
+            return {"pid": os.getpid()}
+        raise ValueError(f"unknown op: {op!r}")
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.clients[asyncio.current_task()] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.requests += 1
+                try:
+                    self.apply_events()
+                    response = {"ok": True, "result": self.handle(json.loads(line))}
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # Client went away or sent an oversized line
+        finally:
+            del self.clients[asyncio.current_task()]
+            writer.close()
+
+    async def poll(self) -> None:
+        """Re-check the whole vault periodically when there is no inotify"""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            parsed, removed = self.state.refresh()
+            if parsed or removed:
+                self.updates += 1
+                print(f"🔄 Re-parsed {parsed} notes, removed {removed}")
+
+    async def serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self.stopping.set)
+
+        # Watch before the initial parse, so notes saved while it runs are picked up afterwards
+        self.start_watcher()
+        start_time = time.perf_counter()
+        self.state.refresh()
+        self.apply_events()
+        summary = self.state.summary()
+        print(f"🧠 Parsed {summary['notes']} notes ({summary['bytes'] / (1024 * 1024):.1f} MB, "
+              f"{summary['blocks']} blocks) in {time.perf_counter() - start_time:.2f}s")
+
+        poller = None
+        if self.watcher is not None:
+            loop.add_reader(self.watcher.fileno(), self.apply_events)
+        else:
+            poller = asyncio.create_task(self.poll())
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = await asyncio.start_unix_server(self.serve_client, path=str(self.socket_path),
+                                                 limit=REQUEST_LIMIT)
+        os.chmod(self.socket_path, 0o600)
+        print(f"🛰️  Serving {self.state.vault_path} on {self.socket_path}")
+        try:
+            await self.stopping.wait()
+        finally:
+            server.close()
+            # Closing a connection ends its client's readline(), so every handler returns on its own
+            for writer in list(self.clients.values()):
+                writer.close()
+            await asyncio.gather(*self.clients, return_exceptions=True)
+            await server.wait_closed()
+            if poller is not None:
+                poller.cancel()
+            if self.watcher is not None:
+                loop.remove_reader(self.watcher.fileno())
+                self.watcher.close()
+            self.socket_path.unlink(missing_ok=True)
+            print(f"👋 Daemon stopped after {self.requests} requests")
+
+    def run(self) -> bool:
+        """Serve until stopped; returns False when another daemon already serves the vault"""
+        if self.socket_path.exists():
+            if ping(self.socket_path) is not None:
+                print(f"❌ A daemon is already serving {self.state.vault_path} ({self.socket_path})")
+                return False
+            self.socket_path.unlink()  # Left behind by a daemon that did not exit cleanly
+        asyncio.run(self.serve())
+        return True
+
+
+def ping(path: Path) -> Optional[dict]:
+    """The ping result of the daemon on a socket, or None when nothing answers"""
+    try:
+        response = send_request(path, {"op": "ping"}, timeout=5.0)
+    except (OSError, ValueError):
+        return None
+    return response.get("result")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Keep the parsed vault in memory and serve it to the Engine scripts")
+    parser.add_argument("--vault-path", type=str, default="..",
+                        help="Path to vault root (default: .. from Engine directory)")
+    parser.add_argument("--poll-interval", type=float, default=5.0,
+                        help="Seconds between vault re-checks when inotify is unavailable (default: 5)")
+    parser.add_argument("--force-polling", action="store_true", help="Re-check the vault periodically instead of inotify")
+    parser.add_argument("--status", action="store_true", help="Show whether a daemon is serving the vault and what it holds")
+    parser.add_argument("--stop", action="store_true", help="Stop the daemon serving the vault")
+
+    args = parser.parse_args()
+    path = socket_path(args.vault_path)
+
+    if args.status or args.stop:
+        if ping(path) is None:
+            print(f"💤 No daemon is serving {Path(args.vault_path).resolve()}")
+            sys.exit(1)
+        if args.stop:
+            response = send_request(path, {"op": "shutdown"})
+            print(f"🛑 Stopping daemon (pid {response['result']['pid']})")
+            return
+        stats = send_request(path, {"op": "stats"})["result"]
+        print(f"🛰️  Daemon pid {stats['pid']} serving {stats['vault']} for {stats['uptime_s']:.0f}s ({stats['watching']})")
+        print(f"📊 {stats['notes']} notes, {stats['blocks']} blocks, {stats['mentions']} mentions of "
+              f"{stats['targets']} targets, {stats['bytes'] / (1024 * 1024):.1f} MB")
+        print(f"📨 {stats['requests']} requests, {stats['updates']} updates")
+        return
+
+    daemon = EngineDaemon(args.vault_path, args.poll_interval, args.force_polling)
+    if not daemon.run():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+File Watcher Utility
+
+Watches a set of files for changes using Linux inotify, falling back to
+mtime polling on other platforms. Bursts of saves are debounced into a
+single batch of changed paths. InotifyTreeWatcher watches whole directory
+trees instead, including directories created after it started.
+
+No external dependencies required - uses only Python standard library.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0x00080000
+
+INOTIFY_EVENT = struct.Struct('iIII')
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+TREE_WATCH_MASK = WATCH_MASK | IN_MOVED_FROM | IN_DELETE
+
+
+class PollingWatcher:
+    """Detect changes by comparing file modification times."""
+
+    def __init__(self, paths: Iterable[Path], interval: float = 0.05):
+        self.paths = [Path(p).resolve() for p in paths]
+        self.interval = interval
+        self.mtimes = {path: self.get_mtime(path) for path in self.paths}
+
+    def get_mtime(self, path: Path) -> Optional[int]:
+        """Return the file mtime in nanoseconds, or None if missing"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until at least one file changed or the timeout expires"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                mtime = self.get_mtime(path)
+                if mtime != self.mtimes[path]:
+                    self.mtimes[path] = mtime
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        """Release watcher resources"""
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes through Linux inotify on the parent directories.
+
+    Directories are watched instead of the files themselves so that editors
+    which save by writing a temporary file and renaming it are still seen.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        self.paths = {Path(p).resolve() for p in paths}
+        self.libc, self.fd = open_inotify()
+
+        self.watch_dirs: Dict[int, Path] = {}
+        for directory in sorted({path.parent for path in self.paths}):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                self.close()
+                raise OSError(error, f"inotify_add_watch failed for {directory}")
+            self.watch_dirs[wd] = directory
+
+    def read_events(self) -> Set[Path]:
+        """Drain pending inotify events and return the watched files they touch"""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, name_len = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                name = data[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+                directory = self.watch_dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until at least one file changed or the timeout expires"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self.read_events()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+    def close(self) -> None:
+        """Release the inotify file descriptor"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class InotifyTreeWatcher:
+    """Detect changes anywhere below some directories through Linux inotify.
+
+    Every directory of the trees is watched, and directories created or moved
+    into them later are added as their events arrive. read_events() reports
+    created, written, moved and deleted paths, directories included.
+    """
+
+    def __init__(self, roots: Iterable[Path], skip_directory: Optional[Callable[[Path], bool]] = None):
+        self.skip_directory = skip_directory or (lambda directory: False)
+        self.libc, self.fd = open_inotify()
+        self.watch_dirs: Dict[int, Path] = {}
+        for root in roots:
+            self.add_tree(Path(root).resolve())
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def add_tree(self, top: Path) -> None:
+        """Watch top and every directory below it that is not skipped"""
+        for root, dirs, _ in os.walk(top):
+            root_path = Path(root)
+            dirs[:] = [d for d in dirs if not self.skip_directory(root_path / d)]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(root_path), TREE_WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error == errno.ENOENT:
+                    continue  # Removed while walking
+                raise OSError(error, f"inotify_add_watch failed for {root_path}")
+            # A directory moved within the tree keeps its watch descriptor; this records its new path
+            self.watch_dirs[wd] = root_path
+
+    def read_events(self) -> Optional[Set[Path]]:
+        """Drain pending events; returns the changed paths, or None when the kernel queue overflowed"""
+        changed = set()
+        overflowed = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, name_len = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                name = data[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+                if mask & IN_Q_OVERFLOW:
+                    overflowed = True
+                    continue
+                if mask & IN_IGNORED:
+                    self.watch_dirs.pop(wd, None)
+                    continue
+                directory = self.watch_dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and not self.skip_directory(path):
+                    self.add_tree(path)
+                changed.add(path)
+        return None if overflowed else changed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_inotify():
+    """Return (libc, non-blocking inotify file descriptor)"""
+    libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+    libc = ctypes.CDLL(libc_name, use_errno=True)
+    fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    return libc, fd
+
+
+def create_watcher(paths: Iterable[Path], force_polling: bool = False):
+    """Create an inotify watcher when available, otherwise a polling watcher"""
+    paths = list(paths)
+    if not force_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(paths)
+
+
+def debounced_changes(watcher, quiet_period: float = 0.03) -> Iterator[Set[Path]]:
+    """Yield batches of changed paths once saves have been quiet for quiet_period seconds"""
+    while True:
+        changed = watcher.wait()
+        while True:
+            more = watcher.wait(timeout=quiet_period)
+            if not more:
+                break
+            changed |= more
+        yield changed
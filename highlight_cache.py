@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Syntax Highlighting Cache
+
+`markdown.extensions.codehilite` lexes and formats every code block with
+Pygments on every conversion, which dominates the conversion time of
+code-heavy manuals that repeat the same snippets. This module caches the
+highlighted HTML of each block:
+
+- entries are keyed by a hash of the code, its language and every option that
+  affects the output (formatter options, Pygments version)
+- the cache is a SQLite file, so it persists between runs and is shared by all
+  batch worker processes
+- the number of entries is bounded; the least recently used are evicted
+
+Usage:
+    cache = HighlightCache(DEFAULT_CACHE_PATH)
+    install_highlight_cache(cache)   # Patches CodeHilite.hilite for this process
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'obsidian-engine'
+DEFAULT_CACHE_PATH = DEFAULT_CACHE_DIR / 'highlight_cache.sqlite3'
+DEFAULT_MAX_ENTRIES = 20000
+
+# Entries over the limit are evicted in batches so most inserts don't pay for it
+EVICTION_SLACK = 0.1
+
+# Cache used by the patched CodeHilite.hilite in this process
+_active_cache: Optional['HighlightCache'] = None
+_original_hilite = None
+
+
+class HighlightCache:
+    """SQLite-backed LRU cache of highlighted code blocks."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        import sqlite3
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Several batch workers write concurrently; WAL lets readers proceed during writes
+        self.connection = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS highlights ("
+            "key TEXT PRIMARY KEY, html TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS highlights_last_used ON highlights(last_used)")
+        self.entry_count = self.connection.execute("SELECT COUNT(*) FROM highlights").fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached HTML for key and mark it as recently used"""
+        row = self.connection.execute("SELECT html FROM highlights WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute("UPDATE highlights SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, key: str, html: str) -> None:
+        """Store highlighted HTML, evicting the least recently used entries when full"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO highlights (key, html, last_used) VALUES (?, ?, ?)",
+            (key, html, time.time())
+        )
+        self.entry_count += 1
+        if self.entry_count > self.max_entries * (1 + EVICTION_SLACK):
+            self.evict()
+
+    def evict(self) -> None:
+        """Trim the cache to max_entries, dropping the least recently used entries"""
+        self.connection.execute(
+            "DELETE FROM highlights WHERE key IN ("
+            "SELECT key FROM highlights ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self.entry_count = self.connection.execute("SELECT COUNT(*) FROM highlights").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self.connection.execute("DELETE FROM highlights")
+        self.entry_count = 0
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def make_key(hiliter, shebang: bool) -> str:
+    """Hash everything that determines the HTML produced by CodeHilite.hilite()"""
+    import pygments
+
+    key_data = [
+        pygments.__version__,
+        hiliter.lang,
+        shebang,
+        hiliter.guess_lang,
+        hiliter.use_pygments,
+        hiliter.lang_prefix,
+        hiliter.pygments_formatter,
+        sorted((name, repr(value)) for name, value in hiliter.options.items()),
+    ]
+    digest = hashlib.sha256(json.dumps(key_data).encode('utf-8'))
+    digest.update(hiliter.src.strip('\n').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cached_hilite(self, shebang=True):
+    """Replacement for CodeHilite.hilite that consults the active cache first"""
+    cache = _active_cache
+    # Custom formatter classes can't be part of a stable key
+    if cache is None or not isinstance(self.pygments_formatter, str):
+        return _original_hilite(self, shebang)
+
+    key = make_key(self, shebang)
+    html = cache.get(key)
+    if html is None:
+        html = _original_hilite(self, shebang)
+        cache.put(key, html)
+    return html
+
+
+def install_highlight_cache(cache: Optional[HighlightCache]) -> None:
+    """Route codehilite highlighting in this process through cache (None disables it)"""
+    global _active_cache, _original_hilite
+    from markdown.extensions.codehilite import CodeHilite
+
+    if _original_hilite is None:
+        _original_hilite = CodeHilite.hilite
+        CodeHilite.hilite = cached_hilite
+    _active_cache = cache
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Instrumentation
+
+Phase timers, cProfile and tracemalloc capture, and Chrome trace-event export
+shared by the Engine scripts. Every script accepts `--profile DIR`; without it
+nothing is recorded and phase() returns a shared no-op context manager, so
+instrumented code costs one function call per phase.
+
+With `--profile DIR` a run writes:
+- phases.json:      per-phase count/total/min/max and the top allocation sites
+- trace.json:       Chrome trace events (open in chrome://tracing or Perfetto);
+                    threads and worker processes each get their own track
+- profile.prof/txt: cProfile of the main thread (pstats file and top functions)
+- allocations.txt:  top tracemalloc allocation sites by size, taken when a
+                    top-level phase ends with more memory live than any before
+
+Usage:
+    from instrumentation import add_profile_argument, phase, start_profiling
+    add_profile_argument(parser)
+    start_profiling(args.profile, "journal_backup")   # No-op when args.profile is None
+    with phase("archive", files=count):
+        ...
+
+Work done in worker processes is put on the timeline by submitting it with
+submit(pool, name, fn, ...) and reading it back with result(future): when
+profiling is on the worker times the call with traced() and the parent records
+the span on the worker's own track.
+"""
+
+import os
+import time
+import atexit
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# cProfile, tracemalloc and json are imported on first use, so the scripts pay nothing for them unprofiled
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+class NullPhase:
+    """Context manager that does nothing, returned by phase() when profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_PHASE = NullPhase()
+
+
+class Phase:
+    """One timed phase; appends a complete (ph: X) trace event when it ends."""
+
+    __slots__ = ("session", "name", "args", "start_us", "top_level")
+
+    def __init__(self, session: "ProfileSession", name: str, args: Dict[str, Any]):
+        self.session = session
+        self.name = name
+        self.args = args
+        self.start_us = 0
+        self.top_level = False
+
+    def __enter__(self):
+        session = self.session
+        if threading.get_ident() == session.main_thread:
+            self.top_level = session.depth == 0
+            session.depth += 1
+        self.start_us = time.time_ns() // 1000
+        return self
+
+    def __exit__(self, *exc_info):
+        session = self.session
+        session.add_event(self.name, self.start_us, time.time_ns() // 1000, os.getpid(),
+                          threading.get_ident(), self.args)
+        if threading.get_ident() == session.main_thread:
+            session.depth -= 1
+            if self.top_level:
+                session.snapshot_if_peak()
+        return False
+
+
+class ProfileSession:
+    """Everything recorded for one --profile run."""
+
+    def __init__(self, output_dir, name: str, cprofile: bool = True, memory: bool = True):
+        self.output_dir = Path(output_dir)
+        self.name = name
+        self.events: List[dict] = []
+        self.thread_names: Dict[Tuple[int, int], str] = {}
+        self.start_us = time.time_ns() // 1000
+        self.main_thread = threading.get_ident()
+        self.depth = 0
+        self.profiler = None
+        self.memory = memory
+        self.snapshot = None
+        self.snapshot_bytes = -1
+        if memory:
+            import tracemalloc
+            tracemalloc.start()
+        if cprofile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def phase(self, name: str, args: Dict[str, Any]) -> Phase:
+        return Phase(self, name, args)
+
+    def add_event(self, name: str, start_us: int, end_us: int, pid: int, tid: int,
+                  args: Optional[Dict[str, Any]] = None) -> None:
+        key = (pid, tid)
+        if key not in self.thread_names:
+            current = threading.current_thread()
+            same_thread = pid == os.getpid() and tid == threading.get_ident()
+            self.thread_names[key] = current.name if same_thread else f"worker {pid}"
+        # list.append is atomic, so phases from pool threads need no lock
+        self.events.append({"name": name, "ph": "X", "ts": start_us - self.start_us,
+                            "dur": end_us - start_us, "pid": pid, "tid": tid, "args": args or {}})
+
+    def snapshot_if_peak(self) -> None:
+        """Keep a tracemalloc snapshot when more memory is live than at any earlier phase end"""
+        if not self.memory:
+            return
+        import tracemalloc
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.snapshot_bytes:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_bytes = current
+
+    def top_allocations(self) -> List[dict]:
+        import tracemalloc
+        snapshot = self.snapshot.filter_traces([
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        allocations = []
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            allocations.append({"site": f"{frame.filename}:{frame.lineno}",
+                                "size_kb": round(stat.size / 1024, 1), "count": stat.count})
+        return allocations
+
+    def phase_summary(self) -> Dict[str, Dict[str, float]]:
+        summary: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            seconds = event["dur"] / 1e6
+            entry = summary.setdefault(event["name"], {"count": 0, "total_s": 0.0, "min_s": seconds, "max_s": seconds})
+            entry["count"] += 1
+            entry["total_s"] += seconds
+            entry["min_s"] = min(entry["min_s"], seconds)
+            entry["max_s"] = max(entry["max_s"], seconds)
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total_s"], reverse=True))
+
+    def stop(self) -> None:
+        """Stop capturing and write every output file"""
+        wall_s = (time.time_ns() // 1000 - self.start_us) / 1e6
+        if self.profiler is not None:
+            self.profiler.disable()
+        allocations = []
+        peak_mb = None
+        if self.memory:
+            import tracemalloc
+            self.snapshot_if_peak()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            allocations = self.top_allocations()
+            tracemalloc.stop()
+
+        import json
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        phases = self.phase_summary()
+        with open(self.output_dir / "phases.json", 'w', encoding='utf-8') as f:
+            json.dump({"script": self.name, "wall_s": wall_s, "peak_traced_mb": peak_mb,
+                       "phases": phases, "top_allocations": allocations}, f, indent=2)
+        self.write_trace(self.output_dir / "trace.json")
+        if self.profiler is not None:
+            self.write_profile()
+        if self.memory:
+            with open(self.output_dir / "allocations.txt", 'w', encoding='utf-8') as f:
+                f.write(f"Peak traced memory: {peak_mb:.1f} MB, "
+                        f"{self.snapshot_bytes / (1024 * 1024):.1f} MB live at the snapshot below\n\n")
+                for allocation in allocations:
+                    f.write(f"{allocation['size_kb']:10.1f} KB {allocation['count']:8d} blocks  "
+                            f"{allocation['site']}\n")
+
+        print(f"\n📈 Profile written to {self.output_dir} ({wall_s:.2f}s)")
+        for name, entry in list(phases.items())[:10]:
+            print(f"   ⏱️  {name:<28} {entry['total_s'] * 1000:9.1f} ms  ({entry['count']}x)")
+        for allocation in allocations[:5]:
+            print(f"   💾 {allocation['size_kb']:9.1f} KB  {allocation['site']}")
+
+    def write_trace(self, path: Path) -> None:
+        import json
+
+        pids = {pid for pid, _ in self.thread_names} | {os.getpid()}
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid,
+                     "args": {"name": self.name if pid == os.getpid() else f"{self.name} worker {pid}"}}
+                    for pid in sorted(pids)]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                     for (pid, tid), name in self.thread_names.items()]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, f)
+
+    def write_profile(self) -> None:
+        import io
+        import pstats
+
+        self.profiler.dump_stats(str(self.output_dir / "profile.prof"))
+        report = io.StringIO()
+        pstats.Stats(self.profiler, stream=report).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        with open(self.output_dir / "profile.txt", 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
+
+
+_session: Optional[ProfileSession] = None
+
+
+def phase(name: str, **args):
+    """Context manager timing one named phase (a no-op unless profiling is on)"""
+    session = _session
+    if session is None:
+        return NULL_PHASE
+    return session.phase(name, args)
+
+
+def enabled() -> bool:
+    return _session is not None
+
+
+def start_profiling(output_dir, name: str, cprofile: bool = True, memory: bool = True) -> Optional[ProfileSession]:
+    """Start a profiling session writing to output_dir at exit; does nothing when output_dir is None"""
+    global _session
+    if not output_dir or _session is not None:
+        return _session
+    _session = ProfileSession(output_dir, name, cprofile, memory)
+    atexit.register(stop_profiling)
+    return _session
+
+
+def stop_profiling() -> None:
+    """Write the profile of the current session (called at exit; safe to call twice)"""
+    global _session
+    session, _session = _session, None
+    if session is not None:
+        session.stop()
+
+
+def _reset_after_fork() -> None:
+    """Forked pool workers inherit the session; they only report spans back through traced()"""
+    global _session
+    session, _session = _session, None
+    if session is not None:
+        if session.profiler is not None:
+            session.profiler.disable()
+        if session.memory:
+            import tracemalloc
+            tracemalloc.stop()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def add_profile_argument(parser) -> None:
+    parser.add_argument("--profile", metavar="DIR",
+                        help="Write phase timings, a Chrome trace, a cProfile and top allocations to DIR")
+
+
+def traced(name: str, fn: Callable, *args, **kwargs) -> Tuple[Any, dict]:
+    """Run fn (in a worker process) and return (result, span) for record_span() in the parent"""
+    start_us = time.time_ns() // 1000
+    result = fn(*args, **kwargs)
+    span = {"name": name, "start_us": start_us, "end_us": time.time_ns() // 1000,
+            "pid": os.getpid(), "tid": threading.get_ident()}
+    return result, span
+
+
+def record_span(span: dict, **args) -> None:
+    """Add a span measured elsewhere (e.g. by traced() in a worker) to the timeline"""
+    session = _session
+    if session is not None:
+        session.add_event(span["name"], span["start_us"], span["end_us"], span["pid"], span["tid"], args)
+
+
+def submit(pool, name: str, fn: Callable, *args):
+    """pool.submit(fn, *args), timed in the worker when profiling is on; read it with result()"""
+    if _session is None:
+        return pool.submit(fn, *args)
+    future = pool.submit(traced, name, fn, *args)
+    future.traced = True
+    return future
+
+
+def result(future, **args):
+    """Result of a future from submit(), recording the worker's span when it was traced"""
+    value = future.result()
+    if getattr(future, "traced", False):
+        value, span = value
+        record_span(span, **args)
+    return value
@@ -13,16 +13,16 @@ Usage:
 
 import os
 import sys
-import tarfile
 import argparse
-import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple, List
-import shutil
+
+from instrumentation import add_profile_argument, phase, start_profiling
 
 class JournalBackup:
-    def __init__(self, vault_path: str = "..", backup_dir: Optional[str] = None, compress_level: int = 6):
+    def __init__(self, vault_path: str = "..", backup_dir: Optional[str] = None, compress_level: int = 6,
+                 journal_layout: Optional[str] = None):
         # Since script is in Engine folder, vault root is one level up
         self.vault_path = Path(vault_path).resolve()
         self.journal_path = self.vault_path / "Journal"
@@ -35,12 +35,16 @@ class JournalBackup:
             self.backup_dir = script_dir / "journal_backups"
         
         self.compress_level = max(1, min(9, compress_level))  # Ensure 1-9 range
+        # Daily note path pattern (None: detected from the Journal folder)
+        self.journal_layout = journal_layout
         self.logger = None
         self.backup_filename = None
         self.log_filename = None
         
     def setup_logging(self, log_file: Path) -> None:
         """Setup logging to both file and console"""
+        import logging  # Imported here so `--help` and argument errors start fast
+        
         # Create logger
         self.logger = logging.getLogger('journal_backup')
         self.logger.setLevel(logging.INFO)
@@ -126,6 +130,27 @@ class JournalBackup:
         
         return structure
     
+    def get_daily_note_summary(self) -> List[str]:
+        """Daily notes by the Journal layout: date span, days without a note and notes it does not place"""
+        from vault.layout import journal_files, load_layout
+        
+        files = journal_files(self.journal_path)
+        try:
+            layout = load_layout(self.journal_path, self.journal_layout, files)
+        except ValueError as e:
+            return [f"⚠️  Daily notes not summarized: {e}"]
+        dates = sorted(iso for iso in map(layout.date_of, files) if iso)
+        summary = [f"🗓️  Layout: {layout.pattern}"]
+        if dates:
+            span_days = (layout.days[dates[-1]] - layout.days[dates[0]]).days + 1
+            summary.append(f"📅 Daily notes: {len(dates)} from {dates[0]} to {dates[-1]} "
+                           f"({span_days - len(dates)} days without a note)")
+        # Dated by file name but not where the layout puts that date
+        misplaced = [path for path in files if layout.date_of(path) is None and layout.note_date(path)]
+        if misplaced:
+            summary.append(f"⚠️  Daily notes outside the layout: {len(misplaced)} (e.g. {misplaced[0]})")
+        return summary
+    
     def create_backup(self) -> bool:
         """Create compressed backup of Journal directory"""
         if not self.journal_path.exists():
@@ -155,7 +180,8 @@ class JournalBackup:
             return False
         
         # Get source directory info
-        source_size, file_count = self.get_directory_size(self.journal_path)
+        with phase("scan journal"):
+            source_size, file_count = self.get_directory_size(self.journal_path)
         self.log_info(f"📊 Source: {self.journal_path}")
         self.log_info(f"📊 Files to backup: {file_count}")
         self.log_info(f"📊 Total size: {self.format_size(source_size)}")
@@ -165,7 +191,11 @@ class JournalBackup:
         # Log directory structure
         self.log_info("📋 Journal Directory Structure:")
         self.log_info("-" * 40)
-        structure = self.get_journal_structure()
+        with phase("structure"):
+            daily_notes = self.get_daily_note_summary()
+            structure = self.get_journal_structure()
+        for line in daily_notes:
+            self.log_info(line)
         for line in structure[:50]:  # Limit to first 50 lines to avoid huge logs
             self.log_info(line)
         if len(structure) > 50:
@@ -177,6 +207,8 @@ class JournalBackup:
         self.log_info(f"📦 Target: {backup_path}")
         
         try:
+            import tarfile  # Loads shutil and the compression modules; only needed once a backup starts
+            
             start_time = datetime.now()
             
             with tarfile.open(backup_path, 'w:gz', compresslevel=self.compress_level) as tar:
@@ -191,11 +223,12 @@ class JournalBackup:
                     return tarinfo
                 
                 # Add the entire Journal directory to the archive
-                tar.add(
-                    self.journal_path, 
-                    arcname="Journal",  # This will be the root folder name in the archive
-                    filter=progress_filter
-                )
+                with phase("archive", files=file_count, bytes=source_size):
+                    tar.add(
+                        self.journal_path, 
+                        arcname="Journal",  # This will be the root folder name in the archive
+                        filter=progress_filter
+                    )
             
             end_time = datetime.now()
             duration = end_time - start_time
@@ -312,8 +345,13 @@ def main():
                        help="Compression level 1-9 (default: 6)")
     parser.add_argument("--vault-path", type=str, default="..",
                        help="Path to vault root (default: .. from Engine directory)")
+    parser.add_argument("--journal-layout", type=str, metavar="PATTERN",
+                       help="Daily note path pattern under Journal/ for the log's daily note summary "
+                            "(default: detected from the existing notes)")
+    add_profile_argument(parser)
     
     args = parser.parse_args()
+    start_profiling(args.profile, "journal_backup")
     
     print("🚀 Journal Backup Utility")
     print("=" * 50)
@@ -322,7 +360,8 @@ def main():
     backup = JournalBackup(
         vault_path=args.vault_path,
         backup_dir=args.backup_dir,
-        compress_level=args.compress_level
+        compress_level=args.compress_level,
+        journal_layout=args.journal_layout
     )
     
     # Run backup
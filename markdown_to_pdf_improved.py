@@ -4,71 +4,204 @@ Improved Markdown to PDF Converter
 Converts the README.md documentation to a professional PDF format without wkhtmltopdf dependency.
 
 Requirements (choose one):
-    Option 1 (Recommended): pip install markdown weasyprint beautifulsoup4 pygments
-    Option 2: pip install markdown reportlab beautifulsoup4 pygments
-    Option 3 (Fallback): pip install markdown beautifulsoup4 pygments (HTML output only)
+    Option 1 (Recommended): pip install markdown weasyprint pygments
+    Option 2: pip install markdown reportlab pygments
+    Option 3 (Fallback): pip install markdown pygments (HTML output only)
 
 No external system dependencies required!
 """
 
 import os
+import re
+import io
 import sys
-import subprocess
-from datetime import datetime
+import time
+import contextlib
+import importlib
+import importlib.util
+import hashlib
+from datetime import datetime, timezone
 from pathlib import Path
 import argparse
-import tempfile
-import webbrowser
 
-# Check for available PDF libraries
+import instrumentation
+from instrumentation import add_profile_argument, phase, start_profiling
+from weasyprint_worker import RenderWorker, get_renderer
+from chunked_pdf import split_sections, group_sections, render_chunked
+from vault.blocks import FENCE_PATTERN, closes_fence
+from highlight_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_ENTRIES, HighlightCache, install_highlight_cache
+from render_cache import DEFAULT_RENDER_CACHE_PATH, RenderCache, file_digest, make_render_key
+
+# PDF backends are discovered without importing them (importing WeasyPrint or
+# ReportLab loads large native libraries); the real import is deferred until a
+# backend is selected in convert_html_to_pdf()
+PDF_BACKEND_MODULES = {
+    'weasyprint': 'weasyprint',
+    'reportlab': 'reportlab',
+    'pdfkit': 'pdfkit'
+}
+
+# Order in which available backends are tried; --backend moves one to the front
+PDF_BACKEND_ORDER = ['weasyprint', 'reportlab', 'pdfkit']
+
+# Scripts whose code shapes the rendered output (see converter_fingerprint)
+RENDER_MODULES = ['markdown_to_pdf_improved.py', 'reportlab_backend.py', 'chunked_pdf.py', 'weasyprint_worker.py',
+                  'vault/blocks.py']
+
+DOCUMENT_TITLE = "Personal Knowledge Management System"
+DOCUMENT_SUBTITLE = "Developer Manual"
+
+CORE_MODULES = {
+    'markdown': 'markdown'
+}
+
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.codehilite',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+    'markdown.extensions.toc',
+    'markdown.extensions.nl2br',
+    'markdown.extensions.sane_lists'
+]
+
+MARKDOWN_EXTENSION_CONFIGS = {
+    'markdown.extensions.codehilite': {
+        'css_class': 'codehilite',
+        'use_pygments': True
+    },
+    'markdown.extensions.toc': {
+        'permalink': True,
+        'toc_depth': 4
+    }
+}
+
+ATX_H1_PATTERN = re.compile(r'^\s{0,3}#(?:\s+.*)?$')
+SETEXT_H1_PATTERN = re.compile(r'^\s{0,3}=+\s*$')
+
+def is_module_available(module_name):
+    """Check whether a module can be found without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
 PDF_LIBRARIES = {
-    'weasyprint': False,
-    'reportlab': False,
-    'pdfkit': False
+    lib: is_module_available(module_name)
+    for lib, module_name in PDF_BACKEND_MODULES.items()
 }
 
-try:
-    import weasyprint
-    PDF_LIBRARIES['weasyprint'] = True
-    print("✅ WeasyPrint available")
-except ImportError:
-    pass
-
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    PDF_LIBRARIES['reportlab'] = True
-    print("✅ ReportLab available")
-except ImportError:
-    pass
-
-try:
-    import pdfkit
-    PDF_LIBRARIES['pdfkit'] = True
-    print("✅ PDFKit available (requires wkhtmltopdf)")
-except ImportError:
-    pass
-
-# Required libraries
-try:
-    import markdown
-    from bs4 import BeautifulSoup
-    print("✅ Core libraries available")
-except ImportError as e:
-    print(f"❌ Missing required package: {e}")
+def load_pdf_backend(lib):
+    """Import a PDF backend on first use, or return None if it cannot be loaded."""
+    try:
+        return importlib.import_module(PDF_BACKEND_MODULES[lib])
+    except Exception as e:
+        # WeasyPrint raises OSError rather than ImportError when its native
+        # libraries (Pango, HarfBuzz) are missing
+        print(f"⚠️  {lib} is installed but could not be loaded: {e}")
+        PDF_LIBRARIES[lib] = False
+        return None
+
+def package_version(name):
+    """Return the installed version of a distribution without importing it, or None."""
+    import importlib.metadata
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+def converter_fingerprint():
+    """Hash of the rendering scripts, so render cache entries expire when they change."""
+    digest = hashlib.sha256()
+    script_dir = Path(__file__).resolve().parent
+    for module_file in RENDER_MODULES:
+        with open(script_dir / module_file, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def default_generated_date():
+    """Header date from $SOURCE_DATE_EPOCH (reproducible builds) or None for today."""
+    source_date_epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if not source_date_epoch:
+        return None
+    return datetime.fromtimestamp(int(source_date_epoch), tz=timezone.utc).strftime("%B %d, %Y")
+
+def check_core_libraries():
+    """Check that the required markdown libraries are installed."""
+    missing = [package for module_name, package in CORE_MODULES.items() if not is_module_available(module_name)]
+    if not missing:
+        return True
+    
+    print(f"❌ Missing required package(s): {', '.join(missing)}")
     print("📦 Install required packages with:")
-    print("   pip install markdown beautifulsoup4 pygments")
+    print("   pip install markdown pygments")
     print("   # Plus one of:")
     print("   pip install weasyprint  # Recommended")
     print("   pip install reportlab   # Alternative")
-    sys.exit(1)
+    return False
+
+def strip_first_heading(markdown_content):
+    """Remove the first level-1 heading (ATX or setext) outside code fences."""
+    lines = markdown_content.split('\n')
+    fence = None
+    
+    for index, line in enumerate(lines):
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            if fence is None:
+                fence = fence_match.group(1)
+            elif closes_fence(fence, fence_match):
+                fence = None
+            continue
+        if fence is not None:
+            continue
+        
+        if ATX_H1_PATTERN.match(line):
+            return '\n'.join(lines[:index] + lines[index + 1:])
+        if (line.strip() and index + 1 < len(lines) and SETEXT_H1_PATTERN.match(lines[index + 1])
+                and (index == 0 or not lines[index - 1].strip())):
+            return '\n'.join(lines[:index] + lines[index + 2:])
+    
+    return markdown_content
+
+# One converter per batch worker process, created by init_batch_worker()
+_batch_converter = None
+
+def init_batch_worker(converter_options=None):
+    """Create the long-lived converter used by a batch worker process."""
+    global _batch_converter
+    _batch_converter = ImprovedMarkdownToPDFConverter(open_browser=False, **(converter_options or {}))
+
+def convert_batch_item(input_file, output_file):
+    """Convert one file in a batch worker, capturing its console output."""
+    log = io.StringIO()
+    timings_before = len(_batch_converter.render_timings)
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        success = _batch_converter.render_file(input_file, output_file)
+    elapsed = time.perf_counter() - start_time
+    if success:
+        output_file = _batch_converter.get_produced_output(output_file)
+    timings = _batch_converter.render_timings[timings_before:]
+    return input_file, output_file, success, elapsed, timings[-1] if timings else None, log.getvalue()
 
 class ImprovedMarkdownToPDFConverter:
-    def __init__(self):
+    def __init__(self, open_browser=True, chunks=0, jobs=None,
+                 highlight_cache_path=None, highlight_cache_size=DEFAULT_MAX_ENTRIES,
+                 render_cache_path=None, force_render=False, generated_date=None, backend='auto'):
+        self.open_browser = open_browser
+        self.backend = backend
+        self.chunks = chunks
+        self.jobs = jobs
+        self.highlight_cache_path = highlight_cache_path
+        self.highlight_cache_size = highlight_cache_size
+        self.highlight_cache = None
+        self.render_cache_path = render_cache_path
+        self.render_cache = None
+        self.force_render = force_render
+        self.generated_date = generated_date
+        self.markdown = None
+        self.render_worker = None
+        self.render_timings = []
         self.css_styles = """
         <style>
         @page {
@@ -375,46 +508,63 @@ class ImprovedMarkdownToPDFConverter:
             print(f"❌ Error reading file: {e}")
             return None
 
+    def hash_markdown_file(self, file_path):
+        """Hash markdown file content without reading it into memory (None when missing or empty)."""
+        try:
+            if os.stat(file_path).st_size == 0:
+                return None
+            return file_digest(file_path)
+        except FileNotFoundError:
+            print(f"❌ Error: File '{file_path}' not found.")
+            return None
+        except Exception as e:
+            print(f"❌ Error reading file: {e}")
+            return None
+
+    def get_markdown(self):
+        """Return the reusable Markdown instance, building it on first use."""
+        if self.markdown is None:
+            import markdown
+            if self.highlight_cache_path:
+                self.open_highlight_cache()
+            self.markdown = markdown.Markdown(
+                extensions=MARKDOWN_EXTENSIONS,
+                extension_configs=MARKDOWN_EXTENSION_CONFIGS
+            )
+        return self.markdown
+
+    def open_highlight_cache(self):
+        """Open the persistent highlight cache and route codehilite through it."""
+        import sqlite3
+        try:
+            self.highlight_cache = HighlightCache(self.highlight_cache_path, self.highlight_cache_size)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Highlight cache unavailable ({e}), highlighting without cache")
+            return
+        install_highlight_cache(self.highlight_cache)
+
     def convert_markdown_to_html(self, markdown_content):
-        """Convert markdown content to HTML with extensions."""
-        extensions = [
-            'markdown.extensions.codehilite',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.tables',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br',
-            'markdown.extensions.sane_lists'
-        ]
-        
-        extension_configs = {
-            'markdown.extensions.codehilite': {
-                'css_class': 'codehilite',
-                'use_pygments': True
-            },
-            'markdown.extensions.toc': {
-                'permalink': True,
-                'toc_depth': 4
-            }
-        }
+        """Convert markdown content to HTML with extensions.
         
-        md = markdown.Markdown(
-            extensions=extensions,
-            extension_configs=extension_configs
-        )
+        The first h1 is dropped before conversion because the professional
+        header replaces it.
+        """
+        md = self.get_markdown()
+        md.reset()
         
-        html_content = md.convert(markdown_content)
+        html_content = md.convert(strip_first_heading(markdown_content))
         toc = getattr(md, 'toc', '')
         
         return html_content, toc
 
     def add_header_and_toc(self, html_content, toc):
         """Add professional header and table of contents to HTML."""
-        current_date = datetime.now().strftime("%B %d, %Y")
+        current_date = self.generated_date or datetime.now().strftime("%B %d, %Y")
         
         header_html = f"""
         <div class="header-info">
-            <h1>Personal Knowledge Management System</h1>
-            <p><strong>Developer Manual</strong></p>
+            <h1>{DOCUMENT_TITLE}</h1>
+            <p><strong>{DOCUMENT_SUBTITLE}</strong></p>
             <p>Generated on {current_date}</p>
             <p>Comprehensive documentation for understanding, maintaining, and extending the PKM system</p>
         </div>
@@ -429,13 +579,7 @@ class ImprovedMarkdownToPDFConverter:
             </div>
             """
         
-        # Remove the first h1 tag from content
-        soup = BeautifulSoup(html_content, 'html.parser')
-        first_h1 = soup.find('h1')
-        if first_h1:
-            first_h1.extract()
-        
-        return header_html + toc_html + str(soup)
+        return header_html + toc_html + html_content
 
     def create_complete_html(self, html_content):
         """Create complete HTML document with CSS."""
@@ -445,7 +589,7 @@ class ImprovedMarkdownToPDFConverter:
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Personal Knowledge Management System - Developer Manual</title>
+            <title>{DOCUMENT_TITLE} - {DOCUMENT_SUBTITLE}</title>
             {self.css_styles}
         </head>
         <body>
@@ -455,18 +599,82 @@ class ImprovedMarkdownToPDFConverter:
         """
         return complete_html
 
+    def get_stylesheet_text(self):
+        """Return the stylesheet without its <style> wrapper."""
+        return self.css_styles.replace('<style>', '').replace('</style>', '')
+
+    def start_render_worker(self):
+        """Start a persistent WeasyPrint worker process for the following conversions."""
+        if not PDF_LIBRARIES['weasyprint'] or self.render_worker:
+            return False
+        worker = RenderWorker(self.get_stylesheet_text())
+        if not worker.start():
+            return False
+        self.render_worker = worker
+        return True
+
+    def stop_render_worker(self):
+        """Stop the render worker and report its per-job timings."""
+        if not self.render_worker:
+            return
+        jobs = self.render_worker.job_timings
+        self.render_worker.close()
+        self.render_worker = None
+        if jobs:
+            total_ms = sum(job['total_ms'] for job in jobs)
+            print(f"⏱️  Render worker: {len(jobs)} jobs, {total_ms / len(jobs):.0f} ms average")
+
     def convert_with_weasyprint(self, html_content, output_path):
-        """Convert HTML to PDF using WeasyPrint."""
+        """Convert HTML to PDF using WeasyPrint.
+        
+        Rendering reuses a warm font configuration and a preparsed copy of
+        the stylesheet, so the inline <style> block is removed first.
+        """
+        if load_pdf_backend('weasyprint') is None:
+            return False
+        body_html = html_content.replace(self.css_styles, '', 1)
         try:
             print("🔄 Using WeasyPrint for PDF generation...")
-            weasyprint.HTML(string=html_content).write_pdf(output_path)
+            if self.render_worker:
+                success, timings, error = self.render_worker.render(body_html, output_path)
+                if not success:
+                    raise RuntimeError(error)
+            else:
+                timings = get_renderer(self.get_stylesheet_text()).render(body_html, output_path)
+            self.render_timings.append(timings)
+            print(f"⏱️  {timings['pages']} pages: layout {timings['layout_ms']:.0f} ms, "
+                  f"write {timings['write_ms']:.0f} ms")
             return True
         except Exception as e:
             print(f"❌ WeasyPrint error: {e}")
             return False
 
+    def convert_html_to_pdf_chunked(self, body_html, output_path):
+        """Render a large document as parallel chunks split at <h1>/<h2> and merge them."""
+        if not is_module_available('pypdf'):
+            print("⚠️  Chunked rendering needs pypdf (pip install pypdf), rendering in one pass")
+            return False
+        if load_pdf_backend('weasyprint') is None:
+            return False
+        
+        chunks = group_sections(split_sections(body_html), self.chunks)
+        if len(chunks) < 2:
+            return False
+        
+        jobs = max(1, min(self.jobs or os.cpu_count() or 1, len(chunks)))
+        print(f"🧩 Rendering {len(chunks)} chunks with {jobs} worker(s)...")
+        chunk_documents = [self.create_complete_html(chunk).replace(self.css_styles, '', 1) for chunk in chunks]
+        try:
+            return render_chunked(chunk_documents, self.get_stylesheet_text(), output_path, jobs)
+        except Exception as e:
+            print(f"❌ Chunked rendering error: {e}")
+            return False
+
     def convert_with_pdfkit(self, html_content, output_path):
         """Convert HTML to PDF using pdfkit (requires wkhtmltopdf)."""
+        pdfkit = load_pdf_backend('pdfkit')
+        if pdfkit is None:
+            return False
         try:
             print("🔄 Using pdfkit for PDF generation...")
             options = {
@@ -501,33 +709,228 @@ class ImprovedMarkdownToPDFConverter:
             print("📄 Open in browser and use 'Print to PDF' to create PDF")
             
             # Try to open in browser
-            try:
-                webbrowser.open(f'file://{os.path.abspath(html_path)}')
-                print("🌐 Opened in browser")
-            except:
-                print(f"📂 Manually open: {os.path.abspath(html_path)}")
+            if self.open_browser:
+                try:
+                    import webbrowser
+                    webbrowser.open(f'file://{os.path.abspath(html_path)}')
+                    print("🌐 Opened in browser")
+                except:
+                    print(f"📂 Manually open: {os.path.abspath(html_path)}")
             
             return True
         except Exception as e:
             print(f"❌ Error saving HTML: {e}")
             return False
 
+    def convert_with_reportlab(self, input_file, output_path):
+        """Render a markdown file directly to PDF with the streaming ReportLab backend."""
+        if load_pdf_backend('reportlab') is None:
+            return False
+        from reportlab_backend import render_markdown_lines
+        try:
+            print("🔄 Using ReportLab for PDF generation (streaming, no HTML layout)...")
+            start_time = time.perf_counter()
+            # The file is read line by line; the block parser drops the title heading on the way
+            with open(input_file, 'r', encoding='utf-8') as lines:
+                pages = render_markdown_lines(
+                    lines, output_path, title=DOCUMENT_TITLE, subtitle=DOCUMENT_SUBTITLE,
+                    generated_date=self.generated_date or datetime.now().strftime("%B %d, %Y"),
+                    drop_title=True
+                )
+            print(f"⏱️  {pages} pages in {(time.perf_counter() - start_time) * 1000:.0f} ms")
+            return True
+        except Exception as e:
+            print(f"❌ ReportLab error: {e}")
+            return False
+
     def convert_html_to_pdf(self, html_content, output_path):
         """Convert HTML to PDF using available libraries."""
-        # Try WeasyPrint first (best option)
-        if PDF_LIBRARIES['weasyprint']:
-            if self.convert_with_weasyprint(html_content, output_path):
-                return True
-        
-        # Try pdfkit if available (requires wkhtmltopdf)
-        if PDF_LIBRARIES['pdfkit']:
-            if self.convert_with_pdfkit(html_content, output_path):
+        # WeasyPrint (best option) and pdfkit (requires wkhtmltopdf) lay out the HTML;
+        # ReportLab works from the markdown (convert_with_reportlab) before this point
+        html_converters = {
+            'weasyprint': self.convert_with_weasyprint,
+            'pdfkit': self.convert_with_pdfkit
+        }
+        for lib in self.get_backend_order():
+            if lib in html_converters and html_converters[lib](html_content, output_path):
                 return True
         
         # Fallback to HTML output
         print("⚠️  No PDF libraries available, saving as HTML...")
         return self.save_html_fallback(html_content, output_path)
 
+    def get_worker_options(self):
+        """Converter settings passed to batch worker processes."""
+        return {
+            'highlight_cache_path': self.highlight_cache_path,
+            'highlight_cache_size': self.highlight_cache_size,
+            'render_cache_path': self.render_cache_path,
+            'force_render': self.force_render,
+            'generated_date': self.generated_date,
+            'backend': self.backend
+        }
+
+    def get_backend_order(self):
+        """Return the available PDF backends in the order they are tried."""
+        if self.backend == 'html':
+            return []
+        order = [lib for lib in PDF_BACKEND_ORDER if PDF_LIBRARIES[lib]]
+        if self.backend in order:
+            order.remove(self.backend)
+            order.insert(0, self.backend)
+        return order
+
+    def select_backend(self):
+        """Return the backend that will be tried first ('html' when there is none)."""
+        order = self.get_backend_order()
+        return order[0] if order else 'html'
+
+    def get_render_key(self, source_digest):
+        """Hash every input that affects the rendered output of a document."""
+        backend = self.select_backend()
+        return make_render_key(
+            source_digest,
+            self.css_styles,
+            backend,
+            package_version(backend) if backend != 'html' else None,
+            package_version('markdown'),
+            package_version('pygments'),
+            converter_fingerprint(),
+            self.generated_date or datetime.now().strftime("%B %d, %Y"),
+            self.chunks if self.chunks > 1 else 0
+        )
+
+    def get_render_cache(self):
+        """Open the render cache on first use (None when disabled or unavailable)."""
+        if self.render_cache is None and self.render_cache_path:
+            import sqlite3
+            try:
+                self.render_cache = RenderCache(self.render_cache_path)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️  Render cache unavailable ({e}), rendering every document")
+                self.render_cache_path = None
+        return self.render_cache
+
+    def find_unchanged_output(self, source_digest, output_file):
+        """Return (existing output or None, render key) for a document about to be rendered."""
+        render_cache = self.get_render_cache()
+        if render_cache is None:
+            return None, None
+        render_key = self.get_render_key(source_digest)
+        if self.force_render:
+            return None, render_key
+        output_file = str(output_file)
+        return render_cache.lookup([output_file, output_file.replace('.pdf', '.html')], render_key), render_key
+
+    def get_produced_output(self, output_file):
+        """Return the PDF or HTML fallback written for output_file, whichever is newer."""
+        output_file = str(output_file)
+        candidates = [path for path in (output_file, output_file.replace('.pdf', '.html')) if os.path.exists(path)]
+        return max(candidates, key=os.path.getmtime) if candidates else output_file
+
+    def record_render(self, output_file, render_key):
+        """Store the render key for the file the last conversion produced."""
+        produced_output = self.get_produced_output(output_file)
+        if render_key is not None and os.path.exists(produced_output):
+            self.render_cache.record(produced_output, render_key)
+
+    def get_output_path(self, input_file):
+        """Return the default PDF output path for a markdown file."""
+        input_path = Path(input_file)
+        return input_path.parent / f"{input_path.stem}.pdf"
+
+    def render_file(self, input_file, output_file):
+        """Convert one markdown file to PDF without the progress report."""
+        source_digest = self.hash_markdown_file(input_file)
+        if not source_digest:
+            return False
+        
+        cached_output, render_key = self.find_unchanged_output(source_digest, output_file)
+        if cached_output:
+            print(f"⏭️  Unchanged since last build: {cached_output}")
+            return True
+        
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        success = False
+        if self.select_backend() == 'reportlab':
+            success = self.convert_with_reportlab(input_file, str(output_file))
+        if not success:
+            # Only the HTML path needs the markdown as one string
+            markdown_content = self.read_markdown_file(input_file)
+            if markdown_content is None:
+                return False
+            html_content, toc = self.convert_markdown_to_html(markdown_content)
+            complete_html = self.create_complete_html(self.add_header_and_toc(html_content, toc))
+            success = self.convert_html_to_pdf(complete_html, str(output_file))
+        if success:
+            self.record_render(output_file, render_key)
+        return success
+
+    def convert_batch(self, input_files, output_dir=None, jobs=None):
+        """Convert many markdown files over a process pool.
+        
+        Each worker process keeps one converter (and its Markdown instance)
+        for all of its jobs, so the setup cost is paid once per worker.
+        """
+        print("🚀 Improved Markdown to PDF Converter - batch mode")
+        print("=" * 50)
+        
+        input_paths = [Path(f).resolve() for f in input_files]
+        if not input_paths:
+            print("❌ No markdown files to convert")
+            return False
+        if output_dir:
+            # Mirror the input tree under output_dir so equal file names don't collide
+            common_root = Path(os.path.commonpath([str(p.parent) for p in input_paths]))
+            outputs = [Path(output_dir).resolve() / p.relative_to(common_root).with_suffix('.pdf')
+                       for p in input_paths]
+        else:
+            outputs = [self.get_output_path(p) for p in input_paths]
+        
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(input_paths)))
+        print(f"📚 Converting {len(input_paths)} files with {jobs} worker(s)")
+        
+        start_time = time.perf_counter()
+        failures = []
+        
+        with phase("batch", files=len(input_paths), jobs=jobs):
+            if jobs == 1:
+                init_batch_worker(self.get_worker_options())
+                _batch_converter.render_worker = self.render_worker
+                
+                def convert_items():
+                    for i, o in zip(input_paths, outputs):
+                        with phase(i.name):
+                            item = convert_batch_item(str(i), str(o))
+                        yield item
+                self.report_batch_results(convert_items(), failures)
+            else:
+                from concurrent.futures import ProcessPoolExecutor, as_completed
+                
+                with ProcessPoolExecutor(max_workers=jobs, initializer=init_batch_worker,
+                                         initargs=(self.get_worker_options(),)) as pool:
+                    futures = [instrumentation.submit(pool, i.name, convert_batch_item, str(i), str(o))
+                               for i, o in zip(input_paths, outputs)]
+                    self.report_batch_results((instrumentation.result(f) for f in as_completed(futures)), failures)
+        
+        elapsed = time.perf_counter() - start_time
+        print(f"\n📊 Converted {len(input_paths) - len(failures)}/{len(input_paths)} files in {elapsed:.1f} seconds")
+        for input_file in failures:
+            print(f"   ❌ {input_file}")
+        return not failures
+
+    def report_batch_results(self, results, failures):
+        """Print batch results as they complete and collect failed inputs."""
+        for input_file, output_file, success, elapsed, timings, log in results:
+            if success:
+                layout = f", layout {timings['layout_ms']:.0f} ms" if timings else ""
+                print(f"  ✅ {Path(input_file).name} → {output_file} ({elapsed:.2f}s{layout})")
+            else:
+                failures.append(input_file)
+                print(f"  ❌ {Path(input_file).name} failed:")
+                for line in log.strip().splitlines():
+                    print(f"      {line}")
+
     def convert(self, input_file, output_file=None):
         """Main conversion method."""
         print("🚀 Improved Markdown to PDF Converter")
@@ -540,34 +943,66 @@ class ImprovedMarkdownToPDFConverter:
         else:
             print("⚠️  No PDF libraries available - will output HTML for browser conversion")
         
-        # Read markdown file
+        # Hash the markdown file; it is only read into memory for the HTML path
         print(f"📖 Reading markdown file: {input_file}")
-        markdown_content = self.read_markdown_file(input_file)
-        if not markdown_content:
+        with phase("hash"):
+            source_digest = self.hash_markdown_file(input_file)
+        if not source_digest:
             return False
-
-        # Convert to HTML
-        print("🔄 Converting markdown to HTML...")
-        html_content, toc = self.convert_markdown_to_html(markdown_content)
-        
-        # Add header and TOC
-        print("✨ Adding professional formatting...")
-        html_content = self.add_header_and_toc(html_content, toc)
-        
-        # Create complete HTML document
-        complete_html = self.create_complete_html(html_content)
         
         # Generate output filename if not provided
         if not output_file:
-            input_path = Path(input_file)
-            output_file = input_path.parent / f"{input_path.stem}.pdf"
+            output_file = self.get_output_path(input_file)
         
-        # Convert to PDF
-        print(f"📄 Converting to PDF: {output_file}")
-        success = self.convert_html_to_pdf(complete_html, str(output_file))
+        # Skip the render when nothing that affects the output has changed
+        with phase("render cache lookup"):
+            cached_output, render_key = self.find_unchanged_output(source_digest, output_file)
+        if cached_output:
+            print("⏭️  Source, stylesheet and backend unchanged since the last build")
+            print(f"📁 Location: {cached_output}")
+            return True
+
+        success = False
+        if self.select_backend() == 'reportlab':
+            # ReportLab streams the markdown straight to PDF without an HTML stage
+            print(f"📄 Converting to PDF: {output_file}")
+            with phase("reportlab pdf"):
+                success = self.convert_with_reportlab(input_file, str(output_file))
+        
+        if not success:
+            # Only the HTML path needs the markdown as one string
+            with phase("read"):
+                markdown_content = self.read_markdown_file(input_file)
+            if markdown_content is None:
+                return False
+            
+            # Convert to HTML
+            print("🔄 Converting markdown to HTML...")
+            with phase("markdown to html", chars=len(markdown_content)):
+                html_content, toc = self.convert_markdown_to_html(markdown_content)
+            if self.highlight_cache:
+                print(f"🎨 Highlight cache: {self.highlight_cache.hits} hits, {self.highlight_cache.misses} misses")
+            
+            # Add header and TOC
+            print("✨ Adding professional formatting...")
+            with phase("complete html"):
+                html_content = self.add_header_and_toc(html_content, toc)
+                
+                # Create complete HTML document
+                complete_html = self.create_complete_html(html_content)
+            
+            # Convert to PDF
+            print(f"📄 Converting to PDF: {output_file}")
+            if self.chunks > 1 and self.select_backend() == 'weasyprint':
+                with phase("chunked pdf", chunks=self.chunks):
+                    success = self.convert_html_to_pdf_chunked(html_content, str(output_file))
+            if not success:
+                with phase("pdf", backend=self.select_backend()):
+                    success = self.convert_html_to_pdf(complete_html, str(output_file))
         
         if success:
-            if os.path.exists(str(output_file)):
+            self.record_render(output_file, render_key)
+            if self.get_produced_output(output_file) == str(output_file):
                 file_size = os.path.getsize(str(output_file))
                 file_size_mb = file_size / (1024 * 1024)
                 print(f"✅ PDF created successfully!")
@@ -589,11 +1024,14 @@ Examples:
   python3 markdown_to_pdf_improved.py                    # Convert README.md to README.pdf
   python3 markdown_to_pdf_improved.py -i README.md       # Same as above
   python3 markdown_to_pdf_improved.py -i README.md -o manual.pdf  # Custom output name
+  python3 markdown_to_pdf_improved.py -i ../Activities --output-dir pdf/ -j 4  # Batch mode
+  python3 markdown_to_pdf_improved.py -i export.md --chunks 16 -j 8  # Parallel chunks for huge documents
+  python3 markdown_to_pdf_improved.py -i export.md --backend reportlab  # Stream to PDF without HTML layout
   
 Requirements (choose one):
-  Option 1 (Recommended): pip install markdown weasyprint beautifulsoup4 pygments
-  Option 2: pip install markdown reportlab beautifulsoup4 pygments  
-  Option 3 (Fallback): pip install markdown beautifulsoup4 pygments
+  Option 1 (Recommended): pip install markdown weasyprint pygments
+  Option 2: pip install markdown reportlab pygments  
+  Option 3 (Fallback): pip install markdown pygments
   
 No external system dependencies required!
         """
@@ -601,8 +1039,9 @@ No external system dependencies required!
     
     parser.add_argument(
         '-i', '--input',
-        default='README.md',
-        help='Input markdown file (default: README.md)'
+        nargs='+',
+        default=['README.md'],
+        help='Input markdown file(s) or directories (default: README.md)'
     )
     
     parser.add_argument(
@@ -610,13 +1049,114 @@ No external system dependencies required!
         help='Output PDF file (default: same name as input with .pdf extension)'
     )
     
+    parser.add_argument(
+        '--output-dir',
+        help='Batch mode: write PDFs under this directory, mirroring the input tree'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Batch mode: number of worker processes (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=['auto'] + PDF_BACKEND_ORDER + ['html'],
+        default='auto',
+        help='PDF backend to try first (default: auto = ' + ', '.join(PDF_BACKEND_ORDER) +
+             '); reportlab streams markdown straight to PDF in near-constant memory'
+    )
+    
+    parser.add_argument(
+        '--chunks',
+        type=int,
+        default=0,
+        help='Split a large document at h1/h2 boundaries into up to N chunks rendered '
+             'in parallel with -j workers, then merged (requires pypdf)'
+    )
+    
+    parser.add_argument(
+        '--render-worker',
+        action='store_true',
+        help='Render through a persistent WeasyPrint worker process (single file or -j 1)'
+    )
+    
+    parser.add_argument(
+        '--highlight-cache',
+        default=str(DEFAULT_CACHE_PATH),
+        help=f'SQLite file caching highlighted code blocks between runs (default: {DEFAULT_CACHE_PATH})'
+    )
+    
+    parser.add_argument(
+        '--highlight-cache-size',
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help=f'Maximum cached code blocks; least recently used are evicted (default: {DEFAULT_MAX_ENTRIES})'
+    )
+    
+    parser.add_argument(
+        '--no-highlight-cache',
+        action='store_true',
+        help='Highlight every code block with Pygments without caching'
+    )
+    
+    parser.add_argument(
+        '--generated-date',
+        default=default_generated_date(),
+        help='Date shown as "Generated on" in the header, e.g. "January 01, 2025" '
+             '(default: $SOURCE_DATE_EPOCH if set, otherwise today)'
+    )
+    
+    parser.add_argument(
+        '--render-cache',
+        default=str(DEFAULT_RENDER_CACHE_PATH),
+        help=f'SQLite file recording render inputs, used to skip unchanged documents '
+             f'(default: {DEFAULT_RENDER_CACHE_PATH})'
+    )
+    
+    parser.add_argument(
+        '--no-render-cache',
+        action='store_true',
+        help='Always render, without reading or updating the render cache'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-render even when the render cache says the output is up to date'
+    )
+    
+    add_profile_argument(parser)
+    
     args = parser.parse_args()
+    start_profiling(args.profile, "markdown_to_pdf_improved")
     
-    # Check if input file exists
-    if not os.path.exists(args.input):
-        print(f"❌ Error: Input file '{args.input}' not found.")
-        print(f"📁 Current directory: {os.getcwd()}")
-        print(f"📋 Available files: {', '.join([f for f in os.listdir('.') if f.endswith('.md')])}")
+    if not check_core_libraries():
+        sys.exit(1)
+    
+    # Check if input files exist, expanding directories to their markdown files (listed by the daemon when it runs)
+    from vault.daemon import markdown_files
+
+    input_files = []
+    for input_path in args.input:
+        if not os.path.exists(input_path):
+            print(f"❌ Error: Input file '{input_path}' not found.")
+            print(f"📁 Current directory: {os.getcwd()}")
+            print(f"📋 Available files: {', '.join([f for f in os.listdir('.') if f.endswith('.md')])}")
+            sys.exit(1)
+        if os.path.isdir(input_path):
+            input_files.extend(markdown_files(input_path))
+        else:
+            input_files.append(input_path)
+    
+    if not input_files:
+        print(f"❌ Error: no markdown files found in {', '.join(args.input)}")
+        sys.exit(1)
+    
+    batch_mode = len(input_files) > 1 or args.output_dir or os.path.isdir(args.input[0])
+    if batch_mode and args.output:
+        print("❌ Error: use --output-dir instead of --output for multiple inputs.")
         sys.exit(1)
     
     # Show installation suggestions if no PDF libraries available
@@ -627,9 +1167,28 @@ No external system dependencies required!
         print("   pip install pdfkit          # Requires wkhtmltopdf system package")
         print("\n🔄 Proceeding with HTML output (use browser to convert to PDF)...")
     
+    if args.backend in PDF_BACKEND_ORDER and not PDF_LIBRARIES[args.backend]:
+        print(f"⚠️  Backend '{args.backend}' is not installed, using the first available one")
+    
     # Create converter and run conversion
-    converter = ImprovedMarkdownToPDFConverter()
-    success = converter.convert(args.input, args.output)
+    converter = ImprovedMarkdownToPDFConverter(
+        open_browser=not batch_mode, chunks=args.chunks, jobs=args.jobs,
+        highlight_cache_path=None if args.no_highlight_cache else args.highlight_cache,
+        highlight_cache_size=args.highlight_cache_size,
+        render_cache_path=None if args.no_render_cache else args.render_cache,
+        force_render=args.force,
+        generated_date=args.generated_date,
+        backend=args.backend
+    )
+    if args.render_worker:
+        converter.start_render_worker()
+    try:
+        if batch_mode:
+            success = converter.convert_batch(input_files, args.output_dir, args.jobs)
+        else:
+            success = converter.convert(input_files[0], args.output)
+    finally:
+        converter.stop_render_worker()
     
     if success:
         print("\n🎉 Conversion completed successfully!")
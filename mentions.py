@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Mentions Lookup
+
+Answers "which notes link to [[X]]?" from the inverted mention index
+(vault/mentions.py) instead of scanning every journal page. The index is
+refreshed incrementally (only notes whose mtime changed are re-parsed) before
+each query unless --no-update is given.
+
+Usage:
+  python mentions.py "Activities/Shopping"     # Blocks linking to an activity
+  python mentions.py 2025-07-04 --type todo    # Todos linking to a date
+  python mentions.py --top 20                  # Most linked targets
+  python mentions.py --rebuild                 # Re-index the whole vault
+"""
+
+import sys
+import json
+import time
+import argparse
+
+from vault.mentions import MentionIndex
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Look up [[wikilink]] mentions in the vault")
+    parser.add_argument("targets", nargs="*",
+                        help="Link targets to look up, e.g. Activities/Shopping or 2025-07-04")
+    parser.add_argument("--vault-path", type=str, default="..",
+                        help="Path to vault root (default: .. from Engine directory)")
+    parser.add_argument("--index", type=str, help="Index file (default: per-vault file in ~/.cache/obsidian-engine)")
+    parser.add_argument("--type", dest="block_types", action="append",
+                        choices=["todo", "done", "header", "mention", "callout", "code"],
+                        help="Only blocks of this type (repeatable)")
+    parser.add_argument("--no-update", action="store_true",
+                        help="Query the index as it is, without checking the vault for changes")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index the whole vault")
+    parser.add_argument("--top", type=int, metavar="N", help="Show the N most linked targets")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    index = MentionIndex(args.vault_path, args.index)
+    start_time = time.perf_counter()
+    if args.rebuild:
+        parsed, removed = index.rebuild()
+    elif not args.no_update:
+        parsed, removed = index.update()
+    else:
+        parsed = removed = 0
+    update_ms = (time.perf_counter() - start_time) * 1000
+
+    if not args.json and (args.rebuild or parsed or removed):
+        print(f"🗂️  Indexed {parsed} notes, removed {removed} ({update_ms:.0f} ms)")
+
+    results = {}
+    start_time = time.perf_counter()
+    for target in args.targets:
+        results[target] = index.query(target, args.block_types)
+    top = index.top_targets(args.top) if args.top else []
+    query_ms = (time.perf_counter() - start_time) * 1000
+
+    if args.json:
+        print(json.dumps({
+            "mentions": {target: [{"page": page, "line": line, "blockType": block_type}
+                                  for page, line, block_type in rows]
+                         for target, rows in results.items()},
+            "top": [{"target": target, "pages": pages} for target, pages in top]
+        }, indent=2, ensure_ascii=False))
+        index.close()
+        return
+
+    for target, rows in results.items():
+        print(f"🔗 [[{target}]]: {len(rows)} blocks in {len({row[0] for row in rows})} notes")
+        for page, line, block_type in rows:
+            print(f"  📄 {page}:{line} ({block_type})")
+    if top:
+        print(f"🏆 Most linked targets:")
+        for target, pages in top:
+            print(f"  {pages:6d}  [[{target}]]")
+    if not args.targets and not top:
+        stats = index.stats()
+        print(f"📊 Index: {stats['pages']} notes, {stats['mentions']} mentions of {stats['targets']} targets")
+        print(f"📁 {index.path}")
+    else:
+        print(f"⏱️  Query: {query_ms:.1f} ms")
+
+    index.close()
+    if args.targets and not any(results.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
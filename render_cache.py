@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+PDF Render Cache
+
+Records, for every rendered output file, a hash of everything that went into
+it (markdown source, stylesheet, backend and version, generated date). When
+the same output is requested again with the same inputs and the file on disk
+is still the one that was written, the render can be skipped entirely.
+
+The records live in a SQLite file next to the highlight cache, so batch worker
+processes can share it.
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from highlight_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_RENDER_CACHE_PATH = DEFAULT_CACHE_DIR / 'render_cache.sqlite3'
+
+
+def make_render_key(*parts) -> str:
+    """Hash the inputs of a render; parts must be JSON-serialisable"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def file_digest(path) -> str:
+    """Hash a file's bytes, reading it in blocks rather than as one string"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """SQLite-backed record of rendered outputs and the inputs they were built from."""
+
+    def __init__(self, path=DEFAULT_RENDER_CACHE_PATH):
+        import sqlite3
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS renders ("
+            "output TEXT PRIMARY KEY, key TEXT NOT NULL, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, rendered_at REAL NOT NULL)"
+        )
+
+    def lookup(self, output_paths, key: str) -> Optional[str]:
+        """Return whichever of output_paths is unchanged since it was rendered from key"""
+        for output_path in output_paths:
+            output_path = os.path.abspath(output_path)
+            row = self.connection.execute(
+                "SELECT key, size, mtime_ns FROM renders WHERE output = ?", (output_path,)
+            ).fetchone()
+            if row is None or row[0] != key:
+                continue
+            try:
+                stat = os.stat(output_path)
+            except OSError:
+                continue
+            if (stat.st_size, stat.st_mtime_ns) == (row[1], row[2]):
+                return output_path
+        return None
+
+    def record(self, output_path, key: str) -> None:
+        """Remember that output_path was just rendered from key"""
+        output_path = os.path.abspath(output_path)
+        stat = os.stat(output_path)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO renders (output, key, size, mtime_ns, rendered_at) VALUES (?, ?, ?, ?, ?)",
+            (output_path, key, stat.st_size, stat.st_mtime_ns, time.time())
+        )
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Streaming ReportLab PDF Backend
+
+Renders markdown straight to PDF with ReportLab, without building or laying
+out HTML. The markdown is read line by line into blocks (headings, paragraphs,
+lists, code, quotes, tables), each block becomes ReportLab flowables and the
+flowables are laid out through a small look-ahead window as they are produced:
+
+- the document is never held as one string or one flowable list, and each
+  page's content stream is compressed as soon as the page ends
+- memory still grows with the page count: ReportLab keeps every page object
+  until the PDF is saved, and saving formats the whole file in memory
+- headings become PDF bookmarks, giving a navigable outline
+- the footer shows "Page N" (a total page count would need a second pass)
+
+Styling follows the converter stylesheet closely but not exactly: this backend
+is meant for very large exports where WeasyPrint is too slow or unavailable.
+
+Requirements: pip install reportlab
+"""
+
+import re
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import (BaseDocTemplate, Frame, HRFlowable, PageTemplate, Paragraph,
+                                Preformatted, Spacer, Table, TableStyle)
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFName, PDFStream, PDFZCompress
+
+from vault.blocks import FENCE_PATTERN, closes_fence
+
+HEADING_PATTERN = re.compile(r'^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$')
+RULE_PATTERN = re.compile(r'^\s{0,3}([-*_])(?:\s*\1){2,}\s*$')
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(?:\[([ xX])\]\s+)?(.*)$')
+QUOTE_PATTERN = re.compile(r'^\s{0,3}>\s?(.*)$')
+CALLOUT_PATTERN = re.compile(r'^\[!(\w+)\][+-]?\s*(.*)$')
+SETEXT_H1_PATTERN = re.compile(r'^\s{0,3}=+\s*$')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+
+INLINE_PATTERN = re.compile(
+    r'`([^`]+)`'                                  # 1: code span
+    r'|\*\*(.+?)\*\*|__(.+?)__'                   # 2, 3: bold
+    r'|\*(?!\s)(.+?)\*|(?<!\w)_(?!\s)(.+?)_(?!\w)'  # 4, 5: italic
+    r'|~~(.+?)~~'                                 # 6: strikethrough
+    r'|\[\[([^\]|]+)(?:\|([^\]]+))?\]\]'          # 7, 8: wikilink target, alias
+    r'|!\[([^\]]*)\]\([^)]*\)'                    # 9: image alt text
+    r'|\[([^\]]+)\]\(([^)\s]+)[^)]*\)'            # 10, 11: link text, url
+)
+
+# Flowables kept ahead of layout so keepWithNext (headings) can see what follows
+LOOKAHEAD = 32
+
+# Code lines are wrapped at this many characters (9pt Courier on A4 with 2cm margins)
+CODE_LINE_LENGTH = 92
+
+
+def escape(text: str) -> str:
+    """Escape text for ReportLab paragraph markup"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def inline_markup(text: str) -> str:
+    """Convert markdown inline syntax to ReportLab paragraph markup"""
+    parts = []
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        parts.append(escape(text[position:match.start()]))
+        position = match.end()
+        code, bold, bold_alt, italic, italic_alt, strike, target, alias, image_alt, link_text, url = match.groups()
+        if code is not None:
+            parts.append(f'<font face="Courier" color="#e74c3c">{escape(code)}</font>')
+        elif bold is not None or bold_alt is not None:
+            parts.append(f'<b>{inline_markup(bold or bold_alt)}</b>')
+        elif italic is not None or italic_alt is not None:
+            parts.append(f'<i>{inline_markup(italic or italic_alt)}</i>')
+        elif strike is not None:
+            parts.append(f'<strike>{inline_markup(strike)}</strike>')
+        elif target is not None:
+            label = alias or target.split('/')[-1].split('#')[0]
+            parts.append(f'<font color="#2980b9">{escape(label)}</font>')
+        elif image_alt is not None:
+            parts.append(f'<i>{escape(image_alt)}</i>')
+        elif url.startswith('#'):
+            # Anchor targets may lie ahead of the streamed position, so they are not linked
+            parts.append(f'<font color="#2980b9">{inline_markup(link_text)}</font>')
+        else:
+            href = escape(url).replace('"', '&quot;')
+            parts.append(f'<link href="{href}" color="#2980b9">{inline_markup(link_text)}</link>')
+    parts.append(escape(text[position:]))
+    return ''.join(parts)
+
+
+def split_table_row(line: str) -> List[str]:
+    """Split a markdown table row into cell texts"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
+def iter_markdown_blocks(lines: Iterable[str], drop_title: bool = False) -> Iterator[Tuple]:
+    """Group markdown lines into blocks without reading ahead more than one block.
+
+    Yields ('heading', level, text), ('paragraph', text), ('code', lang, text),
+    ('item', depth, marker, checked, text), ('quote', lines), ('table', rows)
+    and ('rule',). With drop_title the first level-1 heading (ATX or setext) is
+    left out, as the converter's header already shows the document title.
+    """
+    paragraph = []
+    # Whether the line before the paragraph's first line was blank (a setext title needs one)
+    paragraph_after_blank = True
+    previous_blank = True
+    quote = []
+    table = []
+    item = None
+    fence = None
+    code_lang = ''
+    code_lines = []
+
+    def flush():
+        nonlocal item
+        if paragraph:
+            yield ('paragraph', '\n'.join(paragraph))
+            paragraph.clear()
+        if item:
+            yield item
+            item = None
+        if quote:
+            yield ('quote', list(quote))
+            quote.clear()
+        if table:
+            if len(table) > 1 and TABLE_SEPARATOR_PATTERN.match(table[1]):
+                yield ('table', [split_table_row(row) for row in table[:1] + table[2:]])
+            else:
+                yield ('paragraph', '\n'.join(table))
+            table.clear()
+
+    for line in lines:
+        line = line.rstrip('\n').expandtabs(4)
+        after_blank = previous_blank
+        previous_blank = not line.strip()
+
+        if fence is not None:
+            closing = FENCE_PATTERN.match(line)
+            if closing and closes_fence(fence, closing):
+                yield ('code', code_lang, '\n'.join(code_lines))
+                fence = None
+                code_lines = []
+            else:
+                code_lines.append(line)
+            continue
+
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            yield from flush()
+            fence, code_lang = fence_match.group(1), fence_match.group(2)
+            continue
+
+        if not line.strip():
+            yield from flush()
+            continue
+
+        quote_match = QUOTE_PATTERN.match(line)
+        if quote_match and not paragraph and not item:
+            if table:
+                yield from flush()
+            quote.append(quote_match.group(1))
+            continue
+        if quote:
+            yield from flush()
+
+        if line.lstrip().startswith('|') and not paragraph and not item:
+            table.append(line)
+            continue
+        if table:
+            yield from flush()
+
+        heading_match = HEADING_PATTERN.match(line)
+        if heading_match:
+            yield from flush()
+            if drop_title and len(heading_match.group(1)) == 1:
+                drop_title = False
+            else:
+                yield ('heading', len(heading_match.group(1)), heading_match.group(2))
+            continue
+
+        if drop_title and len(paragraph) == 1 and paragraph_after_blank and SETEXT_H1_PATTERN.match(line):
+            drop_title = False
+            paragraph.clear()
+            continue
+
+        if RULE_PATTERN.match(line):
+            yield from flush()
+            yield ('rule',)
+            continue
+
+        item_match = LIST_ITEM_PATTERN.match(line)
+        if item_match:
+            yield from flush()
+            indent, marker, checked, text = item_match.groups()
+            item = ('item', len(indent) // 2, marker, checked, text)
+            continue
+
+        if item:
+            # Lazy continuation of the current list item
+            item = item[:4] + (item[4] + '\n' + line.strip(),)
+        else:
+            if not paragraph:
+                paragraph_after_blank = after_blank
+            paragraph.append(line.strip())
+
+    if fence is not None:
+        yield ('code', code_lang, '\n'.join(code_lines))
+    yield from flush()
+
+
+class MarkdownFlowables:
+    """Turns markdown blocks into ReportLab flowables with the converter's look."""
+
+    def __init__(self, content_width: float):
+        self.content_width = content_width
+        sample = getSampleStyleSheet()
+        self.body = ParagraphStyle('Body', parent=sample['BodyText'], fontName='Helvetica', fontSize=11,
+                                   leading=16, textColor=colors.HexColor('#333333'), alignment=TA_JUSTIFY,
+                                   spaceAfter=9)
+        heading_specs = [(24, '#2c3e50', 20, 14), (18, '#34495e', 18, 11), (14, '#2c3e50', 14, 8),
+                         (12, '#34495e', 11, 6), (11, '#7f8c8d', 8, 4), (11, '#7f8c8d', 8, 4)]
+        self.headings = [
+            ParagraphStyle(f'Heading{level}', parent=sample[f'Heading{min(level, 6)}'], fontName='Helvetica-Bold',
+                           fontSize=size, leading=size * 1.25, textColor=colors.HexColor(color),
+                           spaceBefore=before, spaceAfter=after, keepWithNext=1)
+            for level, (size, color, before, after) in enumerate(heading_specs, 1)
+        ]
+        self.code = ParagraphStyle('Code', fontName='Courier', fontSize=9, leading=12.5,
+                                   textColor=colors.HexColor('#333333'), backColor=colors.HexColor('#f8f9fa'),
+                                   borderColor=colors.HexColor('#e9ecef'), borderWidth=0.5, borderPadding=8,
+                                   spaceBefore=8, spaceAfter=16)
+        self.quote = ParagraphStyle('Quote', parent=self.body, fontName='Helvetica-Oblique', leftIndent=16,
+                                    borderColor=colors.HexColor('#3498db'), borderWidth=0, borderPadding=(4, 4, 4, 8),
+                                    backColor=colors.HexColor('#f8f9fa'), alignment=0)
+        self.cell = ParagraphStyle('Cell', parent=self.body, fontSize=10, leading=13, spaceAfter=0, alignment=0)
+        self.header_cell = ParagraphStyle('HeaderCell', parent=self.cell, fontName='Helvetica-Bold',
+                                          textColor=colors.HexColor('#2c3e50'))
+        self.item_styles = {}
+
+    def paragraph(self, text: str, style: ParagraphStyle) -> Paragraph:
+        """Build a paragraph, falling back to plain text when the markup is rejected"""
+        try:
+            return Paragraph(inline_markup(text).replace('\n', '<br/>'), style)
+        except ValueError:
+            return Paragraph(escape(text).replace('\n', '<br/>'), style)
+
+    def item_style(self, depth: int, task: bool) -> ParagraphStyle:
+        """Return the (cached) list item style for a nesting depth"""
+        key = (depth, task)
+        if key not in self.item_styles:
+            left_indent = 22 + depth * 18
+            self.item_styles[key] = ParagraphStyle(
+                f'Item{depth}{"Task" if task else ""}', parent=self.body, leftIndent=left_indent,
+                bulletIndent=left_indent - 14, spaceAfter=4, alignment=0,
+                bulletFontName='ZapfDingbats' if task else 'Helvetica'
+            )
+        return self.item_styles[key]
+
+    def header(self, title: str, subtitle: str, generated_date: str) -> List:
+        """Title block shown at the top of the first page"""
+        title_style = ParagraphStyle('Title', parent=self.headings[0], alignment=1, keepWithNext=0)
+        info_style = ParagraphStyle('Info', parent=self.body, alignment=1, textColor=colors.HexColor('#555555'))
+        return [
+            Paragraph(escape(title), title_style),
+            Paragraph(f'<b>{escape(subtitle)}</b>', info_style),
+            Paragraph(f'Generated on {escape(generated_date)}', info_style),
+            HRFlowable(width='100%', thickness=2, color=colors.HexColor('#3498db'), spaceAfter=12),
+        ]
+
+    def flowables(self, block: Tuple) -> List:
+        """Return the flowables for one markdown block"""
+        kind = block[0]
+        if kind == 'heading':
+            _, level, text = block
+            heading = self.paragraph(text, self.headings[level - 1])
+            heading.outline_level = level
+            heading.outline_text = re.sub(r'[*_`\[\]]', '', text)
+            if level <= 2:
+                rule_color = '#3498db' if level == 1 else '#ecf0f1'
+                return [heading, HRFlowable(width='100%', thickness=3 - level, color=colors.HexColor(rule_color),
+                                            spaceBefore=0, spaceAfter=8)]
+            return [heading]
+        if kind == 'paragraph':
+            return [self.paragraph(block[1], self.body)]
+        if kind == 'item':
+            _, depth, marker, checked, text = block
+            if checked is not None:
+                bullet = '4' if checked in 'xX' else 'o'
+            else:
+                bullet = marker if marker[0].isdigit() else '•'
+            item = self.paragraph(text, self.item_style(depth, checked is not None))
+            item.bulletText = bullet
+            return [item]
+        if kind == 'code':
+            return [Preformatted(block[2] or ' ', self.code, maxLineLength=CODE_LINE_LENGTH, newLineChars='')]
+        if kind == 'quote':
+            lines = block[1]
+            callout = CALLOUT_PATTERN.match(lines[0]) if lines else None
+            if callout:
+                title = callout.group(2) or callout.group(1).capitalize()
+                lines = [f'**{title}**'] + lines[1:]
+            return [self.paragraph('\n'.join(lines), self.quote), Spacer(1, 4)]
+        if kind == 'table':
+            return [self.table(block[1])]
+        if kind == 'rule':
+            return [HRFlowable(width='100%', thickness=1, color=colors.HexColor('#dddddd'),
+                               spaceBefore=6, spaceAfter=10)]
+        return []
+
+    def table(self, rows: List[List[str]]) -> Table:
+        """Build a full-width table; the header row repeats on every page"""
+        column_count = max(len(row) for row in rows)
+        data = []
+        for index, row in enumerate(rows):
+            style = self.header_cell if index == 0 else self.cell
+            cells = row + [''] * (column_count - len(row))
+            data.append([self.paragraph(cell, style) for cell in cells])
+        table = Table(data, colWidths=[self.content_width / column_count] * column_count, repeatRows=1)
+        table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#dddddd')),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f2f2f2')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        table.spaceAfter = 12
+        return table
+
+
+class StreamingDocTemplate(BaseDocTemplate):
+    """Document template that lays out flowables as they are produced."""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, pagesize=A4, leftMargin=2 * cm, rightMargin=2 * cm,
+                         topMargin=2 * cm, bottomMargin=2 * cm, pageCompression=1, **kwargs)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([PageTemplate(id='page', frames=frame, onPage=self.draw_footer)])
+        self.outline_level = -1
+        self.heading_count = 0
+
+    def draw_footer(self, canvas, doc) -> None:
+        canvas.saveState()
+        canvas.setFont('Helvetica', 9)
+        canvas.setFillColor(colors.HexColor('#666666'))
+        canvas.drawRightString(self.pagesize[0] - self.rightMargin, self.bottomMargin / 2, f"Page {doc.page}")
+        canvas.restoreState()
+
+    def handle_pageEnd(self) -> None:
+        """End the page and compress its content stream right away"""
+        super().handle_pageEnd()
+        # ReportLab keeps every page's drawing operators as text until the document is saved
+        page = self.canv._doc.Pages[-1]
+        if page.stream and not page.Contents:
+            contents = PDFStream(content=PDFZCompress.encode(page.stream))
+            contents.dictionary['Filter'] = PDFArray([PDFName(PDFZCompress.pdfname)])
+            page.Contents = contents
+            page.stream = None
+
+    def afterFlowable(self, flowable) -> None:
+        """Bookmark headings in the PDF outline"""
+        level = getattr(flowable, 'outline_level', None)
+        if level is None:
+            return
+        # Outline levels may only deepen one step at a time
+        level = min(level - 1, self.outline_level + 1)
+        self.outline_level = level
+        self.heading_count += 1
+        key = f'h{self.heading_count}'
+        self.canv.bookmarkPage(key)
+        self.canv.addOutlineEntry(flowable.outline_text, key, level=level, closed=level > 0)
+
+    def build_stream(self, flowables: Iterable) -> None:
+        """Lay out flowables from an iterator, keeping only a small window in memory"""
+        self._startBuild()
+        self.canv._doctemplate = self
+        window = deque()
+        source = iter(flowables)
+        try:
+            while True:
+                while len(window) < LOOKAHEAD:
+                    flowable = next(source, None)
+                    if flowable is None:
+                        break
+                    window.append(flowable)
+                if not window:
+                    break
+                pending = list(window)
+                window.clear()
+                # Lay out the first flowable; anything split or not yet placed stays in the window
+                self.clean_hanging()
+                self.handle_flowable(pending)
+                window.extend(pending)
+        finally:
+            del self.canv._doctemplate
+        self._endBuild()
+
+
+def render_markdown_lines(lines: Iterable[str], output_path: str, title: str, subtitle: str,
+                          generated_date: str, header: bool = True, drop_title: bool = False) -> int:
+    """Render markdown lines (e.g. an open file) to a PDF file; returns the number of pages"""
+    doc = StreamingDocTemplate(output_path, title=title, subject=subtitle)
+    builder = MarkdownFlowables(doc.width)
+
+    def generate():
+        if header:
+            yield from builder.header(title, subtitle, generated_date)
+        for block in iter_markdown_blocks(lines, drop_title):
+            yield from builder.flowables(block)
+
+    doc.build_stream(generate())
+    return doc.page
@@ -9,6 +9,7 @@ Usage:
   python restore_activity_todos.py --dry-run    # Preview changes without making them
   python restore_activity_todos.py --confirm    # Make changes with confirmation
   python restore_activity_todos.py --auto       # Make changes automatically
+  python restore_activity_todos.py --from 2025-07-01 --to 2025-07-31   # Only restore dates in July
 """
 
 import os
@@ -17,16 +18,33 @@ import glob
 import argparse
 import shutil
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 from datetime import datetime
 
+from instrumentation import add_profile_argument, phase, start_profiling
+from vault.blocks import FENCE_PATTERN, HEADER_PATTERN, line_block_type
+from vault.layout import MONTH_NAMES, JournalLayout, add_layout_argument, load_layout
+from vault.sections import has_date_markers, iter_date_sections, section_dates
+
 class ActivityTodosRestorer:
-    def __init__(self, vault_path: str = "..", dry_run: bool = True):
+    def __init__(self, vault_path: str = "..", dry_run: bool = True, use_index: bool = True,
+                 date_from: Optional[str] = None, date_to: Optional[str] = None,
+                 summary_dir: Optional[str] = None, journal_layout: Optional[str] = None):
         # Since script is in Engine folder, vault root is one level up
         self.vault_path = Path(vault_path).resolve()
         self.activities_path = self.vault_path / "Activities"
         self.journal_path = self.vault_path / "Journal"
         self.dry_run = dry_run
+        # Look up date markers in the daemon or the mention index instead of reading every activity file
+        self.use_index = use_index
+        # Only restore dates within this range (YYYY-MM-DD, inclusive; None leaves that side open)
+        self.date_from = date_from
+        self.date_to = date_to
+        # Daily note path pattern (None: detected from the Journal folder), loaded with its date tables on first use
+        self.journal_layout = journal_layout
+        self.layout: Optional[JournalLayout] = None
+        # Where the summary file goes (default: the Engine directory)
+        self.summary_dir = Path(summary_dir) if summary_dir else Path(__file__).parent
         self.backup_dir = None
         self.backed_up_files = set()
         
@@ -97,38 +115,32 @@ class ActivityTodosRestorer:
             print(f"Error writing {file_path}: {e}")
             return False
     
+    def in_date_range(self, date: str) -> bool:
+        """Whether a date falls within the --from/--to range"""
+        return (self.date_from is None or date >= self.date_from) and (self.date_to is None or date <= self.date_to)
+    
     def extract_activity_content(self, activity_file: Path) -> Dict[str, List[str]]:
         """Extract all content from activity file organized by date"""
-        content = self.read_file(activity_file)
-        if not content:
-            return {}
-        
         # Find all date markers and their associated content
         date_content = {}
         
-        # Pattern to match date markers like [[2025-07-04]]
-        date_pattern = r'\[\[(\d{4}-\d{2}-\d{2})\]\]'
-        
-        # Split content by date markers
-        parts = re.split(date_pattern, content)
-        
-        # Process parts in pairs (date, content)
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                date = parts[i]
-                section_content = parts[i + 1]
-                
+        try:
+            # Sections after date markers like [[2025-07-04]], streamed one at a time
+            for date, lines in iter_date_sections(activity_file, self.date_from, self.date_to):
                 # Extract all relevant content from this section
-                content_items = self.extract_content_from_section(section_content)
+                content_items = self.extract_content_from_section(lines)
                 if content_items:
                     date_content[date] = content_items
+        except Exception as e:
+            print(f"Error reading {activity_file}: {e}")
+            return {}
         
         return date_content
     
-    def extract_content_from_section(self, section: str) -> List[str]:
-        """Extract all relevant content from a section of text after a date marker"""
+    def extract_content_from_section(self, section: Union[str, Iterable[str]]) -> List[str]:
+        """Extract all relevant content from a section of text (or its lines) after a date marker"""
         content_items = []
-        lines = section.split('\n')
+        lines = section.split('\n') if isinstance(section, str) else section
         
         # Track if we're in a meaningful content block
         in_content_block = False
@@ -182,6 +194,28 @@ class ActivityTodosRestorer:
         
         return content_items
     
+    def load_date_markers(self) -> Optional[Dict[str, List[str]]]:
+        """Dates marked in each activity file (relative path -> dates), from the daemon or the mention index"""
+        if not self.use_index:
+            return None
+        from vault.daemon import request_daemon
+
+        markers = request_daemon(self.vault_path, "date_markers", folder="Activities")
+        if markers is not None:
+            print(f"🛰️  Engine daemon: {len(markers)} activity files with date markers")
+            return {page[len("Activities/"):]: dates for page, dates in markers.items()}
+
+        from vault.mentions import MentionIndex
+        
+        index = MentionIndex(self.vault_path)
+        try:
+            parsed, removed = index.update(["Activities"])
+            markers = index.date_markers("Activities")
+        finally:
+            index.close()
+        print(f"🗂️  Mention index: {len(markers)} activity files with date markers ({parsed} re-indexed)")
+        return {page[len("Activities/"):]: dates for page, dates in markers.items()}
+    
     def analyze_content_types(self, content_items: List[str]) -> List[str]:
         """Analyze the types of content in the content items"""
         types = set()
@@ -191,17 +225,19 @@ class ActivityTodosRestorer:
             if not stripped:
                 continue
                 
-            if re.match(r'^- \[[x ]\]', stripped):
+            # Same line classification as the block parser
+            block_type = line_block_type(stripped)
+            if block_type in ("todo", "done"):
                 types.add("todos")
             elif re.match(r'^- ', stripped):
                 types.add("lists")
             elif re.match(r'^\d+\. ', stripped):
                 types.add("numbered lists")
-            elif re.match(r'^#{4,6}\s+', stripped):
+            elif block_type == "header" and len(HEADER_PATTERN.match(stripped).group(1)) >= 4:
                 types.add("headers")
-            elif stripped.startswith('```'):
+            elif FENCE_PATTERN.match(stripped):
                 types.add("code blocks")
-            elif stripped.startswith('>'):
+            elif block_type == "callout":
                 types.add("quotes")
             elif stripped in ['---', '----', '-----']:
                 types.add("dividers")
@@ -210,22 +246,21 @@ class ActivityTodosRestorer:
         
         return sorted(list(types))
     
+    def get_journal_layout(self) -> JournalLayout:
+        """Layout of the Journal folder, with its date <-> path tables precomputed"""
+        if self.layout is None:
+            with phase("journal layout"):
+                self.layout = load_layout(self.journal_path, self.journal_layout)
+        return self.layout
+    
     def get_daily_note_path(self, date: str) -> Optional[Path]:
         """Get the path to a daily note based on date"""
-        try:
-            # Parse date
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            year = date_obj.year
-            month_num = date_obj.month
-            month_name = date_obj.strftime('%m.%B')
-            
-            # Construct path: Journal/2025/07.July/2025-07-05.md
-            daily_note_path = self.journal_path / str(year) / month_name / f"{date}.md"
-            return daily_note_path
-            
-        except ValueError as e:
-            print(f"Invalid date format {date}: {e}")
+        # Table lookup, e.g. Journal/2025/07.July/2025-07-05.md in the default layout
+        relative_path = self.get_journal_layout().path_for(date)
+        if relative_path is None:
+            print(f"Invalid date format {date}")
             return None
+        return self.journal_path / relative_path
 
     def create_daily_note(self, date: str, confirm: bool = False) -> bool:
         """Create a new daily note with proper structure"""
@@ -237,10 +272,10 @@ class ActivityTodosRestorer:
             return True  # Already exists
         
         try:
-            # Parse date for formatting
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            day = date_obj.strftime('%d')
-            month_name = date_obj.strftime('%B')
+            # Date from the layout's tables for formatting
+            date_obj = self.get_journal_layout().day(date)
+            day = f"{date_obj.day:02d}"
+            month_name = MONTH_NAMES[date_obj.month]
             year = date_obj.year
             
             # Calculate week number
@@ -249,7 +284,7 @@ class ActivityTodosRestorer:
             # Create daily note content
             daily_note_content = f"""---
 ---
-### {day} [[{year}-{date_obj.strftime('%m')}|{month_name}]] [[{year}]]
+### {day} [[{year}-{date_obj.month:02d}|{month_name}]] [[{year}]]
 #### Week: [[{year}-W{week_num:02d}|{week_num}]]
 
 ----
@@ -406,8 +441,8 @@ class ActivityTodosRestorer:
         if not daily_note_path.exists():
             print(f"  📅 Daily note does not exist: {daily_note_path.name}")
             
-            # Extract date from filename for daily note creation
-            date_str = daily_note_path.stem  # e.g., "2025-07-04"
+            # Date the layout puts at this path, for daily note creation
+            date_str = self.get_journal_layout().date_of(daily_note_path.relative_to(self.journal_path).as_posix())
             
             # Ask permission to create the daily note
             if confirm and not self.dry_run:
@@ -495,13 +530,15 @@ class ActivityTodosRestorer:
             print(f"  ❌ Failed to write content for '{activity_name}' in {daily_note_path.name}")
             return False
     
-    def process_activity_file(self, activity_file: Path, confirm: bool = False) -> int:
+    def process_activity_file(self, activity_file: Path, confirm: bool = False,
+                              date_content: Optional[Dict[str, List[str]]] = None) -> int:
         """Process a single activity file and restore its content"""
         activity_name = activity_file.stem
         print(f"\n📁 Processing activity: {activity_name}")
         
-        # Extract content organized by date
-        date_content = self.extract_activity_content(activity_file)
+        # Extract content organized by date (unless the caller already did)
+        if date_content is None:
+            date_content = self.extract_activity_content(activity_file)
         
         if not date_content:
             print(f"  No dated content found in {activity_name}")
@@ -537,6 +574,8 @@ class ActivityTodosRestorer:
         print(f"📂 Vault path: {self.vault_path.absolute()}")
         print(f"📂 Activities path: {self.activities_path}")
         print(f"📂 Journal path: {self.journal_path}")
+        if self.date_from or self.date_to:
+            print(f"📅 Date range: {self.date_from or 'start'} to {self.date_to or 'end'}")
         
         if self.dry_run:
             print("🔍 DRY RUN MODE: No files will be modified")
@@ -549,6 +588,9 @@ class ActivityTodosRestorer:
             print(f"❌ Journal directory not found: {self.journal_path}")
             return {"error": "Journal directory not found"}
         
+        layout = self.get_journal_layout()
+        print(f"🗓️  Journal layout: {layout.pattern} ({len(layout.days)} days precomputed)")
+        
         # Find all activity files recursively
         activity_files = list(self.activities_path.rglob("*.md"))
         print(f"📋 Found {len(activity_files)} activity files (including subfolders)")
@@ -563,6 +605,9 @@ class ActivityTodosRestorer:
         
         total_restored = 0
         processed_activities = 0
+        outside_range = 0
+        with phase("load date markers"):
+            date_markers = self.load_date_markers()
         
         # Process each activity file
         for activity_file in activity_files:
@@ -570,8 +615,29 @@ class ActivityTodosRestorer:
                 activity_name = activity_file.stem
                 relative_path = activity_file.relative_to(self.activities_path)
                 
+                if date_markers is not None:
+                    has_markers = relative_path.as_posix() in date_markers
+                else:
+                    # Byte-level check: most files are ruled out by a single find, without decoding
+                    has_markers = has_date_markers(activity_file)
+                if not has_markers:
+                    # No [[YYYY-MM-DD]] markers, so nothing to restore and no need to parse the file
+                    unused_activity_files.add(str(relative_path))
+                    print(f"\n📁 Processing activity: {activity_name}")
+                    print(f"  No dated content found in {activity_name}")
+                    processed_activities += 1
+                    continue
+                
+                if date_markers is not None and not any(map(self.in_date_range, date_markers[relative_path.as_posix()])):
+                    # Every marked date is outside --from/--to, so the file is not read
+                    print(f"\n📁 Processing activity: {activity_name}")
+                    print(f"  ⏭️  No dates between {self.date_from or 'start'} and {self.date_to or 'end'}")
+                    outside_range += 1
+                    continue
+                
                 # Try to extract content
-                date_content = self.extract_activity_content(activity_file)
+                with phase("extract", activity=activity_name):
+                    date_content = self.extract_activity_content(activity_file)
                 
                 if date_content:
                     used_activity_files.add(str(relative_path))
@@ -587,13 +653,19 @@ class ActivityTodosRestorer:
                             date_to_activities[date].append(activity_name)
                 else:
                     # Check if file has date markers but no content (problematic format)
-                    content = self.read_file(activity_file)
-                    if re.search(r'\[\[(\d{4}-\d{2}-\d{2})\]\]', content):
+                    dates = date_markers[relative_path.as_posix()] if date_markers is not None else section_dates(activity_file)
+                    if dates and not any(map(self.in_date_range, dates)):
+                        print(f"\n📁 Processing activity: {activity_name}")
+                        print(f"  ⏭️  No dates between {self.date_from or 'start'} and {self.date_to or 'end'}")
+                        outside_range += 1
+                        continue
+                    if dates:
                         problematic_activity_files.add(str(relative_path))
                     else:
                         unused_activity_files.add(str(relative_path))
                 
-                restored = self.process_activity_file(activity_file, confirm)
+                with phase("restore", activity=activity_name, dates=len(date_content)):
+                    restored = self.process_activity_file(activity_file, confirm, date_content)
                 total_restored += restored
                 processed_activities += 1
             except Exception as e:
@@ -604,15 +676,18 @@ class ActivityTodosRestorer:
         print(f"📊 Summary:")
         print(f"   - Activities processed: {processed_activities}")
         print(f"   - Daily notes restored: {total_restored}")
+        if outside_range:
+            print(f"   - Activities outside the date range: {outside_range}")
         
-        # Detailed summaries
-        summary_content = self.print_detailed_summaries(used_activity_files, unused_activity_files, problematic_activity_files, 
-                                    affected_daily_notes, activity_to_dates, date_to_activities)
-        
-        # Save summaries to file
-        self.save_summary_to_file(summary_content, used_activity_files, unused_activity_files, 
-                                 problematic_activity_files, affected_daily_notes, activity_to_dates, 
-                                 date_to_activities, processed_activities, total_restored)
+        with phase("summaries"):
+            # Detailed summaries
+            summary_content = self.print_detailed_summaries(used_activity_files, unused_activity_files, problematic_activity_files, 
+                                        affected_daily_notes, activity_to_dates, date_to_activities)
+            
+            # Save summaries to file
+            self.save_summary_to_file(summary_content, used_activity_files, unused_activity_files, 
+                                     problematic_activity_files, affected_daily_notes, activity_to_dates, 
+                                     date_to_activities, processed_activities, total_restored)
         
         if self.dry_run:
             print(f"\n💡 To actually make changes, run with --confirm or --auto")
@@ -768,8 +843,7 @@ class ActivityTodosRestorer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         mode_suffix = "dry_run" if self.dry_run else "executed"
         summary_filename = f"activity_todos_restoration_summary_{timestamp}_{mode_suffix}.md"
-        script_dir = Path(__file__).parent  # Engine directory
-        summary_path = script_dir / summary_filename
+        summary_path = self.summary_dir / summary_filename
         
         # Create comprehensive summary content
         full_summary = []
@@ -816,6 +890,12 @@ class ActivityTodosRestorer:
         except Exception as e:
             print(f"\n⚠️  Failed to save summary to file: {e}")
 
+def parse_date(value: str) -> str:
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Restore activity content to daily notes")
@@ -825,8 +905,19 @@ def main():
                        help="Make changes with confirmation prompts")
     parser.add_argument("--auto", action="store_true", 
                        help="Make changes automatically without prompts")
+    parser.add_argument("--vault-path", type=str, default="..",
+                       help="Path to vault root (default: .. from Engine directory)")
+    parser.add_argument("--no-index", action="store_true",
+                       help="Read every activity file instead of using the daemon or the mention index")
+    parser.add_argument("--from", dest="date_from", type=parse_date,
+                       help="Only restore dates from this day on (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=parse_date,
+                       help="Only restore dates up to this day (YYYY-MM-DD)")
+    add_layout_argument(parser)
+    add_profile_argument(parser)
     
     args = parser.parse_args()
+    start_profiling(args.profile, "restore_activity_content")
     
     # Determine mode
     if args.auto:
@@ -852,7 +943,9 @@ def main():
     print()
     
     # Initialize restorer
-    restorer = ActivityTodosRestorer(dry_run=dry_run)
+    restorer = ActivityTodosRestorer(vault_path=args.vault_path, dry_run=dry_run, use_index=not args.no_index,
+                                     date_from=args.date_from, date_to=args.date_to,
+                                     journal_layout=args.journal_layout)
     
     # Run restoration
     result = restorer.run(confirm=confirm)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Todo Rollover Backfill
+
+Applies the daily note todo rollover to a whole range of dates at once (e.g.
+after a vacation), with the same rules as todoRollover.js: incomplete
+standalone todos roll forward from each note into the next, activity todos
+stay, todos already in a note are not duplicated and rolled todos go after the
+note's last `---`. Written notes are backed up first.
+
+Usage:
+  python rollover.py --from 2025-07-01 --to 2025-07-31           # Preview (default)
+  python rollover.py --from 2025-07-01 --to 2025-07-31 --auto    # Write the notes
+  python rollover.py --from 2025-07-01 --lookback 90             # Ignore a previous note older than 90 days
+"""
+
+import time
+import argparse
+from datetime import date, datetime
+
+from vault.layout import add_layout_argument
+from vault.rollover import TodoRollover
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Roll incomplete todos over into a range of daily notes")
+    parser.add_argument("--from", dest="start", type=parse_date,
+                        help="First daily note to roll todos into (default: --to)")
+    parser.add_argument("--to", dest="end", type=parse_date, default=date.today(),
+                        help="Last daily note to roll todos into (default: today)")
+    parser.add_argument("--lookback", type=int, metavar="DAYS",
+                        help="Only roll todos from a previous note at most DAYS before --from (default: any)")
+    parser.add_argument("--dry-run", action="store_true", default=True,
+                       help="Preview changes without making them (default)")
+    parser.add_argument("--auto", action="store_true",
+                       help="Write the daily notes without prompts")
+    parser.add_argument("--vault-path", type=str, default="..",
+                       help="Path to vault root (default: .. from Engine directory)")
+    add_layout_argument(parser)
+
+    args = parser.parse_args()
+    start = args.start or args.end
+    if start > args.end:
+        parser.error("--from must not be after --to")
+
+    dry_run = not args.auto
+    mode_text = "[DRY RUN] " if dry_run else ""
+    print("🚀 Todo Rollover Backfill")
+    print("=" * 50)
+    print(f"📅 {mode_text}Rolling todos into daily notes from {start} to {args.end}")
+
+    start_time = time.perf_counter()
+    rollover = TodoRollover(args.vault_path, start, args.end, args.lookback, dry_run, args.journal_layout)
+    summary = rollover.run()
+    elapsed = time.perf_counter() - start_time
+
+    for page, todos in summary["updated_notes"].items():
+        print(f"\n📝 {page}: {len(todos)} todos")
+        for line in todos[:5]:
+            print(f"    {line[:80] + '...' if len(line) > 80 else line}")
+        if len(todos) > 5:
+            print(f"    ... and {len(todos) - 5} more")
+
+    print(f"\n✅ {mode_text}Rollover complete in {elapsed:.2f}s")
+    print(f"📊 Summary:")
+    print(f"   - Daily notes in range: {summary['notes_in_range']} ({summary['missing_notes']} days without a note)")
+    print(f"   - Notes {'to update' if dry_run else 'updated'}: {len(summary['updated_notes'])}")
+    print(f"   - Todos rolled over: {summary['todos_added']}")
+    print(f"   - Open standalone todos in the last note: {summary['open_todos']}")
+    if dry_run and summary["updated_notes"]:
+        print(f"\n💡 To actually make changes, run with --auto")
+    elif summary["backup_dir"]:
+        print(f"\n📦 Backed up {len(summary['updated_notes'])} notes to: {summary['backup_dir']}")
+        print(f"   🔄 To undo, copy the files back from the backup directory")
+
+if __name__ == "__main__":
+    main()
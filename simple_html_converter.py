@@ -10,10 +10,122 @@ No external dependencies required - uses only Python standard library.
 import os
 import sys
 import re
+import time
+import argparse
+import threading
 import webbrowser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote
 from datetime import datetime
 from pathlib import Path
 
+from file_watcher import create_watcher, debounced_changes
+from instrumentation import add_profile_argument, phase, start_profiling
+from vault.blocks import TASK_ITEM_PATTERN
+
+# Obsidian constructs recognised in a single scan over the text. Code is
+# matched first so that links inside code blocks and spans are left alone.
+OBSIDIAN_SCAN = re.compile(
+    r'(?P<code><pre[^>]*>.*?</pre>|<code>.*?</code>)'
+    r'|^#{5}[ \t]+\[\[(?P<activity>Activities/[^\]|]+?)(?:\.md)?(?:\|(?P<activity_alias>[^\]]+))?\]\][ \t]*$'
+    r'|\[\[(?P<target>[^\]|]+)(?:\|(?P<alias>[^\]]+))?\]\]',
+    re.DOTALL | re.MULTILINE
+)
+DATE_LINK_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Injected into served pages in watch mode; reloads the tab on every re-render
+LIVE_RELOAD_SCRIPT = b"""<script>
+new EventSource('/__livereload').onmessage = function () { location.reload(); };
+</script>
+"""
+
+class LiveReloadServer:
+    """Serve rendered HTML locally and push reload events to open browser tabs."""
+
+    def __init__(self, root, port=8000):
+        self.root = Path(root)
+        self.port = port
+        self.version = 0
+        self.condition = threading.Condition()
+        self.httpd = None
+
+    def notify(self):
+        """Tell connected browsers that the output changed."""
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def wait_for_change(self, version, timeout=15.0):
+        """Wait until the output version moves past version or the timeout expires."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout=timeout)
+            return self.version
+
+    def make_handler(self):
+        """Create the request handler class bound to this server."""
+        server = self
+
+        class LiveReloadHandler(SimpleHTTPRequestHandler):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, directory=str(server.root), **kwargs)
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == '/__livereload':
+                    self.send_event_stream()
+                    return
+                path = Path(self.translate_path(self.path))
+                if path.suffix == '.html' and path.is_file():
+                    self.send_html(path)
+                    return
+                super().do_GET()
+
+            def send_html(self, path):
+                body = path.read_bytes().replace(b'</body>', LIVE_RELOAD_SCRIPT + b'</body>', 1)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def send_event_stream(self):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                version = server.version
+                try:
+                    while True:
+                        new_version = server.wait_for_change(version)
+                        message = b'data: reload\n\n' if new_version != version else b': ping\n\n'
+                        self.wfile.write(message)
+                        self.wfile.flush()
+                        version = new_version
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return LiveReloadHandler
+
+    def start(self):
+        """Start serving in a background thread."""
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', self.port), self.make_handler())
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop the HTTP server."""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+    def url_for(self, path):
+        """Return the local URL serving an output file."""
+        relative = Path(path).resolve().relative_to(self.root.resolve())
+        return f'http://127.0.0.1:{self.port}/{quote(relative.as_posix())}'
+
 class SimpleMarkdownToHTMLConverter:
     def __init__(self):
         self.css_styles = """
@@ -253,6 +365,39 @@ class SimpleMarkdownToHTMLConverter:
             text-align: center;
         }
         
+        .task-list {
+            list-style-type: none;
+            padding-left: 10px;
+        }
+        
+        .task-list-item {
+            list-style-type: none;
+        }
+        
+        .task-list-item input {
+            margin-right: 8px;
+        }
+        
+        .task-list-item.done {
+            color: #999;
+            text-decoration: line-through;
+        }
+        
+        .wikilink {
+            color: #8e44ad;
+        }
+        
+        .date-link {
+            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', 'Consolas', monospace;
+            font-size: 0.9em;
+        }
+        
+        h5.activity-header {
+            border-left: 4px solid #8e44ad;
+            padding-left: 10px;
+            font-size: 1.2em;
+        }
+        
         kbd {
             background-color: #f8f9fa;
             border: 1px solid #ccc;
@@ -331,6 +476,50 @@ class SimpleMarkdownToHTMLConverter:
         text = re.sub(r'`([^`]+)`', replace_inline_code, text)
         return text
 
+    def classify_wikilink(self, target):
+        """Return the token type of a wikilink target: date, activity or note."""
+        if DATE_LINK_PATTERN.match(target):
+            return 'date'
+        if target.startswith('Activities/'):
+            return 'activity'
+        return 'note'
+
+    def render_wikilink(self, target, alias=None):
+        """Render an Obsidian [[target|alias]] link as an HTML anchor."""
+        target = target.strip()
+        link_type = self.classify_wikilink(target)
+        page, _, heading = target.partition('#')
+        if page.endswith('.md'):
+            page = page[:-3]
+        href = quote(f'{page}.html') if page else ''
+        if heading:
+            anchor = re.sub(r'[^\w\s-]', '', heading).strip()
+            href += '#' + re.sub(r'[-\s]+', '-', anchor).lower()
+        label = alias.strip() if alias else target
+        return f'<a class="wikilink {link_type}-link" href="{href}">{label}</a>'
+
+    def convert_obsidian_links(self, text):
+        """Convert wikilinks, date links and activity headers in one scan."""
+        def replace_token(match):
+            if match.group('code'):
+                return match.group('code')
+            if match.group('activity'):
+                link = self.render_wikilink(match.group('activity'), match.group('activity_alias'))
+                return f'<h5 class="activity-header">{link}</h5>'
+            return self.render_wikilink(match.group('target'), match.group('alias'))
+        
+        return OBSIDIAN_SCAN.sub(replace_token, text)
+
+    def render_list_item(self, item_content):
+        """Render a list item, turning - [ ] / - [x] todos into checkboxes."""
+        task_match = TASK_ITEM_PATTERN.match(item_content)
+        if not task_match:
+            return f'<li>{item_content}</li>'
+        
+        if task_match.group(1) == ' ':
+            return f'<li class="task-list-item todo"><input type="checkbox" disabled> {task_match.group(2)}</li>'
+        return f'<li class="task-list-item done"><input type="checkbox" checked disabled> {task_match.group(2)}</li>'
+
     def convert_lists(self, text):
         """Convert markdown lists to HTML with proper nesting support."""
         lines = text.split('\n')
@@ -354,7 +543,7 @@ class SimpleMarkdownToHTMLConverter:
                     result.append('<ul>')
                     list_stack.append(('ul', item_indent))
                 
-                result.append(f'<li>{item_content}</li>')
+                result.append(self.render_list_item(item_content))
                 continue
             
             # Ordered list
@@ -456,6 +645,32 @@ class SimpleMarkdownToHTMLConverter:
             
         return '\n'.join(result)
 
+    def render_blockquote(self, quote_lines):
+        """Render blockquote lines, keeping > - [ ] callout todos as a task list."""
+        parts = []
+        text_lines = []
+        task_items = []
+        
+        for quote_line in quote_lines:
+            task_match = re.match(r'^[-*+]\s+(\[[ xX]\]\s+.*)$', quote_line)
+            if task_match:
+                if text_lines:
+                    parts.append('<p>' + '\n'.join(text_lines) + '</p>')
+                    text_lines = []
+                task_items.append(self.render_list_item(task_match.group(1)))
+            else:
+                if task_items:
+                    parts.append('<ul class="task-list">' + ''.join(task_items) + '</ul>')
+                    task_items = []
+                text_lines.append(quote_line)
+        
+        if text_lines:
+            parts.append('<p>' + '\n'.join(text_lines) + '</p>')
+        if task_items:
+            parts.append('<ul class="task-list">' + ''.join(task_items) + '</ul>')
+        
+        return '<blockquote>' + ''.join(parts) + '</blockquote>'
+
     def convert_blockquotes(self, text):
         """Convert blockquotes to HTML."""
         lines = text.split('\n')
@@ -472,16 +687,14 @@ class SimpleMarkdownToHTMLConverter:
             else:
                 if in_blockquote:
                     # Process the blockquote content
-                    quote_text = '\n'.join(blockquote_content)
-                    result.append(f'<blockquote><p>{quote_text}</p></blockquote>')
+                    result.append(self.render_blockquote(blockquote_content))
                     in_blockquote = False
                     blockquote_content = []
                 result.append(line)
         
         # Handle blockquote at end of file
         if in_blockquote:
-            quote_text = '\n'.join(blockquote_content)
-            result.append(f'<blockquote><p>{quote_text}</p></blockquote>')
+            result.append(self.render_blockquote(blockquote_content))
             
         return '\n'.join(result)
 
@@ -513,25 +726,23 @@ class SimpleMarkdownToHTMLConverter:
 
     def generate_toc(self, text):
         """Generate table of contents from headers."""
-        headers = re.findall(r'<h([1-6])>([^<]+)</h[1-6]>', text)
-        if not headers:
-            return "", text
-        
-        toc_html = '<div class="toc">\n<h2>Table of Contents</h2>\n<ul>\n'
+        toc_items = []
         
-        for level, title in headers:
-            # Create anchor from title
+        def add_anchor(match):
+            level, class_attr, inner_html = match.groups()
+            # Headers may hold markup (e.g. wikilinks); anchor and TOC entry use their text
+            title = re.sub(r'<[^>]+>', '', inner_html)
             anchor = re.sub(r'[^\w\s-]', '', title).strip()
             anchor = re.sub(r'[-\s]+', '-', anchor).lower()
-            
-            # Add anchor to original header
-            text = text.replace(f'<h{level}>{title}</h{level}>', 
-                              f'<h{level} id="{anchor}">{title}</h{level}>')
-            
-            # Add to TOC
             indent = '  ' * (int(level) - 1)
-            toc_html += f'{indent}<li><a href="#{anchor}">{title}</a></li>\n'
+            toc_items.append(f'{indent}<li><a href="#{anchor}">{title}</a></li>\n')
+            return f'<h{level}{class_attr or ""} id="{anchor}">{inner_html}</h{level}>'
         
+        text = re.sub(r'<h([1-6])( class="[^"]*")?>(.*?)</h\1>', add_anchor, text)
+        if not toc_items:
+            return "", text
+        
+        toc_html = '<div class="toc">\n<h2>Table of Contents</h2>\n<ul>\n' + ''.join(toc_items)
         toc_html += '</ul>\n</div>\n\n'
         return toc_html, text
 
@@ -542,16 +753,15 @@ class SimpleMarkdownToHTMLConverter:
         
         # Convert markdown elements in proper order
         html = markdown_content
-        html = self.convert_code_blocks(html)
-        html = self.convert_headers(html)
-        html = self.convert_tables(html)
-        html = self.convert_lists(html)
-        html = self.convert_blockquotes(html)
-        html = self.convert_formatting(html)
-        html = self.convert_paragraphs(html)
+        for stage in (self.convert_code_blocks, self.convert_obsidian_links, self.convert_headers,
+                      self.convert_tables, self.convert_lists, self.convert_blockquotes,
+                      self.convert_formatting, self.convert_paragraphs):
+            with phase(stage.__name__):
+                html = stage(html)
         
         # Generate TOC
-        toc_html, html = self.generate_toc(html)
+        with phase("generate_toc"):
+            toc_html, html = self.generate_toc(html)
         
         return toc_html + html
 
@@ -602,6 +812,73 @@ class SimpleMarkdownToHTMLConverter:
         </html>
         """
 
+    def get_output_path(self, input_file):
+        """Return the default HTML output path for a markdown file."""
+        input_path = Path(input_file)
+        return input_path.parent / f"{input_path.stem}.html"
+
+    def render_file(self, input_file, output_file=None):
+        """Render one markdown file to HTML without console output."""
+        markdown_content = self.read_file(input_file)
+        if markdown_content is None:
+            return None
+        
+        complete_html = self.create_complete_html(self.convert_markdown_to_html(markdown_content))
+        output_file = Path(output_file) if output_file else self.get_output_path(input_file)
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(complete_html)
+        except Exception as e:
+            print(f"❌ Error saving HTML file: {e}")
+            return None
+        return output_file
+
+    def watch(self, input_files, output_file=None, port=8000, open_browser=True, force_polling=False):
+        """Re-render changed files on save and live-reload them in the browser."""
+        print("👀 Simple HTML Converter - watch mode")
+        print("=" * 50)
+        
+        outputs = {}
+        for input_file in input_files:
+            source = Path(input_file).resolve()
+            outputs[source] = Path(output_file).resolve() if output_file else self.get_output_path(source)
+        
+        for source, target in outputs.items():
+            if not self.render_file(source, target):
+                return False
+            print(f"📄 {source.name} → {target}")
+        
+        root = Path(os.path.commonpath([str(target.parent) for target in outputs.values()]))
+        server = LiveReloadServer(root, port)
+        try:
+            server.start()
+        except OSError as e:
+            print(f"❌ Could not start preview server on port {port}: {e}")
+            return False
+        
+        first_url = server.url_for(next(iter(outputs.values())))
+        print(f"🌐 Serving {root} at http://127.0.0.1:{port}/")
+        if open_browser:
+            webbrowser.open(first_url)
+        
+        watcher = create_watcher(outputs.keys(), force_polling=force_polling)
+        print(f"👀 Watching {len(outputs)} file(s) with {type(watcher).__name__} - press Ctrl+C to stop")
+        try:
+            for changed in debounced_changes(watcher):
+                for source in sorted(changed):
+                    start_time = time.perf_counter()
+                    if self.render_file(source, outputs[source]):
+                        elapsed_ms = (time.perf_counter() - start_time) * 1000
+                        print(f"🔄 Re-rendered {source.name} in {elapsed_ms:.1f} ms")
+                server.notify()
+        except KeyboardInterrupt:
+            print("\n👋 Stopping watch mode")
+        finally:
+            watcher.close()
+            server.stop()
+        
+        return True
+
     def convert(self, input_file, output_file=None, open_browser=True):
         """Main conversion method."""
         print("🚀 Simple HTML Converter")
@@ -609,27 +886,29 @@ class SimpleMarkdownToHTMLConverter:
         
         # Read markdown file
         print(f"📖 Reading markdown file: {input_file}")
-        markdown_content = self.read_file(input_file)
+        with phase("read"):
+            markdown_content = self.read_file(input_file)
         if not markdown_content:
             return False
 
         # Convert to HTML
         print("🔄 Converting markdown to HTML...")
-        content_html = self.convert_markdown_to_html(markdown_content)
+        with phase("markdown to html", chars=len(markdown_content)):
+            content_html = self.convert_markdown_to_html(markdown_content)
         
         # Create complete HTML document
         print("✨ Adding professional formatting...")
-        complete_html = self.create_complete_html(content_html)
+        with phase("complete html"):
+            complete_html = self.create_complete_html(content_html)
         
         # Generate output filename if not provided
         if not output_file:
-            input_path = Path(input_file)
-            output_file = input_path.parent / f"{input_path.stem}.html"
+            output_file = self.get_output_path(input_file)
         
         # Save HTML file
         print(f"💾 Saving HTML file: {output_file}")
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with phase("write"), open(output_file, 'w', encoding='utf-8') as f:
                 f.write(complete_html)
         except Exception as e:
             print(f"❌ Error saving HTML file: {e}")
@@ -654,18 +933,68 @@ class SimpleMarkdownToHTMLConverter:
         return True
 
 def main():
-    input_file = "README.md"
+    parser = argparse.ArgumentParser(
+        description="Convert markdown to styled HTML (use the browser's Print to PDF for PDF output)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 simple_html_converter.py                        # Convert README.md to README.html
+  python3 simple_html_converter.py notes.md -o notes.html # Custom input and output
+  python3 simple_html_converter.py --watch README.md knowledge/*.md  # Live preview while editing
+  python3 simple_html_converter.py knowledge/ --no-browser          # Every note below a directory
+        """
+    )
+    parser.add_argument('inputs', nargs='*', default=['README.md'],
+                        help='Input markdown file(s) or directories (default: README.md)')
+    parser.add_argument('-o', '--output',
+                        help='Output HTML file (default: same name as input with .html extension)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Re-render on save and serve with live reload')
+    parser.add_argument('--port', type=int, default=8000,
+                        help='Preview server port in watch mode (default: 8000)')
+    parser.add_argument('--poll', action='store_true',
+                        help='Use mtime polling instead of inotify in watch mode')
+    parser.add_argument('--no-browser', action='store_true',
+                        help='Do not open a browser tab')
+    add_profile_argument(parser)
+    
+    args = parser.parse_args()
+    start_profiling(args.profile, "simple_html_converter")
     
-    # Check if input file exists
-    if not os.path.exists(input_file):
-        print(f"❌ Error: Input file '{input_file}' not found.")
-        print(f"📁 Current directory: {os.getcwd()}")
-        print(f"📋 Available files: {', '.join([f for f in os.listdir('.') if f.endswith('.md')])}")
+    # Check if input files exist, expanding directories to their markdown files (listed by the daemon when it runs)
+    input_files = []
+    for input_file in args.inputs:
+        if not os.path.exists(input_file):
+            print(f"❌ Error: Input file '{input_file}' not found.")
+            print(f"📁 Current directory: {os.getcwd()}")
+            print(f"📋 Available files: {', '.join([f for f in os.listdir('.') if f.endswith('.md')])}")
+            sys.exit(1)
+        if os.path.isdir(input_file):
+            from vault.daemon import markdown_files
+            input_files.extend(markdown_files(input_file))
+        else:
+            input_files.append(input_file)
+    
+    if not input_files:
+        print("❌ Error: no markdown files found in the given directories.")
+        sys.exit(1)
+    
+    if args.output and len(input_files) > 1:
+        print("❌ Error: --output can only be used with a single input file.")
         sys.exit(1)
     
-    # Create converter and run conversion
     converter = SimpleMarkdownToHTMLConverter()
-    success = converter.convert(input_file)
+    
+    if args.watch:
+        success = converter.watch(input_files, args.output, port=args.port,
+                                  open_browser=not args.no_browser, force_polling=args.poll)
+        sys.exit(0 if success else 1)
+    
+    # Create converter and run conversion; a browser tab is only opened for a single file
+    batch_mode = len(input_files) > 1 or any(os.path.isdir(input_file) for input_file in args.inputs)
+    success = True
+    for input_file in input_files:
+        success &= converter.convert(input_file, args.output, open_browser=not (args.no_browser or batch_mode))
     
     if success:
         print("\n🎉 Conversion completed successfully!")
@@ -0,0 +1,43 @@
+"""The index, the daemon's state and the byte-level sections agree on date markers."""
+
+from vault.mentions import MentionIndex
+from vault.sections import has_date_markers, section_dates
+from vault.state import VaultState
+
+ACTIVITIES = {
+    "Bare.md": "## Log\n[[2025-07-04]]\n- [ ] todo\n\n[[2025-07-02]]\nnote\n",
+    "Alias.md": "Worked on it [[2025-07-04|Friday]] and [[2025-07-05#Evening]]\n",
+    "Frontmatter.md": "---\nstarted: \"[[2025-06-30]]\"\n---\n# Plan\n",
+    "Mixed.md": "[[2025-07-01|alias]]\n[[2025-07-01]]\n```\n[[2025-07-03]]\n```\n",
+    "Plain.md": "No dates, only [[Activities/Other]]\n",
+}
+
+
+def regex_markers(activities):
+    """Markers as the restorer finds them without the index (--no-index)"""
+    return {f"Activities/{path.name}": sorted(set(section_dates(path)))
+            for path in sorted(activities.iterdir()) if has_date_markers(path)}
+
+
+def test_date_markers_match_on_every_path(tmp_path):
+    vault = tmp_path / "vault"
+    activities = vault / "Activities"
+    activities.mkdir(parents=True)
+    for name, content in ACTIVITIES.items():
+        (activities / name).write_text(content, encoding="utf-8")
+
+    expected = regex_markers(activities)
+    assert expected == {
+        "Activities/Bare.md": ["2025-07-02", "2025-07-04"],
+        "Activities/Frontmatter.md": ["2025-06-30"],
+        "Activities/Mixed.md": ["2025-07-01", "2025-07-03"],
+    }
+
+    index = MentionIndex(vault, path=tmp_path / "mentions.sqlite3")
+    index.update()
+    assert index.date_markers("Activities") == expected
+    index.close()
+
+    state = VaultState(vault)
+    state.refresh()
+    assert state.date_markers("Activities") == expected
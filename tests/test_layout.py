@@ -0,0 +1,35 @@
+"""Journal layout tables, detection and precomputed span."""
+
+from datetime import date
+
+from vault.layout import PRECOMPUTED_YEARS, detect_layout, load_layout
+
+
+def test_paths_and_dates_round_trip():
+    layout = load_layout("/nonexistent", "{YYYY}/{MM}.{Month}/{YYYY}-{MM}-{DD}.md", files=[])
+    for iso in ("2024-02-29", "1999-12-31", "2031-07-05"):
+        path = layout.path_for(iso)
+        assert path == date.fromisoformat(iso).strftime("%Y/%m.%B/%Y-%m-%d.md")
+        assert layout.date_of(path) == iso
+    assert layout.path_for("2025-02-30") is None
+    assert layout.date_of("2025/08.August/2025-07-05.md") is None
+
+
+def test_detects_the_layout_most_notes_follow():
+    files = [f"2025/2025-07-{day:02d}.md" for day in range(1, 20)] + ["2025/07.July/2025-07-30.md", "index.md"]
+    assert detect_layout(files) == "{YYYY}/{YYYY}-{MM}-{DD}.md"
+    assert detect_layout([]) == "{YYYY}/{MM}.{Month}/{YYYY}-{MM}-{DD}.md"
+
+
+def test_outlier_years_are_not_spanned():
+    files = ["9999-12-30.md", "0200-01-05.md", "0000-01-01.md", f"{date.today().year}-01-01.md"]
+    layout = load_layout("/nonexistent", "{YYYY}-{MM}-{DD}.md", files=files)
+    # Only the years with notes are precomputed, up to the last day a date can have
+    assert len(layout.days) < 3 * 366
+    assert layout.date_of("9999-12-31.md") == "9999-12-31"
+    assert layout.date_of("0200-01-05.md") == "0200-01-05"
+    assert layout.date_of("0000-01-01.md") is None
+
+    many = load_layout("/nonexistent", "{YYYY}-{MM}-{DD}.md", files=[f"{year:04d}-01-01.md" for year in range(1, 10000)])
+    assert len(many.days) <= PRECOMPUTED_YEARS * 366
+    assert many.date_of("0001-01-01.md") == "0001-01-01"
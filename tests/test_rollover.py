@@ -0,0 +1,97 @@
+"""Behaviour of the todo rollover backfill on a small journal."""
+
+from datetime import date
+
+from vault.rollover import TodoRollover
+
+NOTES = {
+    "2025-07-01": (
+        "# 2025-07-01\n"
+        "- [ ] call dentist\n"
+        "- [ ] buy milk\n"
+        "  - [ ] indented task\n"
+        "> - [ ] callout task\n"
+        "- [ ] linked task [[Somewhere]]\n"
+        "##### [[Activities/Project]]\n"
+        "- [ ] activity task\n"
+        "---\n"
+        "notes\n"
+    ),
+    "2025-07-02": (
+        "# 2025-07-02\n"
+        "- [x] buy milk\n"
+        "- [ ]   call   dentist\n"
+        "---\n"
+        "## Log\n"
+        "---\n"
+        "tail\n"
+    ),
+    "2025-07-03": "# 2025-07-03\nnothing planned\n",
+    "2025-07-04": "# 2025-07-04\n",
+}
+
+
+def write_journal(vault):
+    for day, content in NOTES.items():
+        path = vault / "Journal" / "2025" / "07.July" / f"{day}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def read_note(vault, day):
+    return (vault / "Journal" / "2025" / "07.July" / f"{day}.md").read_text(encoding="utf-8")
+
+
+def rollover(vault, start, end, backup_dir, dry_run=False):
+    return TodoRollover(vault, start, end, dry_run=dry_run, backup_dir=backup_dir).run()
+
+
+def test_rollover_chains_todos_through_the_range(tmp_path):
+    vault = tmp_path / "vault"
+    write_journal(vault)
+    summary = rollover(vault, date(2025, 7, 2), date(2025, 7, 4), tmp_path / "backup")
+
+    # Already present (with other spacing) or checked off: not added; nesting and callouts kept;
+    # placed after the last --- separator
+    assert read_note(vault, "2025-07-02") == (
+        "# 2025-07-02\n- [x] buy milk\n- [ ]   call   dentist\n---\n## Log\n---\n"
+        "  - [ ] indented task\n> - [ ] callout task\ntail\n"
+    )
+    # Without a separator the todos go at the end; the checked-off todo stops rolling over
+    assert read_note(vault, "2025-07-03") == (
+        "# 2025-07-03\nnothing planned\n- [ ]   call   dentist\n  - [ ] indented task\n> - [ ] callout task\n"
+    )
+    assert summary["todos_added"] == 8
+    assert summary["notes_in_range"] == 3
+    # Activity todos and todos with links stay where they are
+    assert "activity task" not in read_note(vault, "2025-07-04")
+    assert "linked task" not in read_note(vault, "2025-07-04")
+
+    # Every written note was backed up as it was
+    assert (summary["backup_dir"] / "Journal/2025/07.July/2025-07-02.md").read_text(encoding="utf-8") == NOTES["2025-07-02"]
+
+    # Running again adds nothing
+    assert rollover(vault, date(2025, 7, 2), date(2025, 7, 4), tmp_path / "backup-again")["todos_added"] == 0
+
+
+def test_deleted_todo_stops_rolling_over(tmp_path):
+    vault = tmp_path / "vault"
+    write_journal(vault)
+    rollover(vault, date(2025, 7, 2), date(2025, 7, 3), tmp_path / "backup")
+
+    note = vault / "Journal" / "2025" / "07.July" / "2025-07-03.md"
+    note.write_text(read_note(vault, "2025-07-03").replace("> - [ ] callout task\n", ""), encoding="utf-8")
+    summary = rollover(vault, date(2025, 7, 4), date(2025, 7, 4), tmp_path / "backup-again")
+
+    assert summary["updated_notes"] == {
+        "Journal/2025/07.July/2025-07-04.md": ["- [ ]   call   dentist", "  - [ ] indented task"]}
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    vault = tmp_path / "vault"
+    write_journal(vault)
+    summary = rollover(vault, date(2025, 7, 2), date(2025, 7, 4), tmp_path / "backup", dry_run=True)
+
+    assert summary["todos_added"] == 8
+    assert summary["backup_dir"] is None
+    assert all(read_note(vault, day) == content for day, content in NOTES.items())
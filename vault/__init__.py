@@ -0,0 +1,29 @@
+"""
+Vault Engine
+
+Python counterparts of the Obsidian-side components in `Scripts/`, for offline
+tooling that works on the whole vault (restorer, converters, validator,
+analytics). Modules:
+
+- blocks: note block parser mirroring noteBlocksParser.js
+- mentions: inverted index from [[wikilink]] target to linking blocks
+- layout: Journal daily note paths from a pattern, with precomputed date tables
+- rollover: todo rollover over a range of daily notes
+- sections: streaming [[YYYY-MM-DD]] sections of activity files
+- frontmatter: frontmatter parsing, head-only reads, in-place updates and index
+- activities: activities in progress, from the frontmatter and mention indexes
+- directives: batch {attribute op value} directive engine
+- state: the whole vault parsed in memory, kept current from file changes
+- daemon: client of engine_daemon.py, which serves that state on a Unix socket
+"""
+
+from pathlib import Path
+
+
+def vault_cache_path(vault_path, name: str, suffix: str) -> Path:
+    """Per-vault file in the Engine cache directory, keyed by the vault's absolute path"""
+    import hashlib
+    from highlight_cache import DEFAULT_CACHE_DIR
+
+    vault_key = hashlib.sha1(str(Path(vault_path).resolve()).encode('utf-8')).hexdigest()[:16]
+    return DEFAULT_CACHE_DIR / f'{name}-{vault_key}{suffix}'
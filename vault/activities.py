@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Activities In Progress
+
+Python counterpart of the selection rules in `activitiesInProgress.js`:
+
+- activities with `stage: active`
+- activities with `stage: planning` that a daily note mentioned in the last
+  7 days
+- the MyObsidian activity is left out (it is handled separately)
+
+Stages come from the frontmatter index and mentions from the mention index,
+so the answer is found without reading any note body that hasn't changed
+since the last run.
+
+Usage:
+    for page, stage in activities_in_progress(".."):
+        print(page, stage)
+"""
+
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from vault.frontmatter import FrontmatterIndex
+from vault.mentions import MentionIndex
+
+EXCLUDED_ACTIVITIES = {"MyObsidian"}
+RECENT_MENTION_DAYS = 7
+DAILY_NOTE_PAGE_PATTERN = re.compile(r'^Journal/(?:.*/)?(\d{4}-\d{2}-\d{2})\.md$')
+
+
+def activity_stage(frontmatter) -> str:
+    """Lower-cased stage of an activity ('' when it has none)"""
+    stage = (frontmatter or {}).get("stage", "")
+    return stage.strip().lower() if isinstance(stage, str) else ""
+
+
+def recently_mentioned(mention_index: MentionIndex, name: str, today: date, window_days: int) -> bool:
+    """Whether a daily note dated within window_days before today links to name"""
+    first = (today - timedelta(days=window_days)).isoformat()
+    last = today.isoformat()
+    for page, _, _ in mention_index.query(name):
+        page_match = DAILY_NOTE_PAGE_PATTERN.match(page)
+        if page_match and first <= page_match.group(1) <= last:
+            return True
+    return False
+
+
+def activities_in_progress(vault_path="..", today: Optional[date] = None, window_days: int = RECENT_MENTION_DAYS,
+                           frontmatter_index: Optional[FrontmatterIndex] = None,
+                           mention_index: Optional[MentionIndex] = None) -> List[Tuple[str, str]]:
+    """(activity page, stage) for the activities in progress, in path order"""
+    today = today or date.today()
+    frontmatter_index = frontmatter_index or FrontmatterIndex(vault_path)
+    frontmatter_index.update()
+
+    selected = []
+    planning = []
+    for page, frontmatter in frontmatter_index.items():
+        if Path(page).stem in EXCLUDED_ACTIVITIES:
+            continue
+        stage = activity_stage(frontmatter)
+        if stage == "active":
+            selected.append((page, stage))
+        elif stage == "planning":
+            planning.append(page)
+
+    if planning:
+        # Only planning activities need mentions, so the journal is indexed only when there are some
+        own_index = mention_index is None
+        mention_index = mention_index or MentionIndex(vault_path)
+        try:
+            mention_index.update(["Journal"])
+            for page in planning:
+                if recently_mentioned(mention_index, Path(page).stem, today, window_days):
+                    selected.append((page, "planning"))
+        finally:
+            if own_index:
+                mention_index.close()
+    return sorted(selected)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Note Block Parser
+
+Python port of the block model documented for `noteBlocksParser.js`. A note is
+split into blocks with the same fields as the JavaScript objects (page,
+blockType, data, mtime, headerLevel):
+
+- header: `#` to `######`; spans every following line until the next header of
+  the same or higher level, a `---`/`----` separator or two empty lines
+- todo / done: `- [ ]` / `- [x]` (optionally inside a `>` callout); always
+  separate blocks, even inside a header block
+- callout: a `> text` line outside header blocks
+- mention: a line with a `[[Link]]` outside header blocks
+- code: a fenced block outside header blocks; lines inside fences are never
+  parsed as todos or headers
+
+Usage:
+    for block in iter_vault_blocks("..", folders=["Journal"]):
+        print(block.page, block.block_type, block.data)
+"""
+
+import os
+import re
+import itertools
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Folder holding these scripts; it lives inside the vault but is not part of it
+ENGINE_ROOT = Path(__file__).resolve().parent.parent
+SKIPPED_DIRECTORIES = {"node_modules", "__pycache__"}
+
+BLOCK_TYPES = ("todo", "done", "header", "mention", "callout", "code")
+
+HEADER_PATTERN = re.compile(r'^(#{1,6})\s+\S')
+TODO_PATTERN = re.compile(r'^\s*(?:>\s*)?- \[ \]')
+DONE_PATTERN = re.compile(r'^\s*(?:>\s*)?- \[[xX]\]')
+SEPARATOR_PATTERN = re.compile(r'^-{3,}\s*$')
+MENTION_PATTERN = re.compile(r'\[\[[^\]]+\]\]')
+FENCE_PATTERN = re.compile(r'^\s{0,3}(`{3,}|~{3,})\s*([\w+#.-]*)')
+# Checkbox at the start of a list item's text, once the list marker is removed
+TASK_ITEM_PATTERN = re.compile(r'^\[([ xX])\]\s+(.*)$')
+DATE_MARKER_PATTERN = re.compile(r'\[\[(\d{4}-\d{2}-\d{2})\]\]')
+ACTIVITY_HEADER_PATTERN = re.compile(r'^#{5}\s+\[\[Activities/.*\]\]')
+
+
+def closes_fence(opening: str, fence_match) -> bool:
+    """Whether a FENCE_PATTERN match closes the fence opened with the marker opening"""
+    marker = fence_match.group(1)
+    return marker[0] == opening[0] and len(marker) >= len(opening) and not fence_match.group(2)
+
+
+def line_block_type(line: str) -> Optional[str]:
+    """Block type a single line starts on its own (header, todo, done, callout, mention), or None"""
+    if '- [' in line:
+        if TODO_PATTERN.match(line):
+            return "todo"
+        if DONE_PATTERN.match(line):
+            return "done"
+    if line.startswith('#') and HEADER_PATTERN.match(line):
+        return "header"
+    if line.lstrip().startswith('>'):
+        return "callout"
+    if '[[' in line and MENTION_PATTERN.search(line):
+        return "mention"
+    return None
+
+
+class Block:
+    """One parsed block; data holds the block's lines joined with newlines."""
+
+    __slots__ = ("page", "block_type", "data", "mtime", "header_level", "line")
+
+    def __init__(self, page: str, block_type: str, data: str, mtime: int = 0,
+                 header_level: int = 0, line: int = 0):
+        self.page = page
+        self.block_type = block_type
+        self.data = data
+        self.mtime = mtime
+        self.header_level = header_level
+        self.line = line
+
+    def __repr__(self):
+        return f"Block({self.page!r}, {self.block_type!r}, line={self.line}, data={self.data[:40]!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, Block) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def end_line(self) -> int:
+        """Line number of the block's last line"""
+        return self.line + self.data.count('\n')
+
+    def to_dict(self) -> dict:
+        """The block as the JavaScript parser's object"""
+        block = {"page": self.page, "blockType": self.block_type, "data": self.data, "mtime": self.mtime}
+        if self.block_type == "header":
+            block["headerLevel"] = self.header_level
+        return block
+
+
+def frontmatter_end(lines: List[str]) -> int:
+    """Index of the first line after a leading YAML frontmatter block (0 if there is none)"""
+    if not lines or lines[0].rstrip() != '---':
+        return 0
+    for index in range(1, len(lines)):
+        if lines[index].rstrip() == '---':
+            return index + 1
+    return len(lines)
+
+
+def parse_lines(page: str, lines: List[str], mtime: int = 0) -> List[Block]:
+    """Parse the lines of one note (without line endings) into blocks, in the order they start"""
+    blocks = []
+    # Open header blocks, outermost first: (level, block, index of the header line)
+    headers = []
+    fence = None
+    code_block = None
+    code_start = 0
+    blank_lines = 0
+
+    def close_headers(end, level=1):
+        while end > 0 and not lines[end - 1].strip():
+            end -= 1
+        while headers and headers[-1][0] >= level:
+            _, block, start = headers.pop()
+            block.data = '\n'.join(lines[start:max(end, start + 1)])
+
+    for index in range(frontmatter_end(lines), len(lines)):
+        line = lines[index]
+        stripped = line.lstrip()
+
+        if fence is not None:
+            if stripped[:1] in ('`', '~'):
+                fence_match = FENCE_PATTERN.match(line)
+                if fence_match and closes_fence(fence, fence_match):
+                    if code_block is not None:
+                        code_block.data = '\n'.join(lines[code_start:index + 1])
+                    fence = code_block = None
+            continue
+
+        if not stripped:
+            blank_lines += 1
+            if blank_lines == 2 and headers:
+                close_headers(index)
+            continue
+        blank_lines = 0
+
+        first = stripped[0]
+        if first in ('`', '~'):
+            fence_match = FENCE_PATTERN.match(line)
+            if fence_match:
+                fence = fence_match.group(1)
+                if not headers:
+                    code_block = Block(page, "code", "", mtime, 0, index + 1)
+                    code_start = index
+                    blocks.append(code_block)
+                continue
+
+        if first == '-' and SEPARATOR_PATTERN.match(line):
+            close_headers(index)
+            continue
+
+        # Plain text lines only matter as part of an open header block
+        if first not in ('#', '-', '>') and '[[' not in line:
+            continue
+
+        block_type = line_block_type(line)
+        if block_type == "header":
+            level = len(HEADER_PATTERN.match(line).group(1))
+            close_headers(index, level)
+            block = Block(page, "header", "", mtime, level, index + 1)
+            blocks.append(block)
+            headers.append((level, block, index))
+        elif block_type in ("todo", "done") or (block_type and not headers):
+            blocks.append(Block(page, block_type, line, mtime, 0, index + 1))
+
+    if code_block is not None:
+        code_block.data = '\n'.join(lines[code_start:])
+    close_headers(len(lines))
+    return blocks
+
+
+def count_blocks(lines: Iterable[str]) -> Dict[str, int]:
+    """Blocks of each type parse_lines() finds in the lines, counted in one pass without keeping any text"""
+    counts = dict.fromkeys(BLOCK_TYPES, 0)
+    # Levels of the open header blocks, outermost first
+    headers = []
+    fence = None
+    blank_lines = 0
+    lines = iter(lines)
+    for line in lines:
+        if line.rstrip() == '---':
+            # Frontmatter: skip to its closing line (an unclosed one covers the whole note)
+            for line in lines:
+                if line.rstrip() == '---':
+                    break
+            break
+        lines = itertools.chain([line], lines)
+        break
+
+    for line in lines:
+        stripped = line.lstrip()
+
+        if fence is not None:
+            if stripped[:1] in ('`', '~'):
+                fence_match = FENCE_PATTERN.match(line)
+                if fence_match and closes_fence(fence, fence_match):
+                    fence = None
+            continue
+
+        if not stripped:
+            blank_lines += 1
+            if blank_lines == 2:
+                headers.clear()
+            continue
+        blank_lines = 0
+
+        first = stripped[0]
+        if first in ('`', '~'):
+            fence_match = FENCE_PATTERN.match(line)
+            if fence_match:
+                fence = fence_match.group(1)
+                if not headers:
+                    counts["code"] += 1
+                continue
+
+        if first == '-' and SEPARATOR_PATTERN.match(line):
+            headers.clear()
+            continue
+
+        if first not in ('#', '-', '>') and '[[' not in line:
+            continue
+
+        block_type = line_block_type(line)
+        if block_type == "header":
+            level = len(HEADER_PATTERN.match(line).group(1))
+            while headers and headers[-1] >= level:
+                headers.pop()
+            headers.append(level)
+            counts["header"] += 1
+        elif block_type in ("todo", "done") or (block_type and not headers):
+            counts[block_type] += 1
+    return counts
+
+
+def parse_note(page: str, content: str, mtime: int = 0) -> List[Block]:
+    """Parse a note's content into blocks"""
+    if '\r' in content:
+        content = content.replace('\r\n', '\n')
+    return parse_lines(page, content.split('\n'), mtime)
+
+
+def parse_file(path, vault_path) -> List[Block]:
+    """Parse a markdown file; blocks are labelled with its vault-relative path"""
+    path = Path(path)
+    page = path.relative_to(vault_path).as_posix()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        mtime = os.fstat(f.fileno()).st_mtime_ns // 1_000_000
+        return parse_note(page, f.read(), mtime)
+
+
+def iter_markdown_files(vault_path, folders: Optional[Iterable[str]] = None) -> Iterator[Path]:
+    """Yield the vault's markdown files (optionally only under folders), skipping hidden folders and the Engine"""
+    vault_path = Path(vault_path).resolve()
+    roots = [vault_path / folder for folder in folders] if folders else [vault_path]
+    for top in roots:
+        for root, dirs, files in os.walk(top):
+            root_path = Path(root)
+            dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRECTORIES and not d.startswith('.')
+                             and root_path / d != ENGINE_ROOT)
+            for name in sorted(files):
+                if name.endswith('.md'):
+                    yield root_path / name
+
+
+def _parse_for_pool(args):
+    path, vault_path = args
+    try:
+        return parse_file(path, vault_path)
+    except OSError:
+        return []
+
+
+def iter_vault_blocks(vault_path, folders: Optional[Iterable[str]] = None, jobs: int = 1,
+                      chunk_size: int = 64) -> Iterator[Block]:
+    """Stream the blocks of every note in the vault, note by note in path order.
+
+    With jobs > 1 notes are parsed in worker processes in chunks of chunk_size;
+    blocks are still yielded in path order.
+    """
+    vault_path = Path(vault_path).resolve()
+    paths = iter_markdown_files(vault_path, folders)
+    if jobs <= 1:
+        for path in paths:
+            yield from _parse_for_pool((path, vault_path))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for note_blocks in pool.map(_parse_for_pool, ((path, vault_path) for path in paths),
+                                    chunksize=chunk_size):
+            yield from note_blocks
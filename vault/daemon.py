@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Vault Daemon Client
+
+Queries the Engine daemon (engine_daemon.py) when one is serving the vault. The
+daemon keeps every note parsed in memory (vault.state.VaultState) and answers
+newline-delimited JSON requests on a per-vault Unix socket in the Engine cache
+directory:
+
+    {"op": "date_markers", "folder": "Activities"}
+    -> {"ok": true, "result": {...}}
+
+Every helper returns None when no daemon is running (or it fails to answer), so
+callers fall back to parsing the notes themselves.
+
+Usage:
+    from vault.daemon import request_daemon
+    markers = request_daemon("..", "date_markers", folder="Activities")
+    if markers is None:
+        ...  # Parse directly
+"""
+
+import os
+import json
+import socket
+from pathlib import Path
+from typing import Any, List, Optional
+
+from vault import vault_cache_path
+
+# Requests are answered from memory; a daemon slower than this is treated as absent
+REQUEST_TIMEOUT = 30.0
+
+
+def socket_path(vault_path) -> Path:
+    """Unix socket of the daemon serving a vault"""
+    return vault_cache_path(vault_path, 'daemon', '.sock')
+
+
+def send_request(path: Path, request: dict, timeout: float = REQUEST_TIMEOUT) -> dict:
+    """Send one request to a daemon socket and return its decoded response (raises OSError/ValueError)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as response:
+            line = response.readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection")
+    return json.loads(line)
+
+
+def request_daemon(vault_path, op: str, timeout: float = REQUEST_TIMEOUT, **params) -> Optional[Any]:
+    """Result of one daemon request, or None when no daemon answers for the vault"""
+    path = socket_path(vault_path)
+    if not path.exists():
+        return None
+    try:
+        response = send_request(path, dict(params, op=op), timeout)
+    except (OSError, ValueError):
+        return None
+    if not response.get("ok"):
+        return None
+    return response.get("result")
+
+
+def find_daemon_vault(path) -> Optional[Path]:
+    """The vault a daemon is serving that contains path, or None"""
+    path = Path(path).resolve()
+    for candidate in [path, *path.parents]:
+        if socket_path(candidate).exists():
+            return candidate
+    return None
+
+
+def markdown_files(directory) -> List[str]:
+    """Notes below a directory in path order, listed by the daemon when it serves the directory's vault"""
+    from vault.blocks import ENGINE_ROOT, SKIPPED_DIRECTORIES, iter_markdown_files
+
+    directory = Path(directory).resolve()
+    vault_path = find_daemon_vault(directory)
+    # The daemon leaves out the Engine and hidden folders, so it cannot list notes inside them
+    if vault_path is not None and not (directory == ENGINE_ROOT or ENGINE_ROOT in directory.parents) and not any(
+            part in SKIPPED_DIRECTORIES or part.startswith('.') for part in directory.relative_to(vault_path).parts):
+        folder = directory.relative_to(vault_path).as_posix()
+        pages = request_daemon(vault_path, "notes", folder="" if folder == "." else folder)
+        if pages is not None:
+            return [os.path.join(vault_path, page) for page in pages]
+    return sorted(str(path) for path in iter_markdown_files(directory))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Directive Engine
+
+Applies `{attribute op value}` directives written in daily notes to the
+frontmatter of the activities they mention, for the whole vault at once:
+
+    - [x] Kick-off call [[Activities/Garden]] {stage = active}
+    ##### [[Activities/Garden]]
+    Moved the deadline {startDate += 2w} {responsible += Partner}
+
+A directive applies to the activities linked on its own line, or else to the
+`##### [[Activities/...]]` header block it sits in. Directives inside code
+blocks and inline code are ignored. Operations:
+
+- `=` / `:` set the attribute
+- `+=` / `-=` shift dates by Nd/Nw/Nm/Ny, add or subtract numbers, and add to
+  or remove from lists (a scalar becomes a list when something is added)
+
+Daily notes are read once, oldest first; operations are grouped per activity
+and applied in that order with one frontmatter parse and one atomic write per
+activity file. Applied directives are recorded in a ledger, so a directive is
+applied once even when the engine runs again.
+"""
+
+import re
+import json
+import difflib
+import calendar
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from vault import vault_cache_path
+from vault.blocks import (ACTIVITY_HEADER_PATTERN, FENCE_PATTERN, closes_fence, frontmatter_end, iter_markdown_files,
+                          parse_note)
+from vault.frontmatter import (parse_frontmatter, replace_frontmatter, split_frontmatter, update_frontmatter_text,
+                               write_atomic)
+from vault.mentions import LINK_PATTERN, normalize_target
+
+DIRECTIVE_PATTERN = re.compile(r'\{\s*([A-Za-z_][\w-]*)\s*(\+=|-=|=|:)\s*([^{}]*?)\s*\}')
+INLINE_CODE_PATTERN = re.compile(r'`[^`]*`')
+DATE_OFFSET_PATTERN = re.compile(r'^([+-]?\d+)\s*([dwmy])$')
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+NUMBER_PATTERN = re.compile(r'^-?\d+(?:\.\d+)?$')
+DAILY_NOTE_NAME_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})\.md$')
+
+
+class Directive:
+    """One directive occurrence in a daily note."""
+
+    __slots__ = ("page", "line", "activity", "attribute", "op", "value", "key")
+
+    def __init__(self, page: str, line: int, activity: str, attribute: str, op: str, value: str, key: str):
+        self.page = page
+        self.line = line
+        self.activity = activity
+        self.attribute = attribute
+        self.op = op
+        self.value = value
+        # Stable identity for the ledger: page, activity, text and occurrence number
+        self.key = key
+
+    def text(self) -> str:
+        return f"{{{self.attribute} {self.op} {self.value}}}"
+
+
+def default_ledger_path(vault_path) -> Path:
+    return vault_cache_path(vault_path, 'directives', '.json')
+
+
+def shift_date(value: str, offset: str, sign: int) -> Optional[str]:
+    """value (YYYY-MM-DD) moved by offset (e.g. 3d, 2w, 1m, 1y), or None if either doesn't parse"""
+    offset_match = DATE_OFFSET_PATTERN.match(offset.strip())
+    if not offset_match or not ISO_DATE_PATTERN.match(value):
+        return None
+    try:
+        current = datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+    amount, unit = int(offset_match.group(1)) * sign, offset_match.group(2)
+    if unit in ('d', 'w'):
+        current += timedelta(days=amount * (7 if unit == 'w' else 1))
+    else:
+        months = current.month - 1 + amount * (12 if unit == 'y' else 1)
+        year, month = current.year + months // 12, months % 12 + 1
+        current = date(year, month, min(current.day, calendar.monthrange(year, month)[1]))
+    return current.isoformat()
+
+
+def format_number(value: float) -> str:
+    return str(int(value)) if value == int(value) else str(value)
+
+
+def apply_operation(current, op: str, value: str):
+    """New attribute value after one directive (current is None when the attribute is missing)"""
+    if op in ('=', ':'):
+        return value
+    sign = 1 if op == '+=' else -1
+    if current in (None, '') and NUMBER_PATTERN.match(value):
+        current = '0'
+    if isinstance(current, str):
+        shifted = shift_date(current, value, sign)
+        if shifted is not None:
+            return shifted
+        if NUMBER_PATTERN.match(current) and NUMBER_PATTERN.match(value):
+            return format_number(float(current) + sign * float(value))
+    items = list(current) if isinstance(current, list) else [current] if current else []
+    if sign > 0:
+        return items + [value] if value not in items else items
+    if isinstance(current, list):
+        return [item for item in items if item != value]
+    return '' if current == value else current
+
+
+def activity_targets(line: str, activities: Dict[str, str]) -> List[str]:
+    """Activity files linked on a line (links resolved by path or by name)"""
+    targets = []
+    for target in LINK_PATTERN.findall(line):
+        path = activities.get(normalize_target(target).lower())
+        if path and path not in targets:
+            targets.append(path)
+    return targets
+
+
+def find_directives(page: str, content: str, activities: Dict[str, str]) -> List[Directive]:
+    """Directives in a daily note, in line order, with the activity each applies to"""
+    lines = content.split('\n')
+    activity_ranges = []
+    for block in parse_note(page, content):
+        if block.block_type == "header" and ACTIVITY_HEADER_PATTERN.match(block.data):
+            targets = activity_targets(block.data.split('\n', 1)[0], activities)
+            if targets:
+                activity_ranges.append((block.line, block.end_line(), targets[0]))
+
+    directives = []
+    occurrences: Dict[Tuple[str, str], int] = {}
+    fence = None
+    for index in range(frontmatter_end(lines), len(lines)):
+        line = lines[index]
+        fence_match = FENCE_PATTERN.match(line) if line.lstrip()[:1] in ('`', '~') else None
+        if fence is not None:
+            if fence_match and closes_fence(fence, fence_match):
+                fence = None
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+        if '{' not in line:
+            continue
+        text = INLINE_CODE_PATTERN.sub('', line) if '`' in line else line
+        found = DIRECTIVE_PATTERN.findall(text)
+        if not found:
+            continue
+
+        number = index + 1
+        targets = activity_targets(text, activities)
+        if not targets:
+            # Innermost activity header block containing the line
+            enclosing = [(start, path) for start, end, path in activity_ranges if start < number <= end]
+            targets = [max(enclosing)[1]] if enclosing else []
+        for activity in targets:
+            for attribute, op, value in found:
+                directive_text = f"{attribute}{op}{value}"
+                count = occurrences.get((activity, directive_text), 0)
+                occurrences[(activity, directive_text)] = count + 1
+                key = f"{page}|{activity}|{directive_text}|{count}"
+                directives.append(Directive(page, number, activity, attribute, op, value, key))
+    return directives
+
+
+class DirectiveEngine:
+    """Collects directives from the daily notes and applies them to activity frontmatter."""
+
+    def __init__(self, vault_path="..", dry_run: bool = True, ledger_path=None, use_ledger: bool = True):
+        self.vault_path = Path(vault_path).resolve()
+        self.dry_run = dry_run
+        self.ledger_path = Path(ledger_path) if ledger_path else default_ledger_path(self.vault_path)
+        self.use_ledger = use_ledger
+        self.ledger = self.load_ledger() if use_ledger else set()
+
+    def load_ledger(self) -> set:
+        try:
+            with open(self.ledger_path, 'r', encoding='utf-8') as f:
+                return set(json.load(f).get("applied", []))
+        except (OSError, ValueError):
+            return set()
+
+    def save_ledger(self) -> None:
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.ledger_path, json.dumps({"applied": sorted(self.ledger)}, ensure_ascii=False))
+
+    def activity_files(self) -> Dict[str, str]:
+        """Lower-cased link target (path and bare name) -> vault-relative activity path"""
+        activities = {}
+        for path in iter_markdown_files(self.vault_path, ["Activities"]):
+            page = path.relative_to(self.vault_path).as_posix()
+            activities[page[:-3].lower()] = page
+            activities.setdefault(path.stem.lower(), page)
+        return activities
+
+    def iter_daily_notes(self, since: Optional[date] = None) -> Iterable[Tuple[str, Path]]:
+        notes = []
+        for path in iter_markdown_files(self.vault_path, ["Journal"]):
+            name_match = DAILY_NOTE_NAME_PATTERN.match(path.name)
+            if name_match and (since is None or name_match.group(1) >= since.isoformat()):
+                notes.append((name_match.group(1), path))
+        return sorted(notes)
+
+    def collect(self, since: Optional[date] = None) -> Dict[str, List[Directive]]:
+        """Pending directives grouped by activity path, in chronological order"""
+        activities = self.activity_files()
+        grouped: Dict[str, List[Directive]] = {}
+        for _, path in self.iter_daily_notes(since):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+            if '{' not in content:
+                continue
+            page = path.relative_to(self.vault_path).as_posix()
+            for directive in find_directives(page, content, activities):
+                if directive.key not in self.ledger:
+                    grouped.setdefault(directive.activity, []).append(directive)
+        return grouped
+
+    def apply(self, activity: str, directives: List[Directive]) -> Optional[str]:
+        """Apply directives to one activity file; returns a unified diff of the change, or None"""
+        path = self.vault_path / activity
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        text, _ = split_frontmatter(content)
+        values = parse_frontmatter(text or '')
+        for directive in directives:
+            values[directive.attribute] = apply_operation(values.get(directive.attribute), directive.op,
+                                                          directive.value)
+        new_text = update_frontmatter_text(text or '', values)
+        if new_text == (text or ''):
+            return None
+
+        new_content = replace_frontmatter(content, new_text)
+        diff = ''.join(difflib.unified_diff(content.splitlines(True), new_content.splitlines(True),
+                                            f"a/{activity}", f"b/{activity}", n=1))
+        if not self.dry_run:
+            write_atomic(path, new_content)
+        return diff
+
+    def run(self, since: Optional[date] = None) -> Dict[str, object]:
+        """Collect and apply all pending directives; returns per-activity results"""
+        grouped = self.collect(since)
+        results = {}
+        errors = {}
+        for activity in sorted(grouped):
+            directives = grouped[activity]
+            try:
+                diff = self.apply(activity, directives)
+            except OSError as e:
+                errors[activity] = str(e)
+                continue
+            results[activity] = {"directives": directives, "diff": diff}
+            if not self.dry_run:
+                self.ledger.update(directive.key for directive in directives)
+        if not self.dry_run and self.use_ledger and results:
+            self.save_ledger()
+        return {"activities": results, "errors": errors}
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Note Frontmatter
+
+Reads and updates the YAML frontmatter of notes. Only the subset the vault's
+templates use is supported: `key: value` scalars, inline lists
+(`key: [a, b]`) and block lists (`key:` followed by `  - item` lines). Values
+are kept as strings (lists as lists of strings).
+
+Updates rewrite only the lines of keys whose value changed, so comments,
+ordering and formatting of everything else stay as they were, and files are
+replaced atomically.
+
+read_frontmatter() reads only the head of a file, so large activity files with
+years of dated sections cost about as much as small ones. FrontmatterIndex
+keeps the frontmatter of a folder's notes in a JSON file in the cache
+directory and re-reads a note only when its mtime or size changes.
+"""
+
+import os
+import re
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+Value = Union[str, List[str]]
+
+KEY_PATTERN = re.compile(r'^([A-Za-z_][\w-]*)\s*:(?:\s+(.*?))?\s*$')
+LIST_ITEM_PATTERN = re.compile(r'^\s+-\s+(.*?)\s*$|^-\s+(.*?)\s*$')
+# Scalars that need quotes to be read back as the same string
+NEEDS_QUOTES_PATTERN = re.compile(r'^[\[\]{}&*!|>%@`#,?\'"-]|: | #|^$|^\s|\s$')
+CLOSING_PATTERN = re.compile(rb'\n---[ \t]*\r?(?:\n|$)')
+
+# Frontmatter is read in a small block that doubles until the closing --- is found
+HEAD_READ_SIZE = 1024
+MAX_FRONTMATTER_SIZE = 1 << 20
+FRONTMATTER_INDEX_VERSION = 1
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """Split a note into (frontmatter text without the --- lines, body); (None, content) without frontmatter"""
+    if not content.startswith('---'):
+        return None, content
+    first_line_end = content.find('\n')
+    if first_line_end == -1 or content[:first_line_end].rstrip() != '---':
+        return None, content
+    closing = re.search(r'^---[ \t]*\r?(?:\n|$)', content[first_line_end + 1:], re.MULTILINE)
+    if closing is None:
+        return None, content
+    text_end = first_line_end + 1 + closing.start()
+    return content[first_line_end + 1:text_end], content[first_line_end + 1 + closing.end():]
+
+
+def unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
+
+def parse_scalar_or_list(value: str) -> Value:
+    if value.startswith('[') and value.endswith(']'):
+        return [unquote(item.strip()) for item in value[1:-1].split(',') if item.strip()]
+    return unquote(value)
+
+
+def parse_frontmatter(text: str) -> Dict[str, Value]:
+    """Parse frontmatter text (restricted YAML subset) into a dict"""
+    data: Dict[str, Value] = {}
+    current_key = None
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if current_key is not None and stripped.startswith('- '):
+            item_match = LIST_ITEM_PATTERN.match(line)
+            if item_match:
+                data[current_key].append(unquote(item_match.group(1) or item_match.group(2) or ''))
+                continue
+        key_match = KEY_PATTERN.match(line)
+        if not key_match:
+            current_key = None
+            continue
+        key, value = key_match.group(1), key_match.group(2)
+        if value is None or value == '':
+            data[key] = []
+            current_key = key
+        else:
+            data[key] = parse_scalar_or_list(value)
+            current_key = None
+    # A key with nothing under it is an empty scalar, not an empty list
+    return {key: ('' if value == [] else value) for key, value in data.items()}
+
+
+def format_scalar(value: str) -> str:
+    if NEEDS_QUOTES_PATTERN.search(value):
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return value
+
+
+def format_entry(key: str, value: Value, block_list: bool = False) -> List[str]:
+    """Frontmatter lines for one key"""
+    if isinstance(value, list):
+        if block_list and value:
+            return [f"{key}:"] + [f"  - {format_scalar(item)}" for item in value]
+        return [f"{key}: [{', '.join(format_scalar(item) for item in value)}]"]
+    return [f"{key}: {format_scalar(value)}" if value != '' else f"{key}:"]
+
+
+def update_frontmatter_text(text: str, values: Dict[str, Value]) -> str:
+    """Rewrite the lines of keys whose value differs from values; new keys are appended"""
+    current = parse_frontmatter(text)
+    changed = {key: value for key, value in values.items() if current.get(key) != value}
+    if not changed:
+        return text
+
+    trailing_newline = text.endswith('\n')
+    lines = text[:-1].split('\n') if trailing_newline else text.split('\n') if text else []
+    output = []
+    index = 0
+    while index < len(lines):
+        key_match = KEY_PATTERN.match(lines[index])
+        if not key_match or key_match.group(1) not in changed:
+            output.append(lines[index])
+            index += 1
+            continue
+        key = key_match.group(1)
+        # Skip the key's own block list items
+        end = index + 1
+        while end < len(lines) and lines[end].strip().startswith('- ') and not KEY_PATTERN.match(lines[end]):
+            end += 1
+        block_list = end > index + 1
+        output.extend(format_entry(key, changed.pop(key), block_list))
+        index = end
+
+    for key, value in changed.items():
+        output.extend(format_entry(key, value))
+    return '\n'.join(output) + ('\n' if trailing_newline else '')
+
+
+def replace_frontmatter(content: str, text: str) -> str:
+    """Note content with its frontmatter replaced by text (added if the note had none)"""
+    current, body = split_frontmatter(content)
+    if text and not text.endswith('\n'):
+        text += '\n'
+    return f"---\n{text}---\n{content if current is None else body}"
+
+
+def write_atomic(path, content: str) -> None:
+    """Replace a file's content in one rename, so readers never see a partial write"""
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        try:
+            os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_frontmatter_text(path, initial_size: int = HEAD_READ_SIZE, max_size: int = MAX_FRONTMATTER_SIZE) -> Optional[str]:
+    """Frontmatter text of a note file, reading only the leading bytes up to the closing ---"""
+    with open(path, 'rb') as f:
+        head = f.read(initial_size)
+        while b'\n' not in head and len(head) < max_size:
+            chunk = f.read(max(len(head), 1))
+            if not chunk:
+                break
+            head += chunk
+        first_line_end = head.find(b'\n')
+        if first_line_end == -1 or head[:first_line_end].rstrip() != b'---':
+            return None
+
+        searched = first_line_end
+        while True:
+            closing = CLOSING_PATTERN.search(head, searched)
+            # A match at the very end may be a longer line cut off by the read, unless the file ended there
+            if closing and (closing.end() < len(head) or closing.group(0).endswith(b'\n')):
+                break
+            chunk = f.read(max(len(head), initial_size)) if len(head) < max_size else b''
+            if not chunk:
+                if closing is None:
+                    return None
+                break
+            # Resume the search at the last complete line
+            searched = max(first_line_end, head.rfind(b'\n'))
+            head += chunk
+    return head[first_line_end + 1:closing.start() + 1].decode('utf-8', errors='replace')
+
+
+def read_frontmatter(path) -> Optional[Dict[str, Value]]:
+    """Frontmatter of a note file (None if it has none), without reading the note body"""
+    text = read_frontmatter_text(path)
+    return parse_frontmatter(text) if text is not None else None
+
+
+class FrontmatterIndex:
+    """Frontmatter of every note in some vault folders, persisted and refreshed by mtime."""
+
+    def __init__(self, vault_path="..", folders: Iterable[str] = ("Activities",), path=None):
+        from vault import vault_cache_path
+
+        self.vault_path = Path(vault_path).resolve()
+        self.folders = list(folders)
+        self.path = Path(path) if path else vault_cache_path(self.vault_path, 'frontmatter', '.json')
+        self.entries: Dict[str, dict] = self.load()
+
+    def load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != FRONTMATTER_INDEX_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps({"version": FRONTMATTER_INDEX_VERSION, "entries": self.entries},
+                                           ensure_ascii=False, separators=(',', ':')))
+
+    def update(self) -> Tuple[int, int]:
+        """Re-read the frontmatter of notes whose mtime or size changed; returns (notes read, notes removed)"""
+        from vault.blocks import iter_markdown_files
+
+        seen = set()
+        read = 0
+        for path in iter_markdown_files(self.vault_path, self.folders):
+            page = path.relative_to(self.vault_path).as_posix()
+            seen.add(page)
+            try:
+                stat = os.stat(path)
+                entry = self.entries.get(page)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+                frontmatter = read_frontmatter(path)
+            except OSError:
+                continue
+            self.entries[page] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                                  "frontmatter": frontmatter or {}}
+            read += 1
+        removed = [page for page in self.entries if page not in seen]
+        for page in removed:
+            del self.entries[page]
+        if read or removed:
+            self.save()
+        return read, len(removed)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Value]]]:
+        """(page, frontmatter) for every indexed note, in path order"""
+        for page in sorted(self.entries):
+            yield page, self.entries[page]["frontmatter"]
+
+    def get(self, page: str) -> Optional[Dict[str, Value]]:
+        entry = self.entries.get(page)
+        return entry["frontmatter"] if entry else None
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Journal Layout
+
+Where daily notes live below the Journal folder, as a pattern of date fields:
+
+    {YYYY}/{MM}.{Month}/{YYYY}-{MM}-{DD}.md    Journal/2025/07.July/2025-07-05.md (default)
+    {YYYY}/{YYYY}-{MM}-{DD}.md                 Journal/2025/2025-07-05.md
+    {YYYY}-{MM}-{DD}.md                        Journal/2025-07-05.md
+
+Fields: {YYYY} year, {MM}/{M} month with/without zero padding, {Month}/{Mon}
+English month name/abbreviation, {DD}/{D} day. A layout keeps date -> path and
+path -> date tables, so lookups are dictionary hits with no datetime parsing or
+formatting; load_layout() fills them for every day of each year that has notes
+(and the current one), and a date outside them is computed once and then
+cached. At most PRECOMPUTED_YEARS years, the ones nearest today, are filled,
+so a few misnamed notes (e.g. year 0200 or 9999) cost little.
+load_layout() also detects the pattern an existing Journal tree follows: the
+common layouts and the ones inferred from note paths are tried on a sample of
+the notes and the one most of them match wins.
+
+Usage:
+    layout = load_layout("../Journal")            # Detected pattern, precomputed tables
+    layout.path_for("2025-07-05")                 # "2025/07.July/2025-07-05.md"
+    layout.date_of("2025/07.July/2025-07-05.md")  # "2025-07-05"
+"""
+
+import os
+import re
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
+
+MONTH_NAMES = ("", "January", "February", "March", "April", "May", "June", "July", "August", "September",
+               "October", "November", "December")
+MONTH_ABBREVIATIONS = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MONTH_NUMBERS = {name: number for names in (MONTH_NAMES, MONTH_ABBREVIATIONS)
+                 for number, name in enumerate(names) if name}
+
+DEFAULT_LAYOUT = "{YYYY}/{MM}.{Month}/{YYYY}-{MM}-{DD}.md"
+# Tried by detect_layout() along with the patterns inferred from the notes themselves
+COMMON_LAYOUTS = (
+    DEFAULT_LAYOUT,
+    "{YYYY}/{MM}/{YYYY}-{MM}-{DD}.md",
+    "{YYYY}/{YYYY}-{MM}/{YYYY}-{MM}-{DD}.md",
+    "{YYYY}/{YYYY}-{MM}-{DD}.md",
+    "{YYYY}-{MM}-{DD}.md",
+    "{YYYY}/{MM}/{DD}.md",
+)
+DETECTION_SAMPLE = 1000
+# Years load_layout() precomputes at most; dates in other years are computed on first use
+PRECOMPUTED_YEARS = 50
+
+# Field -> (regex, part of the date)
+FIELDS = {
+    "YYYY": (r"\d{4}", "year"),
+    "MM": (r"\d{2}", "month"),
+    "M": (r"\d{1,2}", "month"),
+    "Month": ("|".join(MONTH_NAMES[1:]), "month"),
+    "Mon": ("|".join(MONTH_ABBREVIATIONS[1:]), "month"),
+    "DD": (r"\d{2}", "day"),
+    "D": (r"\d{1,2}", "day"),
+}
+# Text of the month and day fields, rendered once
+MONTH_FIELDS = [{}] + [{"MM": f"{month:02d}", "M": str(month), "Month": MONTH_NAMES[month],
+                        "Mon": MONTH_ABBREVIATIONS[month]} for month in range(1, 13)]
+DAY_FIELDS = [{}] + [{"DD": f"{day:02d}", "D": str(day)} for day in range(1, 32)]
+FIELD_PATTERN = re.compile(r'\{(\w+)\}')
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+RUN_PATTERN = re.compile(r'\d+|[A-Za-z]+')
+ONE_DAY = timedelta(days=1)
+
+
+def field_values(day: date) -> Dict[str, str]:
+    """Text of every field for a date"""
+    return {"YYYY": f"{day.year:04d}", **MONTH_FIELDS[day.month], **DAY_FIELDS[day.day]}
+
+
+class PathTemplate:
+    """A pattern of date fields, formatted and parsed without datetime calls."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        parts = FIELD_PATTERN.split(pattern)
+        self.literals = parts[0::2]
+        self.fields = parts[1::2]
+        for field in self.fields:
+            if field not in FIELDS:
+                raise ValueError(f"unknown field {{{field}}} in layout {pattern!r}")
+        regex = [re.escape(self.literals[0])]
+        for index, (field, literal) in enumerate(zip(self.fields, self.literals[1:])):
+            # A repeated field must repeat the same text
+            regex.append(f"(?P={field})" if field in self.fields[:index] else f"(?P<{field}>{FIELDS[field][0]})")
+            regex.append(re.escape(literal))
+        self.regex = re.compile(''.join(regex))
+        self.complete = {FIELDS[field][1] for field in self.fields} == {"year", "month", "day"}
+        # printf-style formatting of the fields' text is several times faster than str.format_map
+        self.format_string = '%s'.join(literal.replace('%', '%%') for literal in self.literals)
+        self.field_getter = itemgetter(*self.fields) if self.complete else None
+
+    def format(self, day: date) -> str:
+        return self.render(field_values(day))
+
+    def render(self, values: Dict[str, str]) -> str:
+        """The pattern with each field replaced by its text in values (complete templates only)"""
+        return self.format_string % self.field_getter(values)
+
+    def parse(self, text: str) -> Optional[date]:
+        """The date text was formatted from, or None (also when its fields disagree or it is padded differently)"""
+        match = self.regex.fullmatch(text)
+        if not match:
+            return None
+        values = {}
+        for field, value in match.groupdict().items():
+            number = MONTH_NUMBERS[value] if field in ("Month", "Mon") else int(value)
+            if values.setdefault(FIELDS[field][1], number) != number:
+                return None
+        try:
+            day = date(values["year"], values["month"], values["day"])
+        except (KeyError, ValueError):
+            return None
+        return day if self.format(day) == text else None
+
+
+class JournalLayout:
+    """Date <-> path tables of one layout pattern; paths are relative to the Journal folder."""
+
+    def __init__(self, pattern: str = DEFAULT_LAYOUT):
+        self.pattern = pattern
+        self.template = PathTemplate(pattern)
+        if not self.template.complete:
+            raise ValueError(f"layout {pattern!r} needs a year, a month and a day field")
+        name_template = PathTemplate(pattern.rsplit('/', 1)[-1])
+        # Set when file names alone carry the date, so misplaced notes can still be dated
+        self.name_template = name_template if name_template.complete else None
+        self.days: Dict[str, date] = {}              # ISO date -> date
+        self.paths: Dict[str, str] = {}              # ISO date -> path
+        self.dates: Dict[str, Optional[str]] = {}    # path -> ISO date (None: not a daily note)
+        self.names: Dict[str, Optional[str]] = {}    # file name -> ISO date
+
+    def extend(self, first: date, last: date) -> None:
+        """Precompute every day from first to last (inclusive)"""
+        day = first
+        while day <= last:
+            # Year and month text is rendered once per month
+            month_values = {"YYYY": f"{day.year:04d}", **MONTH_FIELDS[day.month]}
+            month = day.month
+            while day <= last and day.month == month:
+                self.add(day, {**month_values, **DAY_FIELDS[day.day]})
+                if day == last:
+                    return  # Also keeps date.max from overflowing
+                day += ONE_DAY
+
+    def add(self, day: date, values: Optional[Dict[str, str]] = None) -> str:
+        values = values or field_values(day)
+        iso = f"{values['YYYY']}-{values['MM']}-{values['DD']}"
+        path = self.template.render(values)
+        self.days[iso] = day
+        self.paths[iso] = path
+        self.dates[path] = iso
+        if self.name_template is not None:
+            self.names[path.rsplit('/', 1)[-1]] = iso
+        return iso
+
+    def day(self, iso: str) -> Optional[date]:
+        """The date of a YYYY-MM-DD string, or None when it is not a valid one"""
+        day = self.days.get(iso)
+        if day is None:
+            match = ISO_DATE_PATTERN.fullmatch(iso)
+            if not match:
+                return None
+            try:
+                day = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            except ValueError:
+                return None
+            self.add(day)
+        return day
+
+    def path_for(self, iso: str) -> Optional[str]:
+        """Path of the daily note for a YYYY-MM-DD date, or None when the date is invalid"""
+        path = self.paths.get(iso)
+        if path is None and self.day(iso) is not None:
+            path = self.paths[iso]
+        return path
+
+    def date_of(self, path: str) -> Optional[str]:
+        """Date of the daily note at path, or None when no daily note belongs there"""
+        if path in self.dates:
+            return self.dates[path]
+        day = self.template.parse(path)
+        if day is None:
+            self.dates[path] = None
+            return None
+        return self.add(day)
+
+    def note_date(self, path: str) -> Optional[str]:
+        """Date of a daily note by its file name when names carry the date (wherever the note is), else by path"""
+        if self.name_template is None:
+            return self.date_of(path)
+        name = path.rsplit('/', 1)[-1]
+        if name in self.names:
+            return self.names[name]
+        day = self.name_template.parse(name)
+        if day is None:
+            self.names[name] = None
+            return None
+        return self.add(day)
+
+
+def journal_files(journal_path) -> List[str]:
+    """Paths (relative, with /) of the markdown files below a Journal folder, hidden folders skipped"""
+    from vault.blocks import SKIPPED_DIRECTORIES
+
+    journal_path = str(journal_path)
+    files = []
+    for root, dirs, names in os.walk(journal_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRECTORIES and not d.startswith('.'))
+        relative_root = os.path.relpath(root, journal_path)
+        prefix = '' if relative_root == '.' else relative_root.replace(os.sep, '/') + '/'
+        files.extend(prefix + name for name in sorted(names) if name.endswith('.md'))
+    return files
+
+
+def infer_layout(path: str) -> Optional[str]:
+    """Pattern of a note path whose file name holds a YYYY-MM-DD date, e.g. 2025/07.July/2025-07-05.md"""
+    match = ISO_DATE_PATTERN.search(path.rsplit('/', 1)[-1])
+    if not match:
+        return None
+    year, month, day = (int(value) for value in match.groups())
+    if not 1 <= month <= 12 or not 1 <= day <= 31:
+        return None
+    # Where month and day render the same text the month is assumed; the vote in detect_layout() sorts that out
+    fields = {}
+    for value, field in ((f"{year:04d}", "{YYYY}"), (f"{month:02d}", "{MM}"), (f"{day:02d}", "{DD}"),
+                         (str(month), "{M}"), (str(day), "{D}"), (MONTH_NAMES[month], "{Month}"),
+                         (MONTH_ABBREVIATIONS[month], "{Mon}")):
+        fields.setdefault(value, field)
+    pattern = RUN_PATTERN.sub(lambda run: fields.get(run.group(0), run.group(0)), path)
+    # Numbers or month names left over mean the note is not where its date puts it (e.g. August in 07.July)
+    if any(run.isdigit() or run in MONTH_NUMBERS for run in RUN_PATTERN.findall(FIELD_PATTERN.sub('', pattern))):
+        return None
+    return pattern
+
+
+def detect_layout(files: Iterable[str]) -> str:
+    """The layout most of the given Journal paths follow (DEFAULT_LAYOUT when none do)"""
+    files = list(files)
+    sample = files[::max(1, len(files) // DETECTION_SAMPLE)]
+    candidates = list(COMMON_LAYOUTS)
+    for path in sample:
+        pattern = infer_layout(path)
+        if pattern and pattern not in candidates:
+            candidates.append(pattern)
+
+    best, best_count = DEFAULT_LAYOUT, 0
+    for pattern in candidates:
+        try:
+            template = PathTemplate(pattern)
+        except (ValueError, re.error):
+            continue
+        if not template.complete:
+            continue
+        count = sum(1 for path in sample if template.parse(path))
+        if count > best_count:
+            best, best_count = pattern, count
+    return best
+
+
+def load_layout(journal_path, pattern: Optional[str] = None, files: Optional[List[str]] = None) -> JournalLayout:
+    """Layout of a Journal folder (detected unless pattern is given), precomputed over the years of its notes"""
+    if files is None:
+        files = journal_files(journal_path) if os.path.isdir(journal_path) else []
+    layout = JournalLayout(pattern or detect_layout(files))
+    # Only each note's year is needed; the notes' dates are then table hits
+    matches = filter(None, map(layout.template.regex.fullmatch, files))
+    this_year = date.today().year
+    years = {int(match.group("YYYY")) for match in matches} | {this_year}
+    years.discard(0)  # Not a valid year; such names are no daily notes
+    for year in sorted(sorted(years, key=lambda year: abs(year - this_year))[:PRECOMPUTED_YEARS]):
+        layout.extend(date(year, 1, 1), date(year, 12, 31))
+    return layout
+
+
+def add_layout_argument(parser) -> None:
+    def journal_layout(value: str) -> str:
+        try:
+            JournalLayout(value)
+        except ValueError as e:
+            import argparse
+            raise argparse.ArgumentTypeError(str(e))
+        return value
+
+    parser.add_argument("--journal-layout", type=journal_layout, metavar="PATTERN",
+                        help=f"Daily note path under Journal/, e.g. '{DEFAULT_LAYOUT}' "
+                             f"(default: detected from the existing notes)")
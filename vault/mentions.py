@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Mention Index
+
+Inverted index from `[[wikilink]]` target to the blocks that link to it, so a
+note's mentions can be looked up without scanning every journal page. Each
+entry is (source page, block line, block type), with blocks as produced by
+vault.blocks; a link inside a todo under a header is listed for both blocks,
+just as the mentions processor sees it in both.
+
+Date markers are kept apart from the links: every bare `[[YYYY-MM-DD]]` in a
+note's text (frontmatter included), the same matches vault.sections splits
+activity files on. `[[2025-07-04|alias]]` is a mention of the date but not a
+marker.
+
+The index is a SQLite file in the cache directory (one per vault). update()
+re-parses only the notes whose mtime or size changed and drops deleted notes.
+
+Usage:
+    index = MentionIndex("..")
+    index.update()
+    index.query("Activities/Shopping")   # [(page, line, block_type), ...]
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from vault import vault_cache_path
+from vault.blocks import Block, iter_markdown_files, parse_note
+from vault.sections import DATE_MARKER_BYTES_PATTERN, LINK_OPENING
+
+INDEX_VERSION = 2
+
+# [[Target]], [[Target|Alias]], [[Target#Heading]]; the target is group 1
+LINK_PATTERN = re.compile(r'\[\[([^\]|#]*)(?:#[^\]|]*)?(?:\|[^\]]*)?\]\]')
+
+
+def default_index_path(vault_path) -> Path:
+    """Index file for a vault, keyed by the vault's absolute path"""
+    return vault_cache_path(vault_path, 'mentions', '.sqlite3')
+
+
+def normalize_target(target: str) -> str:
+    """Link target as indexed: surrounding spaces and a .md suffix removed"""
+    target = target.strip()
+    return target[:-3] if target.endswith('.md') else target
+
+
+def decode_note(raw: bytes) -> str:
+    """Note text as a text-mode read would give it (universal newlines)"""
+    content = raw.decode('utf-8', errors='replace')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def extract_mentions(page: str, content: str) -> List[Tuple[str, str, int, str]]:
+    """(target, name, line, block_type) for every distinct link target in each block of a note"""
+    return block_mentions(parse_note(page, content))
+
+
+def block_mentions(blocks: Iterable[Block]) -> List[Tuple[str, str, int, str]]:
+    """(target, name, line, block_type) for every distinct link target in each of the given blocks"""
+    mentions = []
+    for block in blocks:
+        if '[[' not in block.data:
+            continue
+        for target in {normalize_target(t) for t in LINK_PATTERN.findall(block.data)}:
+            if target:
+                mentions.append((target, target.rsplit('/', 1)[-1], block.line, block.block_type))
+    return mentions
+
+
+class MentionIndex:
+    """SQLite-backed inverted index of the vault's wikilinks."""
+
+    def __init__(self, vault_path="..", path=None):
+        import sqlite3
+
+        self.vault_path = Path(vault_path).resolve()
+        self.path = Path(path) if path else default_index_path(self.vault_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            self.connection.executescript(
+                "DROP TABLE IF EXISTS pages; DROP TABLE IF EXISTS mentions; DROP TABLE IF EXISTS markers;"
+                f"PRAGMA user_version = {INDEX_VERSION};"
+            )
+        self.connection.executescript(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "page TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS mentions ("
+            "target TEXT NOT NULL COLLATE NOCASE, name TEXT NOT NULL COLLATE NOCASE, "
+            "page TEXT NOT NULL, line INTEGER NOT NULL, block_type TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS mentions_target ON mentions(target);"
+            "CREATE INDEX IF NOT EXISTS mentions_name ON mentions(name);"
+            "CREATE INDEX IF NOT EXISTS mentions_page ON mentions(page);"
+            "CREATE TABLE IF NOT EXISTS markers (page TEXT NOT NULL, date TEXT NOT NULL, PRIMARY KEY (page, date));"
+        )
+
+    def update(self, folders: Optional[Iterable[str]] = None) -> Tuple[int, int]:
+        """Bring the index up to date with the vault; returns (notes parsed, notes removed)"""
+        folders = list(folders) if folders else None
+        known = {page: (mtime_ns, size) for page, mtime_ns, size
+                 in self.connection.execute("SELECT page, mtime_ns, size FROM pages")}
+        if folders:
+            prefixes = tuple(folder.rstrip('/') + '/' for folder in folders)
+            known = {page: state for page, state in known.items() if page.startswith(prefixes)}
+
+        changed = []
+        seen = set()
+        for path in iter_markdown_files(self.vault_path, folders):
+            page = path.relative_to(self.vault_path).as_posix()
+            seen.add(page)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if known.get(page) != (stat.st_mtime_ns, stat.st_size):
+                changed.append((path, page, stat))
+        removed = [page for page in known if page not in seen]
+
+        if not changed and not removed:
+            return 0, 0
+
+        with self.connection:
+            self.connection.execute("BEGIN")
+            for page in removed:
+                self.connection.execute("DELETE FROM mentions WHERE page = ?", (page,))
+                self.connection.execute("DELETE FROM markers WHERE page = ?", (page,))
+                self.connection.execute("DELETE FROM pages WHERE page = ?", (page,))
+            for path, page, stat in changed:
+                try:
+                    with open(path, 'rb') as f:
+                        raw = f.read()
+                except OSError:
+                    continue
+                self.connection.execute("DELETE FROM mentions WHERE page = ?", (page,))
+                self.connection.execute("DELETE FROM markers WHERE page = ?", (page,))
+                # A note without [[ has no mentions or markers, so it is neither decoded nor parsed
+                if LINK_OPENING in raw:
+                    self.connection.executemany(
+                        "INSERT INTO mentions (target, name, page, line, block_type) VALUES (?, ?, ?, ?, ?)",
+                        [(target, name, page, line, block_type) for target, name, line, block_type
+                         in extract_mentions(page, decode_note(raw))]
+                    )
+                    self.connection.executemany(
+                        "INSERT OR IGNORE INTO markers (page, date) VALUES (?, ?)",
+                        [(page, date.decode('ascii')) for date in DATE_MARKER_BYTES_PATTERN.findall(raw)]
+                    )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO pages (page, mtime_ns, size) VALUES (?, ?, ?)",
+                    (page, stat.st_mtime_ns, stat.st_size)
+                )
+        return len(changed), len(removed)
+
+    def rebuild(self, folders: Optional[Iterable[str]] = None) -> Tuple[int, int]:
+        """Drop everything and index the vault from scratch"""
+        self.connection.executescript("DELETE FROM mentions; DELETE FROM markers; DELETE FROM pages;")
+        return self.update(folders)
+
+    def query(self, target: str, block_types: Optional[Iterable[str]] = None) -> List[Tuple[str, int, str]]:
+        """Blocks linking to target; a bare name also matches links with a folder ([[Foo]] ~ [[Activities/Foo]])"""
+        target = normalize_target(target)
+        column = "target" if '/' in target else "name"
+        sql = f"SELECT DISTINCT page, line, block_type FROM mentions WHERE {column} = ?"
+        params = [target]
+        if block_types:
+            block_types = list(block_types)
+            sql += f" AND block_type IN ({', '.join('?' * len(block_types))})"
+            params.extend(block_types)
+        return self.connection.execute(sql + " ORDER BY page, line", params).fetchall()
+
+    def page_targets(self, page: str) -> List[str]:
+        """Distinct link targets found in one page"""
+        return [row[0] for row in self.connection.execute(
+            "SELECT DISTINCT target FROM mentions WHERE page = ? ORDER BY target", (page,))]
+
+    def date_markers(self, folder: str = "Activities") -> Dict[str, List[str]]:
+        """[[YYYY-MM-DD]] markers per page under folder, dates sorted"""
+        markers = {}
+        for page, date in self.connection.execute(
+                "SELECT page, date FROM markers WHERE page LIKE ? ORDER BY page, date", (folder.rstrip('/') + '/%',)):
+            markers.setdefault(page, []).append(date)
+        return markers
+
+    def top_targets(self, limit: int = 20) -> List[Tuple[str, int]]:
+        """Most linked targets with their number of linking pages"""
+        return self.connection.execute(
+            "SELECT target, COUNT(DISTINCT page) AS pages FROM mentions GROUP BY target "
+            "ORDER BY pages DESC, target LIMIT ?", (limit,)).fetchall()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pages": self.connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0],
+            "mentions": self.connection.execute("SELECT COUNT(*) FROM mentions").fetchone()[0],
+            "targets": self.connection.execute("SELECT COUNT(DISTINCT target) FROM mentions").fetchone()[0],
+        }
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Todo Rollover
+
+Python port of the rollover rules documented for `todoRollover.js`, applied to
+a range of daily notes in one pass:
+
+- incomplete standalone todos roll over to each later daily note
+- activity todos stay where they are: todos with any [[link]] and todos inside
+  a `##### [[Activities/...]]` header block
+- a todo already in the target note (open or done) is not added again
+- rolled todos keep their line as written (indent, `>` callout) and go right
+  after the note's last `---` separator, or at the end
+
+As in the daily rollover, each note receives the open standalone todos of the
+note before it, counting the todos that note received itself, so todos chain
+through the range. A todo checked off or deleted in a note stops rolling over.
+Only the last note before the range and the notes in it are read, each parsed
+once and written at most once: backed up first, then replaced in one rename.
+Notes are dated through the Journal layout's tables (vault/layout.py).
+
+Usage:
+    rollover = TodoRollover("..", date(2025, 7, 1), date(2025, 7, 31))
+    summary = rollover.run()
+"""
+
+import re
+import shutil
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from vault.blocks import (ACTIVITY_HEADER_PATTERN, ENGINE_ROOT, FENCE_PATTERN, SEPARATOR_PATTERN, closes_fence,
+                          frontmatter_end, parse_note)
+from vault.frontmatter import write_atomic
+from vault.layout import journal_files, load_layout
+
+CHECKBOX_PATTERN = re.compile(r'^\s*(?:>\s*)?- \[[ xX]\]\s*')
+
+
+def todo_key(line: str) -> str:
+    """Identity of a todo for deduplication: its text without checkbox and with spaces collapsed"""
+    return ' '.join(CHECKBOX_PATTERN.sub('', line, count=1).split())
+
+
+def classify_todos(blocks) -> Tuple[List[str], set, set]:
+    """Split a note's todo blocks into (standalone open todo lines, done keys, keys of every todo)"""
+    activity_ranges = [(block.line, block.end_line()) for block in blocks
+                       if block.block_type == "header" and ACTIVITY_HEADER_PATTERN.match(block.data)]
+    standalone = []
+    done_keys = set()
+    all_keys = set()
+    for block in blocks:
+        if block.block_type == "done":
+            key = todo_key(block.data)
+            done_keys.add(key)
+            all_keys.add(key)
+        elif block.block_type == "todo":
+            all_keys.add(todo_key(block.data))
+            if '[[' in block.data or any(start < block.line <= end for start, end in activity_ranges):
+                continue
+            standalone.append(block.data)
+    return standalone, done_keys, all_keys
+
+
+def insert_todos(content: str, todo_lines: List[str]) -> str:
+    """Insert todo lines after the note's last --- separator (outside frontmatter and code), or at the end"""
+    lines = content.split('\n')
+    insert_at = None
+    fence = None
+    for index in range(frontmatter_end(lines), len(lines)):
+        line = lines[index]
+        fence_match = FENCE_PATTERN.match(line) if line.lstrip()[:1] in ('`', '~') else None
+        if fence is not None:
+            if fence_match and closes_fence(fence, fence_match):
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+        elif SEPARATOR_PATTERN.match(line):
+            insert_at = index + 1
+    if insert_at is None:
+        while lines and not lines[-1].strip():
+            lines.pop()
+        return '\n'.join(lines + todo_lines) + '\n'
+    return '\n'.join(lines[:insert_at] + todo_lines + lines[insert_at:])
+
+
+class TodoRollover:
+    """Rolls standalone todos forward through every daily note from start to end."""
+
+    def __init__(self, vault_path="..", start: Optional[date] = None, end: Optional[date] = None,
+                 lookback_days: Optional[int] = None, dry_run: bool = True, journal_layout: Optional[str] = None,
+                 backup_dir: Optional[Path] = None):
+        self.vault_path = Path(vault_path).resolve()
+        self.end = end or date.today()
+        self.start = start or self.end
+        # The note before start only contributes todos when it is at most this many days older (None: any age)
+        self.lookback_days = lookback_days
+        self.dry_run = dry_run
+        # Daily note path pattern (None: detected from the Journal folder)
+        self.journal_layout = journal_layout
+        # Copies of the notes as they were before being written (default: a timestamped folder in Engine/)
+        self.backup_dir = Path(backup_dir) if backup_dir else None
+        self.backed_up = 0
+
+    def iter_daily_notes(self) -> Iterator[Tuple[date, Path]]:
+        """Daily notes up to the end date, oldest first"""
+        first = self.start - timedelta(days=self.lookback_days) if self.lookback_days is not None else date.min
+        journal_path = self.vault_path / "Journal"
+        files = journal_files(journal_path)
+        layout = load_layout(journal_path, self.journal_layout, files)
+        notes = []
+        for relative_path in files:
+            # Dated by file name where the layout's names carry the date, so misfiled notes still count
+            iso = layout.note_date(relative_path)
+            if iso is None:
+                continue
+            note_date = layout.days[iso]
+            if first <= note_date <= self.end:
+                notes.append((note_date, journal_path / relative_path))
+        return iter(sorted(notes))
+
+    def backup_note(self, path: Path) -> None:
+        """Copy a note into the backup folder, keeping its vault-relative path (raises OSError)"""
+        if self.backup_dir is None:
+            self.backup_dir = ENGINE_ROOT / f"rollover_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        backup_path = self.backup_dir / path.relative_to(self.vault_path)
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, backup_path)
+        self.backed_up += 1
+
+    def run(self) -> Dict[str, object]:
+        """Roll todos over into every existing daily note in the range; returns a summary"""
+        notes = list(self.iter_daily_notes())
+        # Todos reach the first note in the range only from the last note before it
+        first = max(bisect_left(notes, (self.start,)) - 1, 0)
+        # Open standalone todos of the previous note: key -> line as written
+        carried: Dict[str, str] = {}
+        updated = {}
+        target_dates = set()
+
+        for note_date, path in notes[first:]:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            page = path.relative_to(self.vault_path).as_posix()
+            standalone, done_keys, all_keys = classify_todos(parse_note(page, content))
+
+            added = []
+            if note_date >= self.start:
+                target_dates.add(note_date)
+                added = [line for key, line in carried.items() if key not in all_keys]
+                if added:
+                    updated[page] = added
+                    if not self.dry_run:
+                        self.backup_note(path)
+                        write_atomic(path, insert_todos(content, added))
+
+            carried = {}
+            for line in standalone + added:
+                key = todo_key(line)
+                if key and key not in done_keys:
+                    carried.setdefault(key, line)
+
+        days = (self.end - self.start).days + 1
+        return {
+            "notes_in_range": len(target_dates),
+            "missing_notes": max(days - len(target_dates), 0),
+            "updated_notes": updated,
+            "todos_added": sum(len(todos) for todos in updated.values()),
+            "open_todos": len(carried),
+            "backup_dir": self.backup_dir if self.backed_up else None,
+        }
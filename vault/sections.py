@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Date Sections
+
+Streams the `[[YYYY-MM-DD]]` sections of an activity file. The file is
+memory-mapped (or read, when small) and scanned with finditer, and each section is handed out as an
+iterator over its lines, decoded only when the section is reached; sections
+outside a date filter are skipped without decoding at all. Memory stays
+bounded by one section however long the activity log grows.
+
+Sections match `DATE_MARKER_PATTERN.split(content)`: a section runs from the
+end of its marker to the start of the next marker, and its lines are what
+`section.split('\\n')` would give.
+
+Usage:
+    for date, lines in iter_date_sections(path, start="2025-07-01"):
+        for line in lines:
+            ...
+"""
+
+import os
+import re
+import mmap
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, Union
+
+from vault.blocks import DATE_MARKER_PATTERN
+
+DATE_MARKER_BYTES_PATTERN = re.compile(DATE_MARKER_PATTERN.pattern.encode('ascii'))
+# Every date marker and wikilink contains this
+LINK_OPENING = b'[['
+# Files below this size are read into memory; mapping them is slower than reading
+MMAP_THRESHOLD = 256 * 1024
+
+
+@contextmanager
+def file_buffer(path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Read-only bytes of a file: memory-mapped when large, read at once when small (mapping costs more)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def has_date_markers(path) -> bool:
+    """Whether a file contains a [[YYYY-MM-DD]] marker, found without decoding it"""
+    with file_buffer(path) as buffer:
+        # Nearly every file without a marker has no [[ at all, which find rules out at memchr speed
+        if buffer.find(LINK_OPENING) == -1:
+            return False
+        found = DATE_MARKER_BYTES_PATTERN.search(buffer) is not None
+    return found
+
+
+def iter_section_lines(buffer, start: int, end: int) -> Iterator[str]:
+    """Lines of buffer[start:end]; only this section is decoded"""
+    return iter(buffer[start:end].decode('utf-8', errors='replace').split('\n'))
+
+
+def iter_date_sections(path, start: Optional[str] = None,
+                       end: Optional[str] = None) -> Iterator[Tuple[str, Iterator[str]]]:
+    """(date, line iterator) per date marker in file order, for dates within [start, end] (YYYY-MM-DD)"""
+    with file_buffer(path) as buffer:
+        matches = DATE_MARKER_BYTES_PATTERN.finditer(buffer)
+        try:
+            current = next(matches, None)
+            while current is not None:
+                following = next(matches, None)
+                date = current.group(1).decode('ascii')
+                if (start is None or date >= start) and (end is None or date <= end):
+                    section_end = following.start() if following is not None else len(buffer)
+                    yield date, iter_section_lines(buffer, current.end(), section_end)
+                current = following
+        finally:
+            # The scanner and match objects hold exports of the buffer, which must be gone before it closes
+            matches = current = following = None
+
+
+def section_dates(path) -> List[str]:
+    """Every marked date in a file, in file order (without decoding any section)"""
+    with file_buffer(path) as buffer:
+        return [match.group(1).decode('ascii') for match in DATE_MARKER_BYTES_PATTERN.finditer(buffer)]
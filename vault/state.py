@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+In-Memory Vault State
+
+Every note of a vault parsed once and kept in memory: its blocks, frontmatter,
+[[wikilink]] mentions, date markers and the size and structure counters of the
+validator's deep scan. refresh() re-parses the notes whose mtime or size
+changed (and drops deleted ones) by walking the vault; update_paths() does the
+same for only the paths a file watcher reported, so the state of a vault that
+is being edited stays current at the cost of re-parsing the edited notes.
+
+Answers match the persistent indexes: date_markers() and mentions() give what
+MentionIndex.date_markers() and MentionIndex.query() give, frontmatter() what
+FrontmatterIndex holds. Memory use is a small multiple of the vault's text.
+
+Usage:
+    state = VaultState("..")
+    state.refresh()
+    state.date_markers("Activities")    # {page: [dates]}
+"""
+
+import os
+import re
+import string
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from vault.blocks import (BLOCK_TYPES, DATE_MARKER_PATTERN, ENGINE_ROOT, SKIPPED_DIRECTORIES, Block,
+                          count_blocks, iter_markdown_files, parse_note)
+from vault.frontmatter import Value, parse_frontmatter, split_frontmatter
+from vault.mentions import block_mentions, decode_note, normalize_target
+
+# Links never span lines, so the deep scan matches them line by line (stream_note_stats)
+ACTIVITY_LINK_PATTERN = re.compile(r'\[\[Activities/([^\]|#\n]+?)(?:\.md)?(?:#[^\]|\n]*)?(?:\|[^\]\n]*)?\]\]')
+# Link targets compare like SQLite's NOCASE collation in MentionIndex: only ASCII letters are folded
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def note_stats(content: str, blocks: Iterable[Block]) -> dict:
+    """Size and structure counters of one note, as reported by the validator's deep scan"""
+    counts = dict.fromkeys(BLOCK_TYPES, 0)
+    for block in blocks:
+        counts[block.block_type] += 1
+    return {
+        "lines": content.count('\n') + (1 if content and not content.endswith('\n') else 0),
+        "todos": counts["todo"] + counts["done"],
+        "blocks": counts,
+        "date_markers": len(DATE_MARKER_PATTERN.findall(content)),
+        "activity_links": ACTIVITY_LINK_PATTERN.findall(content)
+    }
+
+
+def stream_note_stats(lines: Iterable[str]) -> dict:
+    """note_stats() of a note read line by line (e.g. from a file opened with newline='\\n')"""
+    stats = {"lines": 0, "date_markers": 0, "activity_links": []}
+
+    def tap():
+        for line in lines:
+            stats["lines"] += 1
+            if '[[' in line:
+                stats["date_markers"] += len(DATE_MARKER_PATTERN.findall(line))
+                stats["activity_links"].extend(ACTIVITY_LINK_PATTERN.findall(line))
+            # parse_note() splits on \n after folding \r\n; a lone \r stays part of the line
+            if line.endswith('\n'):
+                line = line[:-2] if line.endswith('\r\n') else line[:-1]
+            yield line
+
+    counts = count_blocks(tap())
+    return {
+        "lines": stats["lines"],
+        "todos": counts["todo"] + counts["done"],
+        "blocks": counts,
+        "date_markers": stats["date_markers"],
+        "activity_links": stats["activity_links"]
+    }
+
+
+class NoteState:
+    """One parsed note."""
+
+    __slots__ = ("page", "mtime_ns", "size", "blocks", "frontmatter", "mentions", "markers", "stats")
+
+    def __init__(self, page: str, mtime_ns: int, size: int, content: str):
+        self.page = page
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.blocks = parse_note(page, content, mtime_ns // 1_000_000)
+        text, _ = split_frontmatter(content)
+        self.frontmatter: Optional[Dict[str, Value]] = parse_frontmatter(text) if text is not None else None
+        # (target, name, line, block_type), as stored by MentionIndex
+        self.mentions = block_mentions(self.blocks) if '[[' in content else []
+        # Bare [[YYYY-MM-DD]] markers anywhere in the text, as MentionIndex stores them
+        self.markers = sorted(set(DATE_MARKER_PATTERN.findall(content))) if '[[' in content else []
+        self.stats = dict(bytes=size, **note_stats(content, self.blocks))
+
+
+class VaultState:
+    """Parsed notes of one vault, kept current by refresh() or update_paths()."""
+
+    def __init__(self, vault_path=".."):
+        self.vault_path = Path(vault_path).resolve()
+        self.notes: Dict[str, NoteState] = {}
+        # Case-folded link target and name -> pages linking to it
+        self.targets: Dict[str, Set[str]] = {}
+        self.names: Dict[str, Set[str]] = {}
+
+    def page_of(self, path: Path) -> Optional[str]:
+        """Vault-relative page of a path, or None when the path is outside the indexed part of the vault"""
+        try:
+            relative = path.relative_to(self.vault_path)
+        except ValueError:
+            return None
+        if path == ENGINE_ROOT or ENGINE_ROOT in path.parents:
+            return None
+        if any(part in SKIPPED_DIRECTORIES or part.startswith('.') for part in relative.parts[:-1]):
+            return None
+        return relative.as_posix()
+
+    def skip_directory(self, directory: Path) -> bool:
+        """Whether a directory's notes are left out, as iter_markdown_files() leaves them out"""
+        return (directory.name in SKIPPED_DIRECTORIES or directory.name.startswith('.')
+                or directory == ENGINE_ROOT)
+
+    def refresh(self) -> Tuple[int, int]:
+        """Re-parse notes changed since they were parsed and drop deleted ones; returns (parsed, removed)"""
+        seen = set()
+        parsed = 0
+        for path in iter_markdown_files(self.vault_path):
+            page = path.relative_to(self.vault_path).as_posix()
+            seen.add(page)
+            parsed += self.update_note(path, page)
+        removed = [page for page in self.notes if page not in seen]
+        for page in removed:
+            self.remove_note(page)
+        return parsed, len(removed)
+
+    def update_paths(self, paths: Iterable[Path]) -> Tuple[int, int]:
+        """Bring the notes at (or below) the given changed paths up to date; returns (parsed, removed)"""
+        parsed = removed = 0
+        for path in paths:
+            page = self.page_of(path)
+            if page is None:
+                continue
+            if path.is_dir():
+                # A directory created or moved into the vault: index its notes
+                if not self.skip_directory(path):
+                    for note_path in iter_markdown_files(path):
+                        parsed += self.update_note(note_path, note_path.relative_to(self.vault_path).as_posix())
+            elif page.endswith('.md') and path.exists():
+                parsed += self.update_note(path, page)
+            elif page in self.notes:
+                self.remove_note(page)
+                removed += 1
+            elif not page.endswith('.md'):
+                # A directory deleted or moved away: drop the notes that were below it
+                prefix = page + '/'
+                for gone in [p for p in self.notes if p.startswith(prefix)]:
+                    self.remove_note(gone)
+                    removed += 1
+        return parsed, removed
+
+    def update_note(self, path: Path, page: str) -> int:
+        """Parse one note if its mtime or size changed; returns 1 when it was parsed"""
+        try:
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                note = self.notes.get(page)
+                if note and note.mtime_ns == stat.st_mtime_ns and note.size == stat.st_size:
+                    return 0
+                content = decode_note(f.read())
+        except OSError:
+            if page in self.notes:
+                self.remove_note(page)
+            return 0
+        if page in self.notes:
+            self.remove_note(page)
+        note = NoteState(page, stat.st_mtime_ns, stat.st_size, content)
+        self.notes[page] = note
+        for target, name, _, _ in note.mentions:
+            self.targets.setdefault(target.translate(ASCII_LOWER), set()).add(page)
+            self.names.setdefault(name.translate(ASCII_LOWER), set()).add(page)
+        return 1
+
+    def remove_note(self, page: str) -> None:
+        note = self.notes.pop(page)
+        for target, name, _, _ in note.mentions:
+            for mapping, key in ((self.targets, target.translate(ASCII_LOWER)),
+                                 (self.names, name.translate(ASCII_LOWER))):
+                pages = mapping.get(key)
+                if pages is not None:
+                    pages.discard(page)
+                    if not pages:
+                        del mapping[key]
+
+    def pages(self, folder: Optional[str] = None) -> List[str]:
+        """Indexed pages, in path order, optionally only those under folder"""
+        if not folder:
+            return sorted(self.notes)
+        prefix = folder.strip('/') + '/'
+        return sorted(page for page in self.notes if page.startswith(prefix))
+
+    def date_markers(self, folder: str = "Activities") -> Dict[str, List[str]]:
+        """[[YYYY-MM-DD]] targets per page under folder, dates sorted"""
+        markers = {}
+        for page in self.pages(folder):
+            dates = self.notes[page].markers
+            if dates:
+                markers[page] = dates
+        return markers
+
+    def mentions(self, target: str, block_types: Optional[Iterable[str]] = None) -> List[Tuple[str, int, str]]:
+        """Blocks linking to target; a bare name also matches links with a folder ([[Foo]] ~ [[Activities/Foo]])"""
+        target = normalize_target(target)
+        by_name = '/' not in target
+        key = target.translate(ASCII_LOWER)
+        block_types = set(block_types) if block_types else None
+        found = set()
+        for page in (self.names if by_name else self.targets).get(key, ()):
+            for mention_target, name, line, block_type in self.notes[page].mentions:
+                if (name if by_name else mention_target).translate(ASCII_LOWER) == key and (
+                        block_types is None or block_type in block_types):
+                    found.add((page, line, block_type))
+        return sorted(found)
+
+    def frontmatter(self, folder: Optional[str] = None) -> Dict[str, Dict[str, Value]]:
+        """Frontmatter per page (empty for notes without one), as FrontmatterIndex keeps it"""
+        return {page: self.notes[page].frontmatter or {} for page in self.pages(folder)}
+
+    def note_stats(self, folder: Optional[str] = None) -> Dict[str, dict]:
+        """Deep scan counters per page"""
+        return {page: self.notes[page].stats for page in self.pages(folder)}
+
+    def blocks(self, page: str) -> Optional[List[dict]]:
+        """Blocks of one page as the JavaScript parser's objects, with their line numbers"""
+        note = self.notes.get(page)
+        if note is None:
+            return None
+        return [dict(block.to_dict(), line=block.line) for block in note.blocks]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "notes": len(self.notes),
+            "bytes": sum(note.size for note in self.notes.values()),
+            "blocks": sum(len(note.blocks) for note in self.notes.values()),
+            "mentions": sum(len(note.mentions) for note in self.notes.values()),
+            "targets": len(self.targets),
+        }
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Persistent WeasyPrint Rendering
+
+A cold `weasyprint.HTML(string=...).write_pdf()` call pays again for font
+discovery, for parsing the converter stylesheet (including all codehilite
+rules) and for layout setup. This module keeps that state warm:
+
+- WeasyPrintRenderer holds one FontConfiguration and one preparsed CSS object
+  and reuses them for every document rendered in the current process.
+- RenderWorker runs a renderer in a long-lived child process that accepts jobs
+  over a multiprocessing queue, so a caller converting many manuals pays the
+  setup cost once and keeps WeasyPrint's memory out of its own process.
+
+Every job reports per-stage timings (parse, layout, write) in milliseconds.
+
+Requirements: pip install weasyprint
+"""
+
+import time
+import queue
+import itertools
+from typing import Dict, Optional, Tuple
+
+# Per-process renderer cache keyed by stylesheet text
+_renderers: Dict[str, 'WeasyPrintRenderer'] = {}
+
+
+class WeasyPrintRenderer:
+    def __init__(self, css_text: str):
+        import weasyprint
+        try:
+            from weasyprint.text.fonts import FontConfiguration
+        except ImportError:  # WeasyPrint < 53
+            from weasyprint.fonts import FontConfiguration
+
+        self.weasyprint = weasyprint
+        start_time = time.perf_counter()
+        self.font_config = FontConfiguration()
+        self.stylesheet = weasyprint.CSS(string=css_text, font_config=self.font_config)
+        self.setup_ms = (time.perf_counter() - start_time) * 1000
+        self.jobs_rendered = 0
+
+    def render(self, html_content: str, output_path: str) -> Dict[str, float]:
+        """Render HTML (without inline stylesheet) to a PDF file and return stage timings in ms"""
+        timings = {}
+        start_time = time.perf_counter()
+        html = self.weasyprint.HTML(string=html_content)
+        timings['parse_ms'] = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        document = html.render(stylesheets=[self.stylesheet], font_config=self.font_config)
+        timings['layout_ms'] = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        document.write_pdf(output_path)
+        timings['write_ms'] = (time.perf_counter() - start_time) * 1000
+
+        timings['pages'] = len(document.pages)
+        timings['total_ms'] = timings['parse_ms'] + timings['layout_ms'] + timings['write_ms']
+        self.jobs_rendered += 1
+        return timings
+
+
+def get_renderer(css_text: str) -> WeasyPrintRenderer:
+    """Return the warm renderer for this stylesheet, creating it on first use"""
+    renderer = _renderers.get(css_text)
+    if renderer is None:
+        renderer = WeasyPrintRenderer(css_text)
+        _renderers[css_text] = renderer
+    return renderer
+
+
+def render_worker_main(job_queue, result_queue, css_text: str) -> None:
+    """Child process loop: render jobs until a None sentinel arrives"""
+    try:
+        renderer = WeasyPrintRenderer(css_text)
+    except Exception as e:
+        result_queue.put((None, False, {}, f"Renderer setup failed: {e}"))
+        return
+    result_queue.put((None, True, {'setup_ms': renderer.setup_ms}, None))
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+        job_id, html_content, output_path = job
+        try:
+            timings = renderer.render(html_content, output_path)
+            result_queue.put((job_id, True, timings, None))
+        except Exception as e:
+            result_queue.put((job_id, False, {}, str(e)))
+
+
+class RenderWorker:
+    """Long-lived WeasyPrint process that renders jobs from a queue."""
+
+    def __init__(self, css_text: str):
+        import multiprocessing
+
+        context = multiprocessing.get_context('spawn')
+        self.job_queue = context.Queue()
+        self.result_queue = context.Queue()
+        self.process = context.Process(target=render_worker_main,
+                                       args=(self.job_queue, self.result_queue, css_text),
+                                       daemon=True)
+        self.job_ids = itertools.count(1)
+        self.job_timings = []
+        self.setup_ms = None
+
+    def start(self) -> bool:
+        """Start the worker and wait until its fonts and stylesheet are ready"""
+        self.process.start()
+        _, success, timings, error = self.wait_for_result()
+        if not success:
+            print(f"❌ WeasyPrint render worker failed to start: {error}")
+            self.process.join()
+            return False
+        self.setup_ms = timings['setup_ms']
+        print(f"🔥 WeasyPrint render worker ready (setup {self.setup_ms:.0f} ms)")
+        return True
+
+    def wait_for_result(self) -> tuple:
+        """Wait for the next result, failing if the worker process dies"""
+        while True:
+            try:
+                return self.result_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not self.process.is_alive():
+                    return None, False, {}, "render worker exited unexpectedly"
+
+    def render(self, html_content: str, output_path: str) -> Tuple[bool, Dict[str, float], Optional[str]]:
+        """Render one document and wait for the result"""
+        job_id = next(self.job_ids)
+        self.job_queue.put((job_id, html_content, output_path))
+        while True:
+            result_id, success, timings, error = self.wait_for_result()
+            if result_id == job_id or not self.process.is_alive():
+                break
+        if success:
+            self.job_timings.append(dict(timings, output=output_path))
+        return success, timings, error
+
+    def close(self) -> None:
+        """Stop the worker process"""
+        if self.process.is_alive():
+            self.job_queue.put(None)
+            self.process.join(timeout=10)
+        if self.process.is_alive():
+            self.process.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()